@@ -11,11 +11,12 @@ from uuid import UUID
 
 import numpy as np
 from geoh5py.objects import Curve, Grid2D, Points, Surface
+from geoh5py.workspace import Workspace
 
 from geoapps.base.selection import ObjectDataSelection
 from geoapps.shared_utils.utils import get_contours, rotate_xyz
 from geoapps.utils import warn_module_not_found
-from geoapps.utils.plotting import plot_plan_data_selection
+from geoapps.utils.plotting import FilterCache, plot_plan_data_selection
 
 with warn_module_not_found():
     from matplotlib import pyplot as plt
@@ -54,6 +55,7 @@ class PlotSelection2D(ObjectDataSelection):
         self.indices = None
         self.highlight_selection = None
         self.collections = []
+        self._filter_cache = FilterCache()
         self._window_azimuth = FloatSlider(
             min=-90,
             max=90,
@@ -173,6 +175,13 @@ class PlotSelection2D(ObjectDataSelection):
 
         return self._main
 
+    @property
+    def filter_cache(self) -> FilterCache:
+        """
+        Cache of window and resolution masks re-used between plot updates.
+        """
+        return self._filter_cache
+
     @property
     def window_azimuth(self):
         """
@@ -338,12 +347,18 @@ class PlotSelection2D(ObjectDataSelection):
                     "highlight_selection": self.highlight_selection,
                     "collections": self.collections,
                     "colorbar": colorbar,
+                    "method": "grid",
+                    "filter_cache": self.filter_cache,
                 },
             )
             plt.show()
             self.indices = ind_filter
             self.data_count.value = f"Data Count: {ind_filter.sum()}"
 
+    def base_workspace_changes(self, workspace: Workspace):
+        self.filter_cache.clear()
+        super().base_workspace_changes(workspace)
+
     def set_bounding_box(self, _):
         # Fetch vertices in the project
         lim_x = [1e8, -1e8]
@@ -7,6 +7,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from geoh5py.objects import DrapeModel, Octree
 from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
@@ -18,6 +20,7 @@ def running_mean(
 ) -> np.array:
     """
     Compute a running mean of an array over a defined width.
+    For multi-dimensional arrays, the mean is computed along the last axis.
 
     :param values: Input values to compute the running mean over
     :param width: Number of neighboring values to be used
@@ -25,28 +28,31 @@ def running_mean(
 
     :return mean_values: Averaged array values of shape(values, )
     """
+    values = np.asarray(values)
+
     # Averaging vector (1/N)
-    weights = np.r_[np.zeros(width + 1), np.ones_like(values)]
+    weights = np.r_[np.zeros(width + 1), np.ones(values.shape[-1])]
     sum_weights = np.cumsum(weights)
+    padding = np.zeros(values.shape[:-1] + (width + 1,))
 
     mean = np.zeros_like(values)
 
     # Forward averaging
     if method in ["centered", "forward"]:
-        padded = np.r_[np.zeros(width + 1), values]
-        cumsum = np.cumsum(padded)
-        mean += (cumsum[(width + 1) :] - cumsum[: (-width - 1)]) / (
+        padded = np.concatenate([padding, values], axis=-1)
+        cumsum = np.cumsum(padded, axis=-1)
+        mean += (cumsum[..., (width + 1) :] - cumsum[..., : (-width - 1)]) / (
             sum_weights[(width + 1) :] - sum_weights[: (-width - 1)]
         )
 
     # Backward averaging
     if method in ["centered", "backward"]:
-        padded = np.r_[np.zeros(width + 1), values[::-1]]
-        cumsum = np.cumsum(padded)
+        padded = np.concatenate([padding, values[..., ::-1]], axis=-1)
+        cumsum = np.cumsum(padded, axis=-1)
         mean += (
-            (cumsum[(width + 1) :] - cumsum[: (-width - 1)])
+            (cumsum[..., (width + 1) :] - cumsum[..., : (-width - 1)])
             / (sum_weights[(width + 1) :] - sum_weights[: (-width - 1)])
-        )[::-1]
+        )[..., ::-1]
 
     if method == "centered":
         mean /= 2.0
@@ -82,41 +88,152 @@ def treemesh_2_octree(workspace, treemesh, **kwargs):
 
 def cell_size_z(drape_model: DrapeModel) -> np.ndarray:
     """Compute z cell sizes of drape model."""
-    hz = []
-    for prism in drape_model.prisms:
-        top_z, top_layer, n_layers = prism[2:]
-        bottoms = drape_model.layers[
-            range(int(top_layer), int(top_layer + n_layers)), 2
+    top_z, top_layer, n_layers = (
+        drape_model.prisms[:, 2],
+        drape_model.prisms[:, 3].astype(int),
+        drape_model.prisms[:, 4].astype(int),
+    )
+    first = np.cumsum(n_layers) - n_layers
+    layer_ind = np.repeat(top_layer - first, n_layers) + np.arange(n_layers.sum())
+    bottoms = drape_model.layers[layer_ind, 2]
+    tops = np.r_[0.0, bottoms[:-1]]
+    tops[first[n_layers > 0]] = top_z[n_layers > 0]
+
+    return tops - bottoms
+
+
+class TopographySurface:
+    """
+    Elevation of a topography surface, with its triangulation and nearest
+    neighbour tree built once and re-used across evaluations.
+
+    :param topo: Array of xyz locations.
+    :param method: Interpolation method. Must be "linear", or "nearest".
+    :param chunk_size: Number of locations evaluated per thread.
+    """
+
+    def __init__(
+        self, topo: np.ndarray, method: str = "linear", chunk_size: int = 100000
+    ):
+        if method not in ["linear", "nearest"]:
+            raise ValueError("Method must be 'linear', or 'nearest'")
+
+        self.topo = np.asarray(topo, dtype=float)
+        self.method = method
+        self.chunk_size = chunk_size
+        self._interpolator = None
+        self._tree = None
+
+    @property
+    def interpolator(self) -> LinearNDInterpolator | NearestNDInterpolator:
+        """Interpolator of the elevation from xy locations."""
+        if self._interpolator is None:
+            if self.method == "linear":
+                delaunay_2d = Delaunay(self.topo[:, :-1])
+                self._interpolator = LinearNDInterpolator(delaunay_2d, self.topo[:, -1])
+            else:
+                self._interpolator = NearestNDInterpolator(
+                    self.topo[:, :-1], self.topo[:, -1]
+                )
+
+        return self._interpolator
+
+    @property
+    def tree(self) -> cKDTree:
+        """Nearest neighbour tree of the xyz locations."""
+        if self._tree is None:
+            self._tree = cKDTree(self.topo)
+
+        return self._tree
+
+    def elevation(
+        self, locations: np.ndarray, columns: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Elevation of the surface below or above xyz locations. Locations
+        outside the triangulation take the elevation of the nearest topography
+        point in 3D.
+
+        :param locations: Array of xyz locations.
+        :param columns: Identifier of the xy column of each location, for
+            the surface to be interpolated once per column.
+
+        :return: Elevations of shape(locations.shape[0], ).
+        """
+        if columns is not None:
+            _, unique, inverse = np.unique(
+                columns, return_index=True, return_inverse=True
+            )
+            z_locations = self.interpolate(locations[unique, :2])[inverse.ravel()]
+        else:
+            z_locations = self.interpolate(locations[:, :2])
+
+        # Apply nearest neighbour if in extrapolation
+        ind_nan = np.isnan(z_locations)
+        if any(ind_nan):
+            _, ind = self.tree.query(locations[ind_nan, :], workers=-1)
+            z_locations[ind_nan] = self.topo[ind, -1]
+
+        return z_locations
+
+    def interpolate(self, xy_locations: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the surface at xy locations, in chunks evaluated in
+        parallel threads.
+
+        :param xy_locations: Array of xy locations.
+
+        :return: Elevations, nan outside the triangulation.
+        """
+        chunks = [
+            xy_locations[start : start + self.chunk_size]
+            for start in range(0, len(xy_locations), self.chunk_size)
         ]
-        z = np.hstack([top_z, bottoms])
-        hz.append(z[:-1] - z[1:])
-    return np.hstack(hz)
+        interpolator = self.interpolator
+        if len(chunks) > 1:
+            with ThreadPoolExecutor() as executor:
+                return np.hstack(list(executor.map(interpolator, chunks)))
+
+        return interpolator(xy_locations)
+
+
+def octree_columns(mesh: Octree) -> np.ndarray:
+    """
+    Identifier of the column of cells sharing the xy footprint of each cell
+    of an octree mesh.
+
+    :param mesh: Octree mesh.
+
+    :return: Column identifiers of shape(mesh.n_cells, ).
+    """
+    cells = mesh.octree_cells
+    return np.ravel_multi_index(
+        (cells["I"], cells["J"], np.log2(cells["NCells"]).astype(int)),
+        (mesh.u_count, mesh.v_count, int(np.log2(max(mesh.u_count, mesh.v_count))) + 1),
+    )
 
 
 def active_from_xyz(
     mesh: DrapeModel | Octree,
-    topo: np.ndarray,
+    topo: np.ndarray | TopographySurface,
     grid_reference="center",
     method="linear",
 ):
     """Returns an active cell index array below a surface
 
     :param mesh: Mesh object
-    :param topo: Array of xyz locations
+    :param topo: Array of xyz locations, or TopographySurface re-used
+        across calls.
     :param grid_reference: Cell reference. Must be "center", "top", or "bottom"
-    :param method: Interpolation method. Must be "linear", or "nearest"
+    :param method: Interpolation method. Must be "linear", or "nearest".
+        Ignored if topo is a TopographySurface.
     """
 
     mesh_dim = 2 if isinstance(mesh, DrapeModel) else 3
     locations = mesh.centroids.copy()
 
-    if method == "linear":
-        delaunay_2d = Delaunay(topo[:, :-1])
-        z_interpolate = LinearNDInterpolator(delaunay_2d, topo[:, -1])
-    elif method == "nearest":
-        z_interpolate = NearestNDInterpolator(topo[:, :-1], topo[:, -1])
-    else:
-        raise ValueError("Method must be 'linear', or 'nearest'")
+    if not isinstance(topo, TopographySurface):
+        topo = TopographySurface(topo, method=method)
 
     if mesh_dim == 2:
         z_offset = cell_size_z(mesh) / 2.0
@@ -133,16 +250,9 @@ def active_from_xyz(
     else:
         raise ValueError("'grid_reference' must be one of 'center', 'top', or 'bottom'")
 
-    z_locations = z_interpolate(locations[:, :2])
-
-    # Apply nearest neighbour if in extrapolation
-    ind_nan = np.isnan(z_locations)
-    if any(ind_nan):
-        tree = cKDTree(topo)
-        _, ind = tree.query(locations[ind_nan, :])
-        z_locations[ind_nan] = topo[ind, -1]
-
-    # fill_nan(locations, z_locations, filler=topo[:, -1])
+    # Cells of an octree column share the elevation of the surface
+    columns = octree_columns(mesh) if mesh_dim == 3 else None
+    z_locations = topo.elevation(locations, columns=columns)
 
     # Return the active cell array
     return locations[:, -1] < z_locations
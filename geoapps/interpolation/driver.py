@@ -19,13 +19,14 @@ from scipy.spatial import cKDTree
 from geoapps.driver_base.driver import BaseDriver
 from geoapps.interpolation.constants import validations
 from geoapps.interpolation.params import DataInterpolationParams
-from geoapps.shared_utils.utils import get_locations, weighted_average
+from geoapps.shared_utils.utils import get_locations, tree_query, weighted_average
 
 
 class DataInterpolationDriver(BaseDriver):
 
     _params_class = DataInterpolationParams
     _validations = validations
+    _chunk_size = int(1e6)
 
     def __init__(self, params: DataInterpolationParams):
         super().__init__(params)
@@ -37,9 +38,6 @@ class DataInterpolationDriver(BaseDriver):
         if xyz is None:
             raise ValueError("Input object has no centroids or vertices.")
 
-        # Create a tree for the input mesh
-        tree = cKDTree(xyz)
-
         xyz_out = get_locations(self.params.geoh5, self.params.out_object)
         xyz_out_orig = xyz_out.copy()
 
@@ -62,11 +60,11 @@ class DataInterpolationDriver(BaseDriver):
             sign[field] = np.ones_like(values[field])
 
         values_interp = {}
-        rad, ind = tree.query(xyz_out)
         if self.params.method == "Nearest":
 
             print("Computing nearest neighbor interpolation")
             # Find nearest cells
+            rad, ind = tree_query(cKDTree(xyz), xyz_out, chunk_size=self._chunk_size)
             for key, value in values.items():
                 values_interp[key] = value[ind]
                 sign[key] = sign[key][ind]
@@ -104,6 +102,7 @@ class DataInterpolationDriver(BaseDriver):
                 threshold=1e-1,
                 n=8,
                 return_indices=True,
+                chunk_size=self._chunk_size,
             )
 
             for key, val in zip(list(values.keys()), vals):
@@ -128,8 +127,11 @@ class DataInterpolationDriver(BaseDriver):
 
             ind_nan = np.isnan(z_interp)
             if any(ind_nan):
-                tree = cKDTree(topo[:, :2])
-                _, ind = tree.query(xyz_out_orig[ind_nan, :2])
+                _, ind = tree_query(
+                    cKDTree(topo[:, :2]),
+                    xyz_out_orig[ind_nan, :2],
+                    chunk_size=self._chunk_size,
+                )
                 z_interp[ind_nan] = topo[ind, 2]
 
             top = xyz_out_orig[:, 2] > z_interp
@@ -151,8 +153,11 @@ class DataInterpolationDriver(BaseDriver):
             elif hasattr(xy_ref, "vertices"):
                 xy_ref = xy_ref.vertices
 
-            tree = cKDTree(xy_ref[:, :2])
-            rad, _ = tree.query(xyz_out_orig[:, :2])
+            rad, _ = tree_query(
+                cKDTree(xy_ref[:, :2]),
+                xyz_out_orig[:, :2],
+                chunk_size=self._chunk_size,
+            )
             for key in values_interp.keys():
                 if self.params.max_distance is not None:
                     values_interp[key][
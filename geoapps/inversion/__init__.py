@@ -15,12 +15,14 @@ from geoapps.inversion.electricals.direct_current.three_dimensions.driver import
 )
 from geoapps.inversion.electricals.direct_current.two_dimensions.driver import (
     DirectCurrent2DDriver,
+    DirectCurrentPseudo3DDriver,
 )
 from geoapps.inversion.electricals.induced_polarization.three_dimensions.driver import (
     InducedPolarization3DDriver,
 )
 from geoapps.inversion.electricals.induced_polarization.two_dimensions.driver import (
     InducedPolarization2DDriver,
+    InducedPolarizationPseudo3DDriver,
 )
 from geoapps.inversion.natural_sources.magnetotellurics.driver import (
     MagnetotelluricsDriver,
@@ -41,9 +43,10 @@ DRIVER_MAP = {
     "magnetic vector": MagneticVectorDriver,
     "direct current 3d": DirectCurrent3DDriver,
     "direct current 2d": DirectCurrent2DDriver,
+    "direct current pseudo 3d": DirectCurrentPseudo3DDriver,
     "induced polarization 3d": InducedPolarization3DDriver,
     "induced polarization 2d": InducedPolarization2DDriver,
-    "induced polarization pseudo 3d": None,  # InducedPolarizationPseudo3DDriver,
+    "induced polarization pseudo 3d": InducedPolarizationPseudo3DDriver,
     "magnetotellurics": MagnetotelluricsDriver,
     "tipper": TipperDriver,
 }
@@ -43,6 +43,7 @@ from simpeg_archive.utils import Counter, mkvc
 
 from geoapps.shared_utils.utils import filter_xy, rotate_xyz
 from geoapps.utils import geophysical_systems
+from geoapps.utils.surveys import LineIndex
 
 
 def inversion(input_file):
@@ -332,10 +333,11 @@ def inversion(input_file):
 
         for key, values in selection.items():
             line_data = workspace.get_entity(uuid.UUID(key))[0]
+            line_index = LineIndex.from_data(line_data)
 
             for line in values[0]:
 
-                line_ind = np.where(line_data.values == float(line))[0]
+                line_ind = line_index.get(float(line))
 
                 if len(line_ind) < 2:
                     continue
@@ -482,9 +484,10 @@ def inversion(input_file):
     for key, values in selection.items():
 
         line_data: ReferencedData = workspace.get_entity(uuid.UUID(key))[0]
+        line_index = LineIndex(line_data.values[win_ind])
 
         for line in values[0]:
-            line_ind = np.where(line_data.values[win_ind] == line)[0]
+            line_ind = line_index.get(line)
             n_sounding = len(line_ind)
             if n_sounding < 2:
                 continue
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
     from geoh5py.workspace import Workspace
     from geoapps.drivers import BaseParams
 
+import os
+import shutil
 from copy import deepcopy
 
 import numpy as np
@@ -24,7 +26,12 @@ from SimPEG import maps
 from SimPEG.electromagnetics.static.utils.static_utils import geometric_factor
 from SimPEG.utils.drivers import create_nested_mesh
 
-from geoapps.inversion.utils import calculate_2D_trend
+from geoapps.inversion.utils import (
+    calculate_2D_trend,
+    hash_arrays,
+    load_tile_mapping,
+    save_tile_mapping,
+)
 from geoapps.shared_utils.utils import filter_xy
 
 from .factories import (
@@ -121,6 +128,7 @@ class InversionData(InversionLocations):
         self.entity = None
         self.data_entity = None
         self._observed_data_types = {}
+        self._mesh_hash: tuple | None = None
         self.survey = None
         self._initialize()
 
@@ -452,6 +460,7 @@ class InversionData(InversionLocations):
         survey,
         tile_id: int = None,
         padding_cells: int = 6,
+        local_mapping: tuple[TreeMesh, maps.TileMap] | None = None,
     ):
         """
         Generates SimPEG simulation object.
@@ -461,6 +470,9 @@ class InversionData(InversionLocations):
         :param: survey: SimPEG survey object.
         :param: tile_id (Optional): Id associated with the tile covered by
             the survey in case of a tiled inversion.
+        :param: padding_cells: Number of padding cells around the receivers.
+        :param: local_mapping (Optional): Nested mesh and TileMap of the tile,
+            as returned by :meth:`tile_mapping`. Created if not provided.
 
         :return: sim: SimPEG simulation object for full data or optionally
             the portion of the data indexed by the local_index argument.
@@ -481,18 +493,11 @@ class InversionData(InversionLocations):
             )
 
         else:
-            nested_mesh = create_nested_mesh(
-                survey.unique_locations,
-                mesh,
-                method="padding_cells",
-                minimum_level=3,
-                padding_cells=padding_cells,
-            )
-
-            kwargs = {"components": 3} if self.vector else {}
-            mapping = maps.TileMap(
-                mesh, active_cells, nested_mesh, enforce_active=True, **kwargs
-            )
+            if local_mapping is None:
+                local_mapping = self.tile_mapping(
+                    mesh, active_cells, survey, padding_cells=padding_cells
+                )
+            nested_mesh, mapping = local_mapping
             sim = simulation_factory.build(
                 survey=survey,
                 global_mesh=mesh,
@@ -503,11 +508,92 @@ class InversionData(InversionLocations):
             )
         return sim, mapping
 
+    def tile_mapping(
+        self,
+        mesh: TreeMesh,
+        active_cells: np.ndarray,
+        survey,
+        padding_cells: int = 6,
+    ) -> tuple[TreeMesh, maps.TileMap]:
+        """
+        Create the nested mesh and TileMap of a tile. If 'cache_tiles' is set,
+        load them from the cache stored under the work path by a previous run
+        on the same mesh, active cells and receivers.
+
+        :param: mesh: inversion mesh.
+        :param: active_cells: Mask that reduces model to active (earth) cells.
+        :param: survey: SimPEG survey object of the tile.
+        :param: padding_cells: Number of padding cells around the receivers.
+
+        :return: nested_mesh: Local TreeMesh of the tile.
+        :return: mapping: TileMap from the global to the nested mesh.
+        """
+        kwargs = {"components": 3} if self.vector else {}
+        if not self.params.cache_tiles:
+            return self._create_tile_mapping(
+                mesh, active_cells, survey, padding_cells, **kwargs
+            )
+
+        # Hash of the global mesh and active cells, shared by all tiles
+        mesh_hash = self._mesh_hash
+        if (
+            mesh_hash is None
+            or mesh_hash[0] is not mesh
+            or mesh_hash[1] is not active_cells
+        ):
+            mesh_hash = (
+                mesh,
+                active_cells,
+                hash_arrays(*mesh.h, mesh.x0, *mesh.__getstate__(), active_cells),
+            )
+            self._mesh_hash = mesh_hash
+
+        key = hash_arrays(
+            survey.unique_locations,
+            np.r_[padding_cells, kwargs.get("components", 1)],
+            digest=mesh_hash[2],
+        ).hexdigest()
+        path = os.path.join(self.params.workpath, "SimPEG_TileCache", key)
+        cached = load_tile_mapping(
+            path, mesh, active_cells, enforce_active=True, **kwargs
+        )
+
+        if cached is not None:
+            return cached
+
+        nested_mesh, mapping = self._create_tile_mapping(
+            mesh, active_cells, survey, padding_cells, **kwargs
+        )
+        save_tile_mapping(path, nested_mesh, mapping)
+
+        return nested_mesh, mapping
+
+    @staticmethod
+    def _create_tile_mapping(
+        mesh: TreeMesh, active_cells: np.ndarray, survey, padding_cells: int, **kwargs
+    ) -> tuple[TreeMesh, maps.TileMap]:
+        """Create the nested mesh and TileMap of a tile."""
+        nested_mesh = create_nested_mesh(
+            survey.unique_locations,
+            mesh,
+            method="padding_cells",
+            minimum_level=3,
+            padding_cells=padding_cells,
+        )
+        mapping = maps.TileMap(
+            mesh, active_cells, nested_mesh, enforce_active=True, **kwargs
+        )
+
+        return nested_mesh, mapping
+
     def simulate(self, model, inverse_problem, sorting):
         """Simulate fields for a particular model."""
+        self.check_sensitivity_stores(inverse_problem)
         dpred = inverse_problem.get_dpred(
             model, compute_J=False if self.params.forward_only else True
         )
+        self.complete_sensitivity_stores(inverse_problem)
+
         if self.params.forward_only:
             save_directive = SaveIterationGeoh5Factory(self.params).build(
                 inversion_object=self,
@@ -517,6 +603,59 @@ class InversionData(InversionLocations):
 
         inverse_problem.dpred = dpred
 
+    def sensitivity_stores(self, inverse_problem) -> list[str]:
+        """
+        Paths of the sensitivity stores of linear simulations, see
+        :meth:`SimulationFactory._get_sensitivity_path`.
+
+        :param inverse_problem: SimPEG inverse problem.
+
+        :return: List of store paths.
+        """
+        if (
+            self.params.inversion_type not in SimulationFactory.linear_types
+            or self.params.store_sensitivities != "disk"
+            or self.params.forward_only
+        ):
+            return []
+
+        misfits = getattr(inverse_problem.dmisfit, "objfcts", [inverse_problem.dmisfit])
+        return [
+            misfit.simulation.sensitivity_path
+            for misfit in misfits
+            if getattr(misfit, "simulation", None) is not None
+        ]
+
+    def check_sensitivity_stores(self, inverse_problem):
+        """
+        Remove the sensitivities left incomplete by an interrupted run, so
+        that they are recomputed rather than read with missing chunks.
+
+        :param inverse_problem: SimPEG inverse problem.
+        """
+        stores = self.sensitivity_stores(inverse_problem)
+        reused = 0
+        for store in stores:
+            if os.path.exists(os.path.join(store, "complete")):
+                reused += 1
+            elif os.path.exists(os.path.join(store, "J.zarr")):
+                shutil.rmtree(os.path.join(store, "J.zarr"))
+
+        if reused > 0:
+            print(f"Re-using stored sensitivities for {reused}/{len(stores)} tile(s).")
+
+    def complete_sensitivity_stores(self, inverse_problem):
+        """
+        Mark the sensitivity stores as complete, once they have been fully
+        computed by a simulation or an inversion.
+
+        :param inverse_problem: SimPEG inverse problem.
+        """
+        for store in self.sensitivity_stores(inverse_problem):
+            if os.path.exists(os.path.join(store, "J.zarr")):
+                with open(os.path.join(store, "complete"), "w", encoding="utf8"):
+                    pass
+
     @property
     def observed_data_types(self):
         """
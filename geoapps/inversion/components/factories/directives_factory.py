@@ -10,7 +10,11 @@
 
 from __future__ import annotations
 
+import os
+from datetime import datetime
+
 import numpy as np
+from geoh5py.workspace import Workspace
 from SimPEG import directives, maps
 from SimPEG.utils import cartesian2amplitude_dip_azimuth
 
@@ -33,8 +37,9 @@ class DirectivesFactory:
         ],
     }
 
-    def __init__(self, params):
+    def __init__(self, params, writer=None):
         self.params = params
+        self.writer = writer
         self.factory_type = params.inversion_type
         self.directive_list = []
         self.vector_inversion_directive = None
@@ -96,7 +101,7 @@ class DirectivesFactory:
         if self.params.geoh5 is not None:
 
             self.save_iteration_model_directive = SaveIterationGeoh5Factory(
-                self.params
+                self.params, writer=self.writer
             ).build(
                 inversion_object=inversion_mesh,
                 active_cells=active_cells,
@@ -115,7 +120,7 @@ class DirectivesFactory:
             #     self.save_iteration_sensitivities_directive.transforms[-1].maps[-1]
             # ]
             self.save_iteration_data_directive = SaveIterationGeoh5Factory(
-                self.params
+                self.params, writer=self.writer
             ).build(
                 inversion_object=inversion_data,
                 active_cells=active_cells,
@@ -125,7 +130,7 @@ class DirectivesFactory:
                 name="Data",
             )
             self.save_iteration_residual_directive = SaveIterationGeoh5Factory(
-                self.params
+                self.params, writer=self.writer
             ).build(
                 inversion_object=inversion_data,
                 active_cells=active_cells,
@@ -135,7 +140,7 @@ class DirectivesFactory:
 
             if "direct current" in self.factory_type:
                 self.save_iteration_apparent_resistivity_directive = (
-                    SaveIterationGeoh5Factory(self.params).build(
+                    SaveIterationGeoh5Factory(self.params, writer=self.writer).build(
                         inversion_object=inversion_data,
                         active_cells=active_cells,
                         sorting=sorting,
@@ -153,13 +158,243 @@ class DirectivesFactory:
         return self.directive_list
 
 
+class BufferedSaveIterationsGeoH5(directives.SaveIterationsGeoH5):
+    """
+    Saves inversion results to a geoh5 file, holding the outputs and the
+    objective function log of iterations in memory and writing them in
+    batches, with one opening of the workspace per batch.
+
+    :param h5_object: Entity on which the results are saved.
+    :param buffer_iterations: Number of iterations buffered before writing.
+    :param buffer_memory: Size of the buffered outputs (GB) above which they
+        are written, regardless of the number of iterations.
+    :param writer: Background writer serializing the writes to geoh5, or
+        None to write from the inversion thread.
+    """
+
+    def __init__(
+        self,
+        h5_object,
+        buffer_iterations: int = 1,
+        buffer_memory: float | None = None,
+        writer=None,
+        **kwargs,
+    ):
+        self.buffer_iterations = buffer_iterations
+        self.buffer_memory = buffer_memory
+        self.writer = writer
+        self._buffer: list[tuple[int, np.ndarray | list[np.ndarray]]] = []
+        self._log_buffer: list[tuple[int, str]] = []
+        super().__init__(h5_object, **kwargs)
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Size of the buffered outputs in bytes."""
+        return sum(
+            sum(value.nbytes for value in values)
+            if isinstance(values, list)
+            else values.nbytes
+            for _, values in self._buffer
+        )
+
+    def initialize(self):
+        if self.attribute_type == "sensitivities":
+            super().initialize()
+            return
+
+        self._buffer.append((0, self.snapshot()))
+
+        if self.save_objective_function:
+            self.save_log(0)
+
+        self.flush()
+
+    def endIter(self):
+        if self.attribute_type == "sensitivities":
+            super().endIter()
+            return
+
+        self._buffer.append((self.opt.iter, self.snapshot()))
+
+        if self.save_objective_function:
+            self.save_log(self.opt.iter)
+
+        if len(self._buffer) >= self.buffer_iterations or (
+            self.buffer_memory is not None
+            and self.buffered_bytes > self.buffer_memory * 1e9
+        ):
+            self.flush()
+
+    def finish(self):
+        self.flush()
+
+    def flush(self):
+        """Write the buffered iterations and log lines to geoh5."""
+        buffer, self._buffer = self._buffer, []
+        logs, self._log_buffer = self._log_buffer, []
+        if buffer or logs:
+            self._submit(self.save_buffer, buffer, logs)
+
+    def save_buffer(
+        self,
+        buffer: list[tuple[int, np.ndarray | list[np.ndarray]]],
+        logs: list[tuple[int, str]] | None = None,
+    ):
+        """
+        Write buffered iterations and log lines to geoh5, opening the
+        workspace once.
+
+        :param buffer: Iterations and values to save.
+        :param logs: Iterations and lines of metrics to append to SimPEG.out.
+        """
+        with Workspace(self._h5_file) as workspace:
+            h5_object = workspace.get_entity(self.h5_object)[0]
+            for iteration, values in buffer:
+                self.write_components(h5_object, iteration, values)
+
+            if logs:
+                self.write_log(h5_object, logs)
+
+    def write_components(
+        self, h5_object, iteration: int, values: np.ndarray | list[np.ndarray]
+    ):
+        """
+        Sort, transform and add the values of an iteration to an entity, per
+        components and channels, as :meth:`save_components` does.
+
+        :param h5_object: Entity of an open workspace to add the data to.
+        :param iteration: Iteration of the values.
+        :param values: Model or predicted data of the iteration.
+        """
+        prop = self.stack_channels(values).flatten()
+        for fun in self.transforms:
+            if isinstance(fun, (maps.IdentityMap, np.ndarray, float)):
+                prop = fun * prop
+            else:
+                prop = fun(prop)
+
+        if prop.ndim == 2:
+            prop = prop.T.flatten()
+
+        prop = prop.reshape((len(self.channels), len(self.components), -1))
+
+        for count, component in enumerate(self.components):
+            data_types = self.data_type.setdefault(component, {})
+            for ind, channel in enumerate(self.channels):
+                values = prop[ind, count, :]
+                if self.sorting is not None:
+                    values = values[self.sorting]
+                if not isinstance(channel, str):
+                    channel = f"{channel:.2e}"
+
+                base_name = f"Iteration_{iteration}"
+                if len(component) > 0:
+                    base_name += f"_{component}"
+
+                channel_name = base_name
+                if len(channel) > 0:
+                    channel_name += f"_{channel}"
+
+                if self.label is not None:
+                    channel_name += f"_{self.label}"
+                    base_name += f"_{self.label}"
+
+                data = h5_object.add_data(
+                    {
+                        channel_name: {
+                            "association": self.association,
+                            "values": values,
+                        }
+                    }
+                )
+                if channel not in data_types:
+                    data_types[channel] = data.entity_type
+                    data.entity_type.name = f"{self.attribute_type}_" + channel
+                else:
+                    data.entity_type = h5_object.workspace.find_type(
+                        data_types[channel].uid, type(data_types[channel])
+                    )
+
+                if len(self.channels) > 1 and self.attribute_type == "predicted":
+                    h5_object.add_data_to_group(data, base_name)
+
+    def save_log(self, iteration: int):
+        """
+        Buffer the metrics of the current iteration, to be written to the
+        SimPEG.out file with the outputs of the iteration.
+        """
+        date_time = datetime.now().strftime("%b-%d-%Y:%H:%M:%S")
+        line = (
+            f"{iteration} {self.invProb.beta:.3e} {self.invProb.phi_d:.3e} "
+            f"{self.invProb.phi_m:.3e} {date_time}\n"
+        )
+        self._log_buffer.append((iteration, line))
+
+    def write_log(self, h5_object, logs: list[tuple[int, str]]):
+        """
+        Append lines of iteration metrics to the SimPEG.out file, and store
+        the file next to an entity.
+
+        :param h5_object: Entity of an open workspace.
+        :param logs: Iterations and lines of metrics, iteration 0 starting a
+            new file.
+        """
+        filepath = os.path.join(os.path.dirname(self._h5_file), "SimPEG.out")
+
+        for iteration, line in logs:
+            mode = "a"
+            if iteration == 0:
+                mode = "w"
+                line = "iteration beta phi_d phi_m time\n" + line
+
+            with open(filepath, mode, encoding="utf8") as file:
+                file.write(line)
+
+        with open(filepath, "rb") as file:
+            raw_file = file.read()
+
+        file_entity = None
+        for child in h5_object.parent.children:
+            if child.name == "SimPEG.out":
+                file_entity = child
+
+        if file_entity is None:
+            file_entity = h5_object.parent.add_file(filepath)
+
+        file_entity.values = raw_file
+
+    def snapshot(self) -> np.ndarray | list[np.ndarray]:
+        """
+        Copy of the current model, or predicted data, to be saved.
+        """
+        if self.attribute_type == "predicted":
+            dpred = self.invProb.dpred
+            if dpred is None:
+                dpred = self.invProb.get_dpred(self.invProb.model)
+                self.invProb.dpred = dpred
+
+            if isinstance(dpred, np.ndarray):
+                return dpred.copy()
+
+            return [np.array(pred, copy=True) for pred in dpred]
+
+        return np.array(self.invProb.model, copy=True)
+
+    def _submit(self, func, *args):
+        if self.writer is None:
+            func(*args)
+        else:
+            self.writer.submit(func, *args)
+
+
 class SaveIterationGeoh5Factory(SimPEGFactory):
-    def __init__(self, params):
+    def __init__(self, params, writer=None):
         super().__init__(params)
+        self.writer = writer
         self.simpeg_object = self.concrete_object()
 
     def concrete_object(self):
-        return directives.SaveIterationsGeoH5
+        return BufferedSaveIterationsGeoH5
 
     def assemble_arguments(
         self,
@@ -262,6 +497,10 @@ class SaveIterationGeoh5Factory(SimPEGFactory):
                 expmap = maps.ExpMap(inversion_object.mesh)
                 kwargs["transforms"] = [expmap * active_cells_map]
 
+        kwargs["buffer_iterations"] = self.params.save_buffer_iterations
+        kwargs["buffer_memory"] = self.params.save_buffer_memory
+        kwargs["writer"] = self.writer
+
         return kwargs
 
     @staticmethod
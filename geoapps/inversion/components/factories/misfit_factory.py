@@ -12,6 +12,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from geoapps.driver_base.params import BaseParams
 
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+
 import numpy as np
 from SimPEG import data, data_misfit, objective_function
 
@@ -74,44 +77,106 @@ class MisfitFactory(SimPEGFactory):
         mesh=None,
         active_cells=None,
     ):
-        local_misfits, self.sorting, = (
-            [],
-            [],
-        )
-
-        tile_num = 0
+        local_misfits, self.sorting, surveys, runtimes = [], [], [], []
         for local_index in tiles:
+            start = time()
             survey, local_index = inversion_data.create_survey(
                 mesh=mesh, local_index=local_index
             )
+            surveys.append(survey)
+            self.sorting.append(local_index)
+            runtimes.append(time() - start)
 
-            lsim, lmap = inversion_data.simulation(mesh, active_cells, survey, tile_num)
-
-            # TODO Parse workers to simulations
-            lsim.workers = self.params.distributed_workers
-            if "induced polarization" in self.params.inversion_type:
-                # TODO this should be done in the simulation factory
-                lsim.sigma = lsim.sigmaMap * lmap * self.models.conductivity
+        local_mappings = self._tile_mappings(
+            surveys, inversion_data, mesh, active_cells
+        )
 
-            if self.params.forward_only:
-                lmisfit = data_misfit.L2DataMisfit(simulation=lsim, model_map=lmap)
-            else:
-                ldat = (
-                    data.Data(survey, dobs=survey.dobs, standard_deviation=survey.std),
-                )
-                lmisfit = data_misfit.L2DataMisfit(
-                    data=ldat[0],
-                    simulation=lsim,
-                    model_map=lmap,
+        for tile_num, (survey, (local_mapping, runtime)) in enumerate(
+            zip(surveys, local_mappings)
+        ):
+            start = time() - runtimes[tile_num] - runtime
+            local_misfits.append(
+                self._tile_misfit(
+                    survey, inversion_data, mesh, active_cells, tile_num, local_mapping
                 )
-                lmisfit.W = 1 / survey.std
-
-            local_misfits.append(lmisfit)
-            self.sorting.append(local_index)
-            tile_num += 1
+            )
+            print(
+                f"Tile {tile_num + 1}/{len(tiles)}: "
+                f"{len(self.sorting[tile_num])} receivers "
+                f"set up in {time() - start:.2f} s"
+            )
 
         return [local_misfits]
 
+    def _tile_mappings(self, surveys, inversion_data, mesh, active_cells):
+        """
+        Create the nested meshes and TileMaps of the tiles, concurrently if
+        the inversion is parallelized.
+
+        :param surveys: SimPEG surveys of the tiles.
+        :param inversion_data: Inversion data object.
+        :param mesh: Global inversion mesh.
+        :param active_cells: Mask of active cells on the global mesh.
+
+        :return: Nested mesh and TileMap of each tile, or None for inversions
+            without nested meshes, with its runtime, in tile order.
+        """
+        if "2d" in self.params.inversion_type:
+            return [(None, 0.0)] * len(surveys)
+
+        def tile_mapping(survey):
+            start = time()
+            local_mapping = inversion_data.tile_mapping(mesh, active_cells, survey)
+            return local_mapping, time() - start
+
+        workers = 1
+        if self.params.parallelized and self.params.n_cpu is not None:
+            workers = min(self.params.n_cpu, len(surveys))
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(tile_mapping, surveys))
+
+        return [tile_mapping(survey) for survey in surveys]
+
+    def _tile_misfit(
+        self, survey, inversion_data, mesh, active_cells, tile_num, local_mapping=None
+    ):
+        """
+        Create the simulation and data misfit of a tile.
+
+        :param survey: SimPEG survey of the tile.
+        :param inversion_data: Inversion data object.
+        :param mesh: Global inversion mesh.
+        :param active_cells: Mask of active cells on the global mesh.
+        :param tile_num: Identifier of the tile.
+        :param local_mapping: Nested mesh and TileMap of the tile.
+
+        :return: Data misfit of the tile.
+        """
+        lsim, lmap = inversion_data.simulation(
+            mesh, active_cells, survey, tile_num, local_mapping=local_mapping
+        )
+
+        # TODO Parse workers to simulations
+        lsim.workers = self.params.distributed_workers
+        if "induced polarization" in self.params.inversion_type:
+            # TODO this should be done in the simulation factory
+            lsim.sigma = lsim.sigmaMap * lmap * self.models.conductivity
+
+        if self.params.forward_only:
+            lmisfit = data_misfit.L2DataMisfit(simulation=lsim, model_map=lmap)
+        else:
+            ldat = (data.Data(survey, dobs=survey.dobs, standard_deviation=survey.std),)
+            lmisfit = data_misfit.L2DataMisfit(
+                data=ldat[0],
+                simulation=lsim,
+                model_map=lmap,
+            )
+            lmisfit.W = 1 / survey.std
+
+        return lmisfit
+
     def _naturalsource_arguments(
         self,
         tiles=None,
@@ -16,14 +16,24 @@ if TYPE_CHECKING:
     from geoapps.driver_base.params import BaseParams
 
 import os
+import shutil
+import warnings
 
 import numpy as np
 from SimPEG import maps
+from SimPEG.potential_fields.gravity import simulation as gravity
+from SimPEG.potential_fields.magnetics import simulation as magnetics
+
+from geoapps.inversion.utils import hash_arrays
 
 from .simpeg_factory import SimPEGFactory
 
 
 class SimulationFactory(SimPEGFactory):
+
+    # Simulations with sensitivities independent of the model
+    linear_types = ["gravity", "magnetic scalar", "magnetic vector"]
+
     def __init__(self, params: BaseParams):
         """
         :param params: Params object containing SimPEG object parameters.
@@ -47,14 +57,10 @@ class SimulationFactory(SimPEGFactory):
     def concrete_object(self):
 
         if self.factory_type in ["magnetic scalar", "magnetic vector"]:
-            from SimPEG.potential_fields.magnetics import simulation
-
-            return simulation.Simulation3DIntegral
+            return MagneticSimulation
 
         if self.factory_type == "gravity":
-            from SimPEG.potential_fields.gravity import simulation
-
-            return simulation.Simulation3DIntegral
+            return GravitySimulation
 
         if self.factory_type == "direct current 3d":
             from SimPEG.electromagnetics.static.resistivity import simulation
@@ -83,6 +89,44 @@ class SimulationFactory(SimPEGFactory):
 
             return simulation.Simulation3DPrimarySecondary
 
+    def build(self, **kwargs):
+        """
+        Build the simulation, with sensitivities of linear simulations cast
+        and compressed as requested by the params.
+        """
+        simulation = super().build(**kwargs)
+
+        if isinstance(simulation, StoredSensitivities):
+            (
+                simulation.sensitivity_dtype,
+                simulation.sensitivity_compressor,
+            ) = self.sensitivity_storage
+
+        return simulation
+
+    @property
+    def sensitivity_storage(self) -> tuple[str, str]:
+        """
+        Data type and Blosc codec of the sensitivities of linear simulations.
+        """
+        dtype = getattr(self.params, "sensitivity_dtype", None) or "float64"
+        compressor = getattr(self.params, "sensitivity_compressor", None) or "lz4"
+
+        if dtype not in ["float64", "float32"]:
+            raise ValueError(f"Unrecognized sensitivity dtype '{dtype}'.")
+        if compressor not in ["lz4", "zstd", "none"]:
+            raise ValueError(f"Unrecognized sensitivity compressor '{compressor}'.")
+
+        return dtype, compressor
+
+    @property
+    def chunk_format(self) -> str:
+        """
+        Chunking of the sensitivities of linear simulations, by rows or in
+        equal blocks along rows and columns.
+        """
+        return "equal" if self.params.chunk_by_rows is False else "row"
+
     def assemble_arguments(
         self,
         survey=None,
@@ -106,7 +150,9 @@ class SimulationFactory(SimPEGFactory):
     ):
 
         mesh = global_mesh if tile_id is None else local_mesh
-        sensitivity_path = self._get_sensitivity_path(tile_id)
+        sensitivity_path = self._get_sensitivity_path(
+            tile_id, survey=survey, mesh=mesh, active_cells=active_cells
+        )
 
         kwargs = {}
         kwargs["survey"] = survey
@@ -141,21 +187,21 @@ class SimulationFactory(SimPEGFactory):
         kwargs["actInd"] = active_cells
         kwargs["chiMap"] = maps.IdentityMap(nP=int(active_cells.sum()) * 3)
         kwargs["model_type"] = "vector"
-        kwargs["chunk_format"] = "row"
+        kwargs["chunk_format"] = self.chunk_format
 
         return kwargs
 
     def _magnetic_scalar_keywords(self, kwargs, active_cells=None):
         kwargs["actInd"] = active_cells
         kwargs["chiMap"] = maps.IdentityMap(nP=int(active_cells.sum()))
-        kwargs["chunk_format"] = "row"
+        kwargs["chunk_format"] = self.chunk_format
 
         return kwargs
 
     def _gravity_keywords(self, kwargs, active_cells=None):
         kwargs["actInd"] = active_cells
         kwargs["rhoMap"] = maps.IdentityMap(nP=int(active_cells.sum()))
-        kwargs["chunk_format"] = "row"
+        kwargs["chunk_format"] = self.chunk_format
 
         return kwargs
 
@@ -187,8 +233,17 @@ class SimulationFactory(SimPEGFactory):
 
         return kwargs
 
-    def _get_sensitivity_path(self, tile_id: int) -> str:
-        """Build path to destination of on-disk sensitivities."""
+    def _get_sensitivity_path(
+        self, tile_id: int, survey=None, mesh=None, active_cells=None
+    ) -> str:
+        """
+        Build path to destination of on-disk sensitivities.
+
+        Sensitivities of linear simulations stored on disk are stamped with
+        a hash of the survey, mesh and active cells of their tile, so that
+        they can be re-used by later runs with the same geometry. The store
+        of a tile is removed when its geometry changes.
+        """
         out_dir = os.path.join(self.params.workpath, "SimPEG_PFInversion") + os.path.sep
 
         if tile_id is None:
@@ -196,4 +251,179 @@ class SimulationFactory(SimPEGFactory):
         else:
             sens_path = out_dir + "Tile" + str(tile_id) + ".zarr"
 
+        if (
+            self.factory_type in self.linear_types
+            and self.params.store_sensitivities == "disk"
+            and not self.params.forward_only
+            and survey is not None
+        ):
+            self._stamp_sensitivity_path(
+                sens_path, self.sensitivity_key(survey, mesh, active_cells)
+            )
+
         return sens_path
+
+    @staticmethod
+    def _stamp_sensitivity_path(sens_path: str, key: str):
+        """
+        Remove the sensitivities stored under a path if they were computed for
+        another key, and stamp the path with the current key.
+
+        :param sens_path: Directory of the sensitivities of a tile.
+        :param key: Hash of the inputs of the sensitivities.
+        """
+        stamp = os.path.join(sens_path, "key")
+        if os.path.exists(stamp):
+            with open(stamp, encoding="utf8") as file:
+                if file.read() == key:
+                    return
+
+        if os.path.exists(sens_path):
+            shutil.rmtree(sens_path)
+
+        os.makedirs(sens_path)
+        with open(stamp, "w", encoding="utf8") as file:
+            file.write(key)
+
+    def sensitivity_key(self, survey, mesh, active_cells) -> str:
+        """
+        Hash of the inputs defining the sensitivities of a linear simulation:
+        simulation type, chunks and compression, receiver locations and
+        components, inducing field, mesh and active cells.
+
+        :param survey: SimPEG potential field survey.
+        :param mesh: Mesh of the simulation.
+        :param active_cells: Active cells of the simulation mesh.
+
+        :return: Hexadecimal digest.
+        """
+        components = survey.components
+        source_field = getattr(survey, "source_field", None)
+        storage = " ".join(
+            (self.factory_type, self.chunk_format, self.sensitivity_storage[1])
+        )
+
+        return hash_arrays(
+            np.frombuffer(storage.encode(), dtype="uint8"),
+            np.frombuffer(" ".join(components).encode(), dtype="uint8"),
+            *[np.asarray(val) for val in components.values()],
+            np.asarray(getattr(source_field, "parameters", []), dtype=float),
+            survey.receiver_locations,
+            *mesh.h,
+            mesh.x0,
+            *mesh.__getstate__(),
+            active_cells,
+        ).hexdigest()
+
+
+class StoredSensitivities:
+    """
+    Potential field simulation holding its sensitivities with the precision
+    and compression set by :attr:`sensitivity_dtype` and
+    :attr:`sensitivity_compressor`.
+    """
+
+    sensitivity_dtype: str = "float64"
+    sensitivity_compressor: str = "lz4"
+
+    def linear_operator(self):
+        """
+        Sensitivities computed from the rows of
+        :meth:`BasePFSimulation.make_row_stack`.
+        """
+        return linear_operator(
+            self, dtype=self.sensitivity_dtype, compressor=self.sensitivity_compressor
+        )
+
+
+class GravitySimulation(StoredSensitivities, gravity.Simulation3DIntegral):
+    """
+    Gravity simulation with stored sensitivities.
+    """
+
+
+class MagneticSimulation(StoredSensitivities, magnetics.Simulation3DIntegral):
+    """
+    Magnetic simulation with stored sensitivities.
+    """
+
+
+def linear_operator(simulation, dtype="float64", compressor="lz4"):
+    """
+    Sensitivities of a potential field simulation held with a given
+    precision and stored with a given compression.
+
+    Replaces the dask :meth:`linear_operator` of SimPEG, which holds double
+    precision sensitivities in memory and stores them on disk in single
+    precision with the default zarr codec. Sensitivities held in memory are
+    persisted and those stored on disk are written once, so that later
+    products with the sensitivities do not compute them again.
+
+    :param simulation: SimPEG potential field simulation.
+    :param dtype: Data type of the sensitivities held in memory, 'float64' or
+        'float32'. Sensitivities stored on disk are single precision.
+    :param compressor: Blosc codec of sensitivities stored on disk, 'lz4',
+        'zstd' or 'none'.
+
+    :return: Dask array of sensitivities.
+    """
+    from dask import array, config
+    from numcodecs import Blosc
+    from SimPEG.dask.utils import compute_chunk_sizes
+    from zarr.errors import ArrayNotFoundError
+
+    simulation.nC = simulation.model_map.shape[0]
+    n_rows = int(
+        np.sum(np.hstack([np.c_[val] for val in simulation.survey.components.values()]))
+    )
+    sens_name = os.path.join(simulation.sensitivity_path, "J.zarr")
+    if simulation.store_sensitivities == "disk":
+        dtype = "float32"
+
+    if os.path.exists(sens_name):
+        try:
+            kernel = array.from_zarr(sens_name)
+            if kernel.shape == (n_rows, simulation.nC) and kernel.dtype == dtype:
+                return kernel
+        except ArrayNotFoundError:
+            warnings.warn(
+                f"Malformed sensitivity matrix found in {sens_name}. Re-computing",
+                UserWarning,
+            )
+            shutil.rmtree(sens_name)
+
+    # The rows are labelled single precision but computed in double precision,
+    # so cast the blocks rather than the label
+    stack = simulation.make_row_stack().map_blocks(
+        lambda block: block.astype(dtype), dtype=dtype
+    )
+
+    if (
+        simulation.chunk_format == "equal"
+        and simulation.store_sensitivities != "forward_only"
+    ):
+        row_chunk, col_chunk = compute_chunk_sizes(
+            *stack.shape, simulation.max_chunk_size
+        )
+        stack = stack.rechunk((row_chunk, col_chunk))
+    else:
+        with config.set({"array.chunk-size": f"{simulation.max_chunk_size}MiB"}):
+            stack = stack.rechunk({0: "auto", 1: -1})
+
+    if simulation.store_sensitivities == "forward_only":
+        return stack
+
+    if simulation.store_sensitivities == "ram":
+        return stack.persist()
+
+    print("Saving sensitivities to zarr: " + sens_name)
+    return array.to_zarr(
+        stack,
+        sens_name,
+        compute=True,
+        return_stored=True,
+        overwrite=True,
+        compressor=None
+        if compressor == "none"
+        else Blosc(cname=compressor, clevel=5, shuffle=Blosc.SHUFFLE),
+    )
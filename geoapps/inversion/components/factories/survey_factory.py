@@ -18,33 +18,17 @@ if TYPE_CHECKING:
 import numpy as np
 from scipy.interpolate import interp1d
 
-from geoapps.utils.surveys import compute_alongline_distance, extract_dcip_survey
+from geoapps.utils.surveys import (
+    LineIndex,
+    compute_alongline_distance,
+    extract_dcip_survey,
+)
 
 from .receiver_factory import ReceiversFactory
 from .simpeg_factory import SimPEGFactory
 from .source_factory import SourcesFactory
 
 
-def receiver_group(txi, potential_electrodes):
-    """
-    Group receivers by common transmitter id.
-
-    :param: txi : transmitter index number.
-    :param: potential_electrodes : geoh5py object that holds potential electrodes
-        ab_map and ab_cell_id for a dc survey.
-
-    :return: ids : list of ids of potential electrodes used with transmitter txi.
-    """
-
-    index_map = potential_electrodes.ab_map.map
-    index_map = {int(v): k for k, v in index_map.items() if v != "Unknown"}
-    ids = np.where(
-        potential_electrodes.ab_cell_id.values.astype(int) == index_map[txi]
-    )[0]
-
-    return ids
-
-
 def group_locations(obj, ids):
     """
     Return vertex locations for possible group of cells.
@@ -277,41 +261,33 @@ class SurveyFactory(SimPEGFactory):
         )
         currents = receiver_entity.current_electrodes
 
+        # Group receivers and currents by source id once
+        index_map = {
+            int(v): k for k, v in receiver_entity.ab_map.map.items() if v != "Unknown"
+        }
+        receiver_index = LineIndex(receiver_entity.ab_cell_id.values.astype(int))
+        current_index = LineIndex(currents.ab_cell_id.values)
+
+        if "2d" in self.params.inversion_type:
+            receiver_locations, source_locations = self._alongline_locations(
+                receiver_entity.vertices, currents.vertices, local_index
+            )
+        else:
+            receiver_locations = data.locations
+            source_locations = currents.vertices
+
         # TODO hook up tile_spatial to handle local_index handling
         sources = []
         self.local_index = []
         for source_id in source_ids[np.argsort(order)]:  # Cycle in original order
 
-            receiver_indices = receiver_group(source_id, receiver_entity)
-
-            if "2d" in self.params.inversion_type:
-                receiver_locations = receiver_entity.vertices
-                source_locations = currents.vertices
-                if local_index is not None:
-                    locations = np.vstack([receiver_locations, source_locations])
-                    locations = np.unique(locations, axis=0)
-                    distances = compute_alongline_distance(locations)
-                    xrange = locations[:, 0].max() - locations[:, 0].min()
-                    yrange = locations[:, 1].max() - locations[:, 1].min()
-                    use_x = xrange >= yrange
-                    if use_x:
-                        to_distance = interp1d(locations[:, 0], distances[:, 0])
-                        rec_dist = to_distance(receiver_locations[:, 0])
-                        src_dist = to_distance(source_locations[:, 0])
-                    else:
-                        to_distance = interp1d(locations[:, 1], distances[:, 0])
-                        rec_dist = to_distance(receiver_locations[:, 1])
-                        src_dist = to_distance(source_locations[:, 1])
-
-                    receiver_locations = np.c_[rec_dist, receiver_locations[:, 2]]
-                    source_locations = np.c_[src_dist, source_locations[:, 2]]
-            else:
-                receiver_locations = data.locations
-                source_locations = currents.vertices
+            receiver_indices = receiver_index.get(index_map[source_id])
+            cells = receiver_entity.cells[receiver_indices]
 
+            # Only pass the electrodes of the group to the factory
             receivers = ReceiversFactory(self.params).build(
-                locations=receiver_locations,
-                local_index=receiver_entity.cells[receiver_indices],
+                locations=receiver_locations[cells.ravel()],
+                local_index=np.arange(cells.size).reshape(cells.shape),
             )
 
             if receivers.nD == 0:
@@ -320,7 +296,7 @@ class SurveyFactory(SimPEGFactory):
             if "induced polarization" in self.factory_type:
                 receivers.data_type = "apparent_chargeability"
 
-            cell_ind = int(np.where(currents.ab_cell_id.values == source_id)[0])
+            cell_ind = current_index.get(source_id)[0]
             source = SourcesFactory(self.params).build(
                 receivers=receivers,
                 locations=source_locations[currents.cells[cell_ind]],
@@ -337,6 +313,37 @@ class SurveyFactory(SimPEGFactory):
 
         return [sources]
 
+    @staticmethod
+    def _alongline_locations(receiver_locations, source_locations, local_index=None):
+        """
+        Convert electrode locations of a 2D line to along-line distance and
+        elevation.
+
+        :param receiver_locations: Locations of the potential electrodes.
+        :param source_locations: Locations of the current electrodes.
+        :param local_index: Local indices of the data, the locations are left
+            unchanged if None.
+
+        :return: Receiver and source locations.
+        """
+        if local_index is None:
+            return receiver_locations, source_locations
+
+        locations = np.vstack([receiver_locations, source_locations])
+        locations = np.unique(locations, axis=0)
+        distances = compute_alongline_distance(locations)
+        xrange = locations[:, 0].max() - locations[:, 0].min()
+        yrange = locations[:, 1].max() - locations[:, 1].min()
+        axis = 0 if xrange >= yrange else 1
+        to_distance = interp1d(locations[:, axis], distances[:, 0])
+        rec_dist = to_distance(receiver_locations[:, axis])
+        src_dist = to_distance(source_locations[:, axis])
+
+        return (
+            np.c_[rec_dist, receiver_locations[:, 2]],
+            np.c_[src_dist, source_locations[:, 2]],
+        )
+
     def _naturalsource_arguments(self, data=None, mesh=None, frequency=None):
 
         receivers = []
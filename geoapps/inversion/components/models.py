@@ -7,9 +7,13 @@
 
 from __future__ import annotations
 
+import os
+from tempfile import NamedTemporaryFile
+
 import numpy as np
 from geoh5py.data import Data
 from geoh5py.workspace import Workspace
+from scipy.spatial import cKDTree
 from SimPEG.utils.mat_utils import (
     cartesian2amplitude_dip_azimuth,
     dip_azimuth2cartesian,
@@ -17,7 +21,8 @@ from SimPEG.utils.mat_utils import (
 )
 
 from geoapps.driver_base.params import BaseParams
-from geoapps.shared_utils.utils import rotate_xyz, weighted_average
+from geoapps.inversion.utils import hash_arrays
+from geoapps.shared_utils.utils import rotate_xyz
 
 from . import InversionMesh
 
@@ -70,6 +75,7 @@ class InversionModelCollection:
         self._lower_bound = None
         self._upper_bound = None
         self._conductivity = None
+        self._neighbours: dict[tuple, np.ndarray] = {}
         self._initialize()
 
     @property
@@ -126,19 +132,39 @@ class InversionModelCollection:
         )
         self.n_blocks = 3 if self.params.inversion_type == "magnetic vector" else 1
         self._starting = InversionModel(
-            self.workspace, self.params, self.mesh, "starting"
+            self.workspace,
+            self.params,
+            self.mesh,
+            "starting",
+            neighbours=self._neighbours,
         )
         self._reference = InversionModel(
-            self.workspace, self.params, self.mesh, "reference"
+            self.workspace,
+            self.params,
+            self.mesh,
+            "reference",
+            neighbours=self._neighbours,
         )
         self._lower_bound = InversionModel(
-            self.workspace, self.params, self.mesh, "lower_bound"
+            self.workspace,
+            self.params,
+            self.mesh,
+            "lower_bound",
+            neighbours=self._neighbours,
         )
         self._upper_bound = InversionModel(
-            self.workspace, self.params, self.mesh, "upper_bound"
+            self.workspace,
+            self.params,
+            self.mesh,
+            "upper_bound",
+            neighbours=self._neighbours,
         )
         self._conductivity = InversionModel(
-            self.workspace, self.params, self.mesh, "conductivity"
+            self.workspace,
+            self.params,
+            self.mesh,
+            "conductivity",
+            neighbours=self._neighbours,
         )
 
     def _model_method_wrapper(self, method, name=None, **kwargs):
@@ -219,6 +245,7 @@ class InversionModel:
         params: BaseParams,
         mesh: InversionMesh,
         model_type: str,
+        neighbours: dict[tuple, np.ndarray] | None = None,
     ):
         """
         :param: workspace: Geoh5py workspace object containing location based data.
@@ -226,6 +253,8 @@ class InversionModel:
         :param mesh: inversion mesh object
         :param model_type: Type of inversion model, can be any of "starting", "reference",
             "lower_bound", "upper_bound".
+        :param neighbours: Nearest neighbour indices of the mesh cells in parent
+            entities, shared between the models of a collection.
         """
         self.mesh = mesh
         self.model_type = model_type
@@ -235,6 +264,7 @@ class InversionModel:
         self.is_vector = None
         self.n_blocks = None
         self.entity = mesh.entity
+        self.neighbours = {} if neighbours is None else neighbours
         self._initialize()
 
     def _initialize(self):
@@ -407,7 +437,26 @@ class InversionModel:
             inversion mesh.
 
         """
+        valid = ~np.isnan(obj)
+        key = (parent.uid, hash_arrays(valid).hexdigest())
+        if key not in self.neighbours:
+            self.neighbours[key] = self._nearest_neighbours(parent, valid)
+
+        full_vector = obj[valid][self.neighbours[key]]
+
+        return full_vector[np.argsort(self.mesh.permutation)]
+
+    def _nearest_neighbours(self, parent, valid: np.ndarray) -> np.ndarray:
+        """
+        Indices of the nearest valid locations of parent to the cells of the
+        inversion mesh. If 'cache_neighbours' is set, the indices are stored in
+        the work directory for re-use by later runs.
+
+        :param parent: parent geoh5 entity to model containing location data.
+        :param valid: Mask of the locations of parent with values.
 
+        :return: Indices into the valid locations, in octree cell order.
+        """
         xyz_out = self.mesh.entity.centroids
 
         if hasattr(parent, "centroids"):
@@ -420,9 +469,30 @@ class InversionModel:
         else:
             xyz_in = parent.vertices
 
-        full_vector = weighted_average(xyz_in, xyz_out, [obj], n=1)[0]
+        xyz_in = xyz_in[valid]
+        if not self.params.cache_neighbours:
+            _, indices = cKDTree(xyz_in).query(xyz_out, workers=-1)
+            return indices
 
-        return full_vector[np.argsort(self.mesh.permutation)]
+        path = os.path.join(
+            self.params.workpath,
+            "SimPEG_NeighbourCache",
+            hash_arrays(xyz_in, xyz_out).hexdigest() + "_neighbours.npy",
+        )
+        if os.path.exists(path):
+            try:
+                return np.load(path)
+            except (OSError, ValueError):
+                pass
+
+        _, indices = cKDTree(xyz_in).query(xyz_out, workers=-1)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as file:
+            np.save(file, indices)
+        os.replace(file.name, path)
+
+        return indices
 
     @property
     def model_type(self):
@@ -21,7 +21,7 @@ from copy import deepcopy
 import numpy as np
 from geoh5py.shared import Entity
 
-from geoapps.driver_base.utils import active_from_xyz
+from geoapps.driver_base.utils import TopographySurface, active_from_xyz
 from geoapps.inversion.components.data import InversionData
 from geoapps.inversion.components.locations import InversionLocations
 from geoapps.shared_utils.utils import filter_xy
@@ -64,6 +64,7 @@ class InversionTopography(InversionLocations):
         self.inversion_data = inversion_data
         self.locations: np.ndarray = None
         self.mask: np.ndarray = None
+        self._surface: TopographySurface | None = None
         self._initialize()
 
     def _initialize(self):
@@ -87,6 +88,17 @@ class InversionTopography(InversionLocations):
         if self.is_rotated:
             self.locations = super().rotate(self.locations)
 
+    @property
+    def surface(self) -> TopographySurface:
+        """
+        Topography surface of the locations, with its triangulation shared
+        by all active cells computations.
+        """
+        if self._surface is None:
+            self._surface = TopographySurface(self.locations)
+
+        return self._surface
+
     def active_cells(self, mesh: InversionMesh, data: InversionData) -> np.ndarray:
         """
         Return mask that restricts models to set of earth cells.
@@ -104,7 +116,7 @@ class InversionTopography(InversionLocations):
         ]
         if self.params.inversion_type in forced_to_surface:
             active_cells = active_from_xyz(
-                mesh.entity, self.locations, grid_reference="bottom"
+                mesh.entity, self.surface, grid_reference="bottom"
             )
             active_cells = active_cells[np.argsort(mesh.permutation)]
             print(
@@ -119,7 +131,7 @@ class InversionTopography(InversionLocations):
 
         else:
             active_cells = active_from_xyz(
-                mesh.entity, self.locations, grid_reference="center"
+                mesh.entity, self.surface, grid_reference="center"
             )
             active_cells = active_cells[np.argsort(mesh.permutation)]
 
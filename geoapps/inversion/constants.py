@@ -75,6 +75,24 @@ default_ui_json = {
         "max": 1000,
         "verbose": 2,
     },
+    "tile_method": {
+        "choiceList": ["kmeans", "balanced"],
+        "group": "Compute",
+        "label": "Tiling method",
+        "tooltip": "Balance the predicted cost of tiles: receivers times nested mesh cells, or receivers only for DC/IP surveys",
+        "value": "kmeans",
+        "verbose": 2,
+    },
+    "max_tile_memory": {
+        "min": 0.0,
+        "group": "Compute",
+        "optional": True,
+        "enabled": False,
+        "label": "Maximum memory per tile (GB)",
+        "tooltip": "Tiles are added until the predicted size of their sensitivities is below this limit",
+        "value": 2.0,
+        "verbose": 3,
+    },
     "output_tile_files": False,
     "z_from_topo": {
         "group": "Data pre-processing",
@@ -607,15 +625,71 @@ default_ui_json = {
     "chunk_by_rows": {
         "group": "Compute",
         "label": "Chunk by rows",
+        "tooltip": "Chunk sensitivities by rows, or in equal blocks along rows and columns",
         "value": True,
         "verbose": 3,
     },
+    "sensitivity_dtype": {
+        "choiceList": ["float64", "float32"],
+        "group": "Compute",
+        "label": "Sensitivity precision",
+        "tooltip": "Precision of sensitivities held in memory. Sensitivities stored on disk are always single precision",
+        "value": "float64",
+        "verbose": 3,
+    },
+    "sensitivity_compressor": {
+        "choiceList": ["lz4", "zstd", "none"],
+        "group": "Compute",
+        "label": "Sensitivity compression",
+        "tooltip": "Blosc codec applied to sensitivities stored on disk",
+        "value": "lz4",
+        "verbose": 3,
+    },
     "generate_sweep": {
         "label": "Generate sweep file",
         "group": "Python run preferences",
         "main": True,
         "value": False,
     },
+    "profile": {
+        "group": "Python run preferences",
+        "label": "Profile phases with cProfile",
+        "tooltip": "Dump a cProfile of each phase next to the timing profile of the run",
+        "value": False,
+        "verbose": 3,
+    },
+    "save_buffer_iterations": {
+        "min": 1,
+        "group": "Python run preferences",
+        "label": "Iterations buffered before saving",
+        "tooltip": "Number of iterations whose models and predicted data are held in memory before being written to geoh5",
+        "value": 1,
+        "verbose": 3,
+    },
+    "save_buffer_memory": {
+        "min": 0.0,
+        "group": "Python run preferences",
+        "optional": True,
+        "enabled": False,
+        "label": "Maximum buffered outputs (GB)",
+        "tooltip": "Buffered iterations are written to geoh5 once their size exceeds this limit",
+        "value": 1.0,
+        "verbose": 3,
+    },
+    "cache_tiles": {
+        "group": "Python run preferences",
+        "label": "Cache tile meshes on disk",
+        "tooltip": "Store the nested meshes and mappings of the tiles, for re-use by later runs on the same mesh and receivers",
+        "value": False,
+        "verbose": 3,
+    },
+    "cache_neighbours": {
+        "group": "Python run preferences",
+        "label": "Cache model interpolation on disk",
+        "tooltip": "Store the nearest neighbour maps used to interpolate models on the mesh, for re-use by later runs on the same mesh",
+        "value": False,
+        "verbose": 3,
+    },
     "max_ram": None,
     "monitoring_directory": None,
     "workspace_geoh5": None,
@@ -12,14 +12,21 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from geoapps.inversion import InversionBaseParams
 
+import cProfile
+import csv
+import json
 import multiprocessing
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from multiprocessing.pool import ThreadPool
-from time import time
+from queue import Queue
+from threading import Event, Lock, Thread
+from time import perf_counter, process_time, time
 
 import numpy as np
+import psutil
 from dask import config as dconf
 from dask.distributed import Client, LocalCluster, get_client
 from geoh5py.ui_json import InputFile
@@ -35,7 +42,12 @@ from geoapps.inversion.components import (
     InversionWindow,
 )
 from geoapps.inversion.components.factories import DirectivesFactory, MisfitFactory
+from geoapps.inversion.components.factories.directives_factory import (
+    BufferedSaveIterationsGeoH5,
+)
 from geoapps.inversion.params import InversionBaseParams
+from geoapps.inversion.utils import balanced_tiles
+from geoapps.utils.surveys import LineIndex
 
 
 class InversionDriver(BaseDriver):
@@ -59,10 +71,15 @@ class InversionDriver(BaseDriver):
         self.survey = None
         self.active_cells = None
         self.running = False
+        self._iteration = None
 
         self.logger = InversionLogger("SimPEG.log", self)
         sys.stdout = self.logger
         self.logger.start()
+        self.profiler = InversionProfiler(
+            self.logger.get_path("SimPEG_profile"), cprofile=bool(params.profile)
+        )
+        self.writer = InversionWriter()
 
         with self.workspace.open(mode="r+"):
             self.initialize()
@@ -101,21 +118,29 @@ class InversionDriver(BaseDriver):
 
         self.configure_dask()
 
-        self.inversion_window = InversionWindow(self.workspace, self.params)
-
-        self.inversion_data = InversionData(self.workspace, self.params, self.window)
+        with self.profiler.phase("data"):
+            self.inversion_window = InversionWindow(self.workspace, self.params)
+            self.inversion_data = InversionData(
+                self.workspace, self.params, self.window
+            )
 
-        self.inversion_topography = InversionTopography(
-            self.workspace, self.params, self.inversion_data, self.window
-        )
+        with self.profiler.phase("topography"):
+            self.inversion_topography = InversionTopography(
+                self.workspace, self.params, self.inversion_data, self.window
+            )
 
-        self.inversion_mesh = InversionMesh(
-            self.workspace, self.params, self.inversion_data, self.inversion_topography
-        )
+        with self.profiler.phase("mesh"):
+            self.inversion_mesh = InversionMesh(
+                self.workspace,
+                self.params,
+                self.inversion_data,
+                self.inversion_topography,
+            )
 
-        self.models = InversionModelCollection(
-            self.workspace, self.params, self.inversion_mesh
-        )
+        with self.profiler.phase("models"):
+            self.models = InversionModelCollection(
+                self.workspace, self.params, self.inversion_mesh
+            )
 
         # TODO Need to setup/test workers with address
         if self.params.distributed_workers is not None:
@@ -126,36 +151,44 @@ class InversionDriver(BaseDriver):
                 Client(cluster)
 
         # Build active cells array and reduce models active set
-        self.active_cells = self.inversion_topography.active_cells(
-            self.inversion_mesh, self.inversion_data
-        )
+        with self.profiler.phase("active cells"):
+            self.active_cells = self.inversion_topography.active_cells(
+                self.inversion_mesh, self.inversion_data
+            )
+
+            self.models.edit_ndv_model(
+                self.inversion_mesh.entity.get_data("active_cells")[0].values.astype(
+                    bool
+                )
+            )
+            self.models.remove_air(self.active_cells)
 
-        self.models.edit_ndv_model(
-            self.inversion_mesh.entity.get_data("active_cells")[0].values.astype(bool)
-        )
-        self.models.remove_air(self.active_cells)
         self.n_cells = int(np.sum(self.active_cells))
         self.is_vector = self.models.is_vector
         self.n_blocks = 3 if self.is_vector else 1
         self.is_rotated = False if self.inversion_mesh.rotation is None else True
 
         # Create SimPEG Survey object
-        self.survey = self.inversion_data.survey
+        with self.profiler.phase("survey"):
+            self.survey = self.inversion_data.survey
 
         # Tile locations
-        self.tiles = self.get_tiles()  # [np.arange(len(self.survey.source_list))]#
+        with self.profiler.phase("tiles"):
+            self.tiles = self.get_tiles()
 
         self.n_tiles = len(self.tiles)
         print(f"Setting up {self.n_tiles} tile(s) . . .")
         # Build tiled misfits and combine to form global misfit
 
-        self.global_misfit, self.sorting = MisfitFactory(
-            self.params, models=self.models
-        ).build(self.tiles, self.inversion_data, self.mesh, self.active_cells)
+        with self.profiler.phase("misfits", n_tiles=self.n_tiles):
+            self.global_misfit, self.sorting = MisfitFactory(
+                self.params, models=self.models
+            ).build(self.tiles, self.inversion_data, self.mesh, self.active_cells)
         print("Done.")
 
         # Create regularization
-        self.regularization = self.get_regularization()
+        with self.profiler.phase("regularization"):
+            self.regularization = self.get_regularization()
 
         # Specify optimization algorithm and set parameters
         self.optimization = optimization.ProjectedGNCG(
@@ -179,23 +212,27 @@ class InversionDriver(BaseDriver):
 
         if self.warmstart and not self.params.forward_only:
             print("Pre-computing sensitivities . . .")
-            self.inverse_problem.dpred = self.inversion_data.simulate(  # pylint: disable=assignment-from-no-return
-                self.starting_model, self.inverse_problem, self.sorting
-            )
+            with self.profiler.phase("sensitivities"):
+                self.inverse_problem.dpred = self.inversion_data.simulate(  # pylint: disable=assignment-from-no-return
+                    self.starting_model, self.inverse_problem, self.sorting
+                )
 
         # If forward only option enabled, stop here
         if self.params.forward_only:
             return
 
         # Add a list of directives to the inversion
-        self.directive_list = DirectivesFactory(self.params).build(
-            self.inversion_data,
-            self.inversion_mesh,
-            self.active_cells,
-            np.argsort(np.hstack(self.sorting)),
-            self.global_misfit,
-            self.regularization,
-        )
+        with self.profiler.phase("directives"):
+            self.directive_list = DirectivesFactory(
+                self.params, writer=self.writer
+            ).build(
+                self.inversion_data,
+                self.inversion_mesh,
+                self.active_cells,
+                np.argsort(np.hstack(self.sorting)),
+                self.global_misfit,
+                self.regularization,
+            )
 
         # Put all the parts together
         self.inversion = inversion.BaseInversion(
@@ -204,20 +241,79 @@ class InversionDriver(BaseDriver):
 
     def run(self):
         """Run inversion from params"""
+        try:
+            if self.params.forward_only:
+                print("Running the forward simulation ...")
+                with self.profiler.phase("forward"):
+                    self.inversion_data.simulate(
+                        self.starting_model, self.inverse_problem, self.sorting
+                    )
+            else:
+                # Run the inversion
+                self.start_inversion_message()
+                self.running = True
+                self.profile_inversion()
+                if not self.warmstart:
+                    self.inversion_data.check_sensitivity_stores(self.inverse_problem)
+                self.inversion.run(self.starting_model)
+                self.profiler.end(self._iteration)
+                self.inversion_data.complete_sensitivity_stores(self.inverse_problem)
+        except BaseException:
+            # Save what the failed run has produced, without masking its error
+            try:
+                self.close_outputs()
+            except Exception as error:  # pylint: disable=broad-except
+                print(f"Closing the inversion outputs failed: {error}")
+            raise
 
-        if self.params.forward_only:
-            print("Running the forward simulation ...")
-            self.inversion_data.simulate(
-                self.starting_model, self.inverse_problem, self.sorting
+        self.close_outputs()
+        self.logger.end()
+
+    def close_outputs(self):
+        """
+        Write the iterations held by the save directives, wait for the pending
+        writes to geoh5 and close the profile.
+        """
+        try:
+            if not self.params.forward_only:
+                for directive in self.inversion.directiveList.dList:
+                    if isinstance(directive, BufferedSaveIterationsGeoH5):
+                        directive.flush()
+        finally:
+            try:
+                self.writer.close()
+            finally:
+                self.profiler.close()
+
+    def profile_inversion(self):
+        """
+        Record the directives and the iterations of the inversion as phases
+        of the profile.
+        """
+        for directive in self.inversion.directiveList.dList:
+            for rule in ["initialize", "endIter", "finish"]:
+                setattr(
+                    directive,
+                    rule,
+                    self.profiler.wrap(
+                        getattr(directive, rule), f"{type(directive).__name__}.{rule}"
+                    ),
+                )
+
+        callback = self.optimization.callback
+        cg_count = [getattr(self.optimization, "cg_count", 0)]
+
+        def profiled_callback(xt):
+            count = getattr(self.optimization, "cg_count", 0)
+            self.profiler.end(self._iteration, cg_iterations=count - cg_count[0])
+            cg_count[0] = count
+            callback(xt)
+            self._iteration = self.profiler.begin(
+                f"iteration {self.optimization.iter + 1}"
             )
-            self.logger.end()
-            return
 
-        # Run the inversion
-        self.start_inversion_message()
-        self.running = True
-        self.inversion.run(self.starting_model)
-        self.logger.end()
+        self.optimization.callback = profiled_callback
+        self._iteration = self.profiler.begin("iteration 1")
 
     def start_inversion_message(self):
 
@@ -311,32 +407,18 @@ class InversionDriver(BaseDriver):
             "direct current 3d",
             "induced polarization 3d",
         ]:
-            tiles = []
-            potential_electrodes = self.inversion_data.entity
-            current_electrodes = potential_electrodes.current_electrodes
-            line_split = np.array_split(
-                current_electrodes.unique_parts, self.params.tile_spatial
+            tiles = self.get_line_tiles(
+                self.inversion_data.entity,
+                self.params.tile_spatial,
+                balanced=self.params.tile_method == "balanced",
             )
-            for split in line_split:
-                split_ind = []
-                for line in split:
-                    electrode_ind = current_electrodes.parts == line
-                    cells_ind = np.where(
-                        np.any(electrode_ind[current_electrodes.cells], axis=1)
-                    )[0]
-                    split_ind.append(cells_ind)
-                # Fetch all receivers attached to the currents
-                logical = np.zeros(current_electrodes.n_cells, dtype="bool")
-                if len(split_ind) > 0:
-                    logical[np.hstack(split_ind)] = True
-                    tiles.append(
-                        np.where(logical[potential_electrodes.ab_cell_id.values - 1])[0]
-                    )
 
             # TODO Figure out how to handle a tile_spatial object to replace above
 
         elif "2d" in self.params.inversion_type:
             tiles = [self.inversion_data.indices]
+        elif self.params.tile_method == "balanced":
+            tiles = self.get_balanced_tiles()
         else:
             tiles = tile_locations(
                 self.locations,
@@ -346,6 +428,85 @@ class InversionDriver(BaseDriver):
 
         return tiles
 
+    @staticmethod
+    def get_line_tiles(potential_electrodes, n_tiles: int, balanced: bool = False):
+        """
+        Tile the receivers of a DC/IP survey by groups of current lines.
+
+        :param potential_electrodes: Potential electrodes of the survey.
+        :param n_tiles: Number of tiles.
+        :param balanced: Group lines to balance the number of receivers per
+            tile, rather than the number of lines.
+
+        :return: List of receiver indices per tile.
+        """
+        current_electrodes = potential_electrodes.current_electrodes
+        lines = np.asarray(current_electrodes.unique_parts)
+        sorter = np.argsort(lines)
+        vertex_lines = sorter[
+            np.searchsorted(lines, current_electrodes.parts, sorter=sorter)
+        ]
+
+        # Lines of the A and B electrodes of the current of every receiver
+        receiver_lines = vertex_lines[current_electrodes.cells][
+            potential_electrodes.ab_cell_id.values - 1
+        ]
+
+        if balanced:
+            same = receiver_lines[:, 0] == receiver_lines[:, 1]
+            counts = np.bincount(
+                receiver_lines[:, 0], minlength=len(lines)
+            ) + np.bincount(receiver_lines[~same, 1], minlength=len(lines))
+            centers = (np.cumsum(counts) - counts / 2.0) / max(counts.sum(), 1)
+            line_tiles = np.minimum((centers * n_tiles).astype(int), n_tiles - 1)
+        else:
+            line_tiles = np.repeat(
+                np.arange(n_tiles),
+                [len(split) for split in np.array_split(lines, n_tiles)],
+            )
+
+        receiver_tiles = line_tiles[receiver_lines]
+        tile_index = [LineIndex(receiver_tiles[:, ind]) for ind in range(2)]
+
+        return [
+            np.union1d(tile_index[0].get(tile), tile_index[1].get(tile))
+            for tile in np.unique(line_tiles).tolist()
+        ]
+
+    def get_balanced_tiles(self):
+        """
+        Tile the receivers to balance the size of sensitivities, estimated as
+        the number of data times the number of active cells of the nested
+        mesh of each tile, under the maximum memory per tile.
+        """
+        dtype = getattr(self.params, "sensitivity_dtype", None) or "float64"
+        bytes_per_entry = (
+            self.survey.nD
+            / self.locations.shape[0]
+            * self.n_blocks
+            * np.dtype(dtype).itemsize
+        )
+        max_cost = None
+        if self.params.max_tile_memory is not None:
+            max_cost = self.params.max_tile_memory * 1e9 / bytes_per_entry
+
+        tiles, costs = balanced_tiles(
+            self.locations,
+            self.mesh,
+            self.active_cells,
+            self.params.tile_spatial,
+            max_cost=max_cost,
+            padding_cells=6,
+        )
+        for count, (tile, cost) in enumerate(zip(tiles, costs)):
+            print(
+                f"Tile {count + 1}/{len(tiles)}: {len(tile)} receivers, "
+                f"{cost / len(tile):.0f} nested cells, "
+                f"{cost * bytes_per_entry * 1e-9:.2f} GB predicted"
+            )
+
+        return tiles
+
     def configure_dask(self):
         """Sets Dask config settings."""
 
@@ -402,6 +563,210 @@ class InversionLogger:
         return os.path.join(root_directory, file)
 
 
+class InversionWriter:
+    """
+    Write the outputs of an inversion from a single background thread, so
+    that the iterations do not wait on the geoh5 file.
+
+    Writes are run in the order they are submitted. The first error raised by
+    a write is re-raised on the next submission, or when closing the writer.
+
+    :param max_size: Number of pending writes above which submissions wait.
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.queue: Queue = Queue(maxsize=max_size)
+        self.error: BaseException | None = None
+        self._thread: Thread | None = None
+
+    def submit(self, func, *args):
+        """
+        Queue a write.
+
+        :param func: Function writing the outputs.
+        :param args: Arguments of the function, not to be modified afterwards.
+        """
+        self.check()
+        if self._thread is None:
+            self._thread = Thread(target=self._write, daemon=True)
+            self._thread.start()
+
+        self.queue.put((func, args))
+
+    def check(self):
+        """Raise the error of a failed write."""
+        if self.error is not None:
+            raise RuntimeError("Writing the inversion outputs failed.") from self.error
+
+    def close(self):
+        """Wait for the pending writes and stop the thread."""
+        if self._thread is not None:
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        self.check()
+
+    def _write(self):
+        while True:
+            task = self.queue.get()
+            if task is None:
+                return
+
+            func, args = task
+            if self.error is None:
+                try:
+                    func(*args)
+                except Exception as error:  # pylint: disable=broad-except
+                    self.error = error
+
+
+class InversionProfiler:
+    """
+    Record the wall time, CPU time and resident memory of the phases of an
+    inversion, written as JSON and CSV files.
+
+    :param path: Path to the profile files, without extension.
+    :param cprofile: Dump a cProfile of each top-level phase.
+    :param interval: Sampling interval of the resident memory, in seconds.
+    """
+
+    fields = [
+        "phase",
+        "start",
+        "wall_time",
+        "cpu_time",
+        "rss_start",
+        "rss_end",
+        "peak_rss",
+    ]
+
+    def __init__(self, path: str, cprofile: bool = False, interval: float = 0.05):
+        self.path = path
+        self.cprofile = cprofile
+        self.interval = interval
+        self.phases: list[dict] = []
+        self.initial_time = perf_counter()
+        self._process = psutil.Process()
+        self._active: list[dict] = []
+        self._lock = Lock()
+        self._stop = Event()
+        self._sampler = Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+
+    def _sample(self):
+        """Update the peak memory of the active phases."""
+        while not self._stop.wait(self.interval):
+            self._update_peak()
+
+    def _update_peak(self) -> int:
+        rss = self._process.memory_info().rss
+        with self._lock:
+            for record in self._active:
+                record["peak_rss"] = max(record["peak_rss"], rss)
+
+        return rss
+
+    def begin(self, name: str, **info) -> dict:
+        """
+        Start recording a phase.
+
+        :param name: Name of the phase.
+        :param info: Additional values stored with the phase.
+
+        :return: Record of the phase, to pass to :meth:`end`.
+        """
+        rss = self._process.memory_info().rss
+        record = {"phase": name, "rss_start": rss, "peak_rss": rss, **info}
+
+        with self._lock:
+            if self.cprofile and not any("_profile" in rec for rec in self._active):
+                record["_profile"] = cProfile.Profile()
+                record["_profile"].enable()
+            self._active.append(record)
+
+        record["_times"] = perf_counter(), process_time()
+        record["start"] = record["_times"][0] - self.initial_time
+
+        return record
+
+    def end(self, record: dict | None, **info):
+        """
+        Stop recording a phase and write the profile.
+
+        :param record: Record returned by :meth:`begin`.
+        :param info: Additional values stored with the phase.
+        """
+        if record is None or not any(rec is record for rec in self._active):
+            return
+
+        wall, cpu = record.pop("_times")
+        record["wall_time"] = perf_counter() - wall
+        record["cpu_time"] = process_time() - cpu
+        record["rss_end"] = self._update_peak()
+        record.update(info)
+
+        with self._lock:
+            self._active = [rec for rec in self._active if rec is not record]
+
+        profile = record.pop("_profile", None)
+        if profile is not None:
+            profile.disable()
+            name = "".join(char if char.isalnum() else "_" for char in record["phase"])
+            profile.dump_stats(f"{self.path}_{len(self.phases)}_{name}.prof")
+
+        self.phases.append(record)
+        self.write()
+
+    @contextmanager
+    def phase(self, name: str, **info):
+        """
+        Record the enclosed code as a phase.
+
+        :param name: Name of the phase.
+        :param info: Additional values stored with the phase.
+        """
+        record = self.begin(name, **info)
+        try:
+            yield record
+        finally:
+            self.end(record)
+
+    def wrap(self, method, name: str):
+        """
+        Record every call of a method as a phase.
+
+        :param method: Method to profile.
+        :param name: Name of the phase.
+
+        :return: Profiled method.
+        """
+
+        def profiled(*args, **kwargs):
+            with self.phase(name):
+                return method(*args, **kwargs)
+
+        return profiled
+
+    def write(self):
+        """Write the phases recorded to JSON and CSV files."""
+        with open(self.path + ".json", "w", encoding="utf8") as file:
+            json.dump(self.phases, file, indent=2)
+
+        fields = self.fields + sorted(
+            {key for record in self.phases for key in record} - set(self.fields)
+        )
+        with open(self.path + ".csv", "w", encoding="utf8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.phases)
+
+    def close(self):
+        """Stop sampling the memory and write the profile."""
+        self._stop.set()
+        self.write()
+
+
 if __name__ == "__main__":
 
     from . import DRIVER_MAP
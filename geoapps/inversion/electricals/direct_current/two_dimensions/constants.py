@@ -97,6 +97,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "potential_channel_bool": True,
 }
 forward_defaults = {
@@ -144,6 +149,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
@@ -418,7 +428,7 @@ default_ui_json = dict(base_default_ui_json, **default_ui_json)
 validations = {
     "inversion_type": {
         "required": True,
-        "values": ["direct current 2d"],
+        "values": ["direct current 2d", "direct current pseudo 3d"],
     },
     "data_object": {"required": True, "types": [UUID, PotentialElectrode]},
 }
@@ -7,6 +7,7 @@
 
 
 from geoapps.inversion.driver import InversionDriver
+from geoapps.inversion.electricals.driver import BasePseudo3DDriver
 
 from .constants import validations
 from .params import DirectCurrent2DParams
@@ -19,3 +20,13 @@ class DirectCurrent2DDriver(InversionDriver):
 
     def __init__(self, params: DirectCurrent2DParams, warmstart=True):
         super().__init__(params, warmstart)
+
+
+class DirectCurrentPseudo3DDriver(BasePseudo3DDriver):
+
+    _params_class = DirectCurrent2DParams
+    _validations = validations
+    _line_driver = DirectCurrent2DDriver
+
+    def __init__(self, params: DirectCurrent2DParams):
+        super().__init__(params)
@@ -0,0 +1,206 @@
+#  Copyright (c) 2023 Mira Geoscience Ltd.
+#
+#  This file is part of geoapps.
+#
+#  geoapps is distributed under the terms and conditions of the MIT License
+#  (see LICENSE file at the root of this source code package).
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from copy import deepcopy
+from uuid import UUID
+
+from geoh5py.data import Data
+from geoh5py.objects import ObjectBase
+from geoh5py.workspace import Workspace
+
+from geoapps.driver_base.driver import BaseDriver
+from geoapps.inversion.driver import InversionDriver
+from geoapps.inversion.params import InversionBaseParams
+from geoapps.utils.surveys import LineIndex
+
+
+def run_line(driver_class: type[InversionDriver], input_file: str) -> UUID:
+    """
+    Run the 2D inversion of a single line in its own workspace.
+
+    :param driver_class: 2D inversion driver.
+    :param input_file: Path to the ui.json file of the line.
+
+    :return: Uid of the output group of the line.
+    """
+    driver = driver_class.start(input_file)
+    driver.logger.log.close()
+
+    return driver.params.ga_group.uid
+
+
+class BasePseudo3DDriver(BaseDriver):
+    """
+    Invert all the lines of a DC/IP survey with a 2D driver, running the lines
+    concurrently in a process pool.
+
+    The inputs are read once from the workspace and copied into a workspace
+    shared by all lines. Each line runs on its own copy of it, on a drape model
+    built from the mesh parameters, and the results are written back to the
+    workspace one line at a time as lines complete.
+    """
+
+    _params_class = InversionBaseParams
+    _line_driver: type[InversionDriver] = InversionDriver
+
+    def __init__(self, params: InversionBaseParams):
+        super().__init__(params)
+        self._workpath: str | None = None
+
+    @property
+    def line_ids(self) -> list[int]:
+        """
+        Identifiers of the lines of the survey.
+        """
+        ids = LineIndex(self.params.line_object.values).ids
+        return [int(line_id) for line_id in ids if line_id >= 1]
+
+    @property
+    def workpath(self) -> str:
+        """
+        Directory of the line workspaces, created once per run so that
+        concurrent runs sharing a workpath do not overwrite each other.
+        """
+        if self._workpath is None:
+            self._workpath = tempfile.mkdtemp(
+                prefix="Pseudo3D_", dir=self.params.workpath
+            )
+
+        return self._workpath
+
+    def run(self):
+        """Run the 2D inversion of all lines and collect the results."""
+        line_ids = self.line_ids
+        n_workers = min(
+            len(line_ids),
+            self.params.n_cpu or max(int(multiprocessing.cpu_count() / 2), 1),
+        )
+        done = []
+        try:
+            input_files = self.write_line_inputs(line_ids)
+            print(f"Inverting {len(line_ids)} line(s) on {n_workers} process(es) . . .")
+            with ProcessPoolExecutor(
+                max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                futures = {
+                    executor.submit(run_line, self._line_driver, input_file): line_id
+                    for line_id, input_file in zip(line_ids, input_files)
+                }
+                for future in as_completed(futures):
+                    line_id = futures[future]
+                    try:
+                        group_uid = future.result()
+                    except Exception as error:  # pylint: disable=broad-except
+                        print(f"Line {line_id} failed: {error}")
+                        continue
+
+                    self.write_line_results(
+                        input_files[line_ids.index(line_id)], group_uid
+                    )
+                    done.append(line_id)
+                    print(f"Line {line_id} done.")
+        finally:
+            self.clean_workpath(line_ids, done)
+
+        failed = [line_id for line_id in line_ids if line_id not in done]
+        if failed:
+            raise RuntimeError(f"Inversion of line(s) {failed} failed.")
+
+    def clean_workpath(self, line_ids: list[int], done: list[int]):
+        """
+        Remove the workspaces of the lines merged into the results, keeping
+        those of the other lines for debugging.
+
+        :param line_ids: Identifiers of all lines.
+        :param done: Identifiers of the lines merged into the results.
+        """
+        if self._workpath is None:
+            return
+
+        kept = [line_id for line_id in line_ids if line_id not in done]
+        if not kept:
+            shutil.rmtree(self.workpath, ignore_errors=True)
+            return
+
+        for line_id in done:
+            shutil.rmtree(
+                os.path.join(self.workpath, f"Line {line_id}"), ignore_errors=True
+            )
+
+        print(f"Workspaces of line(s) {kept} kept in {self.workpath}")
+
+    def write_line_inputs(self, line_ids: list[int]) -> list[str]:
+        """
+        Copy the input entities to a shared workspace and write the ui.json
+        file of each line, pointing to its own copy of the workspace.
+
+        :param line_ids: Identifiers of the lines to invert.
+
+        :return: Paths to the ui.json files of the lines.
+        """
+        # Copy the ui.json structure, but share the workspace and its entities
+        memo = {id(value): value for value in self.params.input_file.data.values()}
+        input_file = deepcopy(self.params.input_file, memo)
+        inputs = os.path.join(self.workpath, "inputs.geoh5")
+        with Workspace(inputs) as workspace:
+            for key, value in input_file.data.items():
+                if key == "mesh":
+                    continue
+                if isinstance(value, Data):
+                    value = value.parent
+                if (
+                    isinstance(value, ObjectBase)
+                    and workspace.get_entity(value.uid)[0] is None
+                ):
+                    value.copy(parent=workspace, copy_children=True)
+
+        out_group = getattr(self.params.out_group, "name", self.params.out_group)
+        if out_group is None:
+            out_group = self.params.defaults["out_group"]
+
+        input_files = []
+        for line_id in line_ids:
+            path = os.path.join(self.workpath, f"Line {line_id}")
+            os.makedirs(path)
+            geoh5 = os.path.join(path, f"Line {line_id}.geoh5")
+            shutil.copyfile(inputs, geoh5)
+
+            input_file.data.update(
+                {
+                    "geoh5": geoh5,
+                    "inversion_type": self.params.inversion_type,
+                    "line_id": line_id,
+                    "mesh": None,
+                    "out_group": f"{out_group} Line {line_id}",
+                    "n_cpu": 1,
+                    "monitoring_directory": None,
+                }
+            )
+            input_files.append(
+                input_file.write_ui_json(name=f"Line {line_id}.ui.json", path=path)
+            )
+
+        return input_files
+
+    def write_line_results(self, input_file: str, group_uid: UUID):
+        """
+        Copy the output group of a line to the output group of the survey.
+
+        :param input_file: Path to the ui.json file of the line.
+        :param group_uid: Uid of the output group of the line.
+        """
+        geoh5 = input_file.replace(".ui.json", ".geoh5")
+        with Workspace(geoh5, mode="r") as workspace:
+            group = workspace.get_entity(group_uid)[0]
+            group.copy(parent=self.params.ga_group, copy_children=True)
@@ -79,6 +79,7 @@ inversion_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
     "max_ram": None,
     "store_sensitivities": "ram",
     "max_chunk_size": 128,
@@ -90,6 +91,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "chargeability_channel_bool": True,
 }
 
@@ -123,6 +129,7 @@ forward_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
     "max_chunk_size": 128,
     "chunk_by_rows": True,
     "out_group": "InducedPolarizationForward",
@@ -132,6 +139,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
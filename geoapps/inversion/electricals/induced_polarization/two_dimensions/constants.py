@@ -98,6 +98,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "chargeability_channel_bool": True,
 }
 forward_defaults = {
@@ -146,6 +151,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
@@ -433,7 +443,7 @@ default_ui_json = dict(base_default_ui_json, **default_ui_json)
 validations = {
     "inversion_type": {
         "required": True,
-        "values": ["induced polarization 2d"],
+        "values": ["induced polarization 2d", "induced polarization pseudo 3d"],
     },
     "data_object": {"required": True, "types": [UUID, PotentialElectrode]},
 }
@@ -6,6 +6,7 @@
 #  (see LICENSE file at the root of this source code package).
 
 from geoapps.inversion.driver import InversionDriver
+from geoapps.inversion.electricals.driver import BasePseudo3DDriver
 
 from .constants import validations
 from .params import InducedPolarization2DParams
@@ -18,3 +19,13 @@ class InducedPolarization2DDriver(InversionDriver):
 
     def __init__(self, params: InducedPolarization2DParams, warmstart=True):
         super().__init__(params, warmstart)
+
+
+class InducedPolarizationPseudo3DDriver(BasePseudo3DDriver):
+
+    _params_class = InducedPolarization2DParams
+    _validations = validations
+    _line_driver = InducedPolarization2DDriver
+
+    def __init__(self, params: InducedPolarization2DParams):
+        super().__init__(params)
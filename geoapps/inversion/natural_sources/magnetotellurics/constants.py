@@ -95,6 +95,8 @@ inversion_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "store_sensitivities": "ram",
     "max_ram": None,
     "max_chunk_size": 128,
@@ -106,6 +108,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "zxx_real_channel_bool": False,
     "zxx_imag_channel_bool": False,
     "zxy_real_channel_bool": False,
@@ -152,6 +159,8 @@ forward_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "max_chunk_size": 128,
     "chunk_by_rows": True,
     "out_group": "MagnetotelluricsForward",
@@ -161,6 +170,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
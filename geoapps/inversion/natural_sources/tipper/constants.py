@@ -86,6 +86,8 @@ inversion_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "max_ram": None,
     "store_sensitivities": "ram",
     "max_chunk_size": 128,
@@ -97,6 +99,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "txz_real_channel_bool": False,
     "txz_imag_channel_bool": False,
     "tyz_real_channel_bool": False,
@@ -135,6 +142,8 @@ forward_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "max_chunk_size": 128,
     "chunk_by_rows": True,
     "out_group": "TipperForward",
@@ -144,6 +153,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
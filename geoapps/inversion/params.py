@@ -44,6 +44,8 @@ class InversionBaseParams(BaseParams):
         self._data_object: UUID = None
         self._starting_model: UUID | float = None
         self._tile_spatial = None
+        self._tile_method: str = None
+        self._max_tile_memory: float = None
         self._z_from_topo: bool = None
         self._receivers_radar_drape = None
         self._receivers_offset_x: float = None
@@ -56,6 +58,8 @@ class InversionBaseParams(BaseParams):
         self._detrend_type: str = None
         self._max_chunk_size: int = None
         self._chunk_by_rows: bool = None
+        self._sensitivity_dtype: str = None
+        self._sensitivity_compressor: str = None
         self._output_tile_files: bool = None
         self._mesh = None
         self._window_azimuth: float = None
@@ -102,6 +106,11 @@ class InversionBaseParams(BaseParams):
         self._out_group = None
         self._no_data_value: float = None
         self._distributed_workers = None
+        self._profile: bool = None
+        self._save_buffer_iterations: int = None
+        self._save_buffer_memory: float = None
+        self._cache_tiles: bool = None
+        self._cache_neighbours: bool = None
         self._documentation: str = None
         self._icon: str = None
         self._defaults = (
@@ -291,6 +300,22 @@ class InversionBaseParams(BaseParams):
     def tile_spatial(self, val):
         self.setter_validator("tile_spatial", val, fun=self._uuid_promoter)
 
+    @property
+    def tile_method(self):
+        return self._tile_method
+
+    @tile_method.setter
+    def tile_method(self, val):
+        self.setter_validator("tile_method", val)
+
+    @property
+    def max_tile_memory(self):
+        return self._max_tile_memory
+
+    @max_tile_memory.setter
+    def max_tile_memory(self, val):
+        self.setter_validator("max_tile_memory", val)
+
     @property
     def z_from_topo(self):
         return self._z_from_topo
@@ -395,6 +420,22 @@ class InversionBaseParams(BaseParams):
     def chunk_by_rows(self, val):
         self.setter_validator("chunk_by_rows", val)
 
+    @property
+    def sensitivity_dtype(self):
+        return self._sensitivity_dtype
+
+    @sensitivity_dtype.setter
+    def sensitivity_dtype(self, val):
+        self.setter_validator("sensitivity_dtype", val)
+
+    @property
+    def sensitivity_compressor(self):
+        return self._sensitivity_compressor
+
+    @sensitivity_compressor.setter
+    def sensitivity_compressor(self, val):
+        self.setter_validator("sensitivity_compressor", val)
+
     @property
     def output_tile_files(self):
         return self._output_tile_files
@@ -773,3 +814,43 @@ class InversionBaseParams(BaseParams):
     @distributed_workers.setter
     def distributed_workers(self, val):
         self.setter_validator("distributed_workers", val)
+
+    @property
+    def profile(self):
+        return self._profile
+
+    @profile.setter
+    def profile(self, val):
+        self.setter_validator("profile", val)
+
+    @property
+    def save_buffer_iterations(self):
+        return self._save_buffer_iterations
+
+    @save_buffer_iterations.setter
+    def save_buffer_iterations(self, val):
+        self.setter_validator("save_buffer_iterations", val)
+
+    @property
+    def save_buffer_memory(self):
+        return self._save_buffer_memory
+
+    @save_buffer_memory.setter
+    def save_buffer_memory(self, val):
+        self.setter_validator("save_buffer_memory", val)
+
+    @property
+    def cache_tiles(self):
+        return self._cache_tiles
+
+    @cache_tiles.setter
+    def cache_tiles(self, val):
+        self.setter_validator("cache_tiles", val)
+
+    @property
+    def cache_neighbours(self):
+        return self._cache_neighbours
+
+    @cache_neighbours.setter
+    def cache_neighbours(self, val):
+        self.setter_validator("cache_neighbours", val)
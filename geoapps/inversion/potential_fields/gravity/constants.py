@@ -99,10 +99,14 @@ inversion_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "store_sensitivities": "ram",
     "max_ram": None,
     "max_chunk_size": 128,
     "chunk_by_rows": True,
+    "sensitivity_dtype": "float64",
+    "sensitivity_compressor": "lz4",
     "out_group": "GravityInversion",
     "generate_sweep": False,
     "monitoring_directory": None,
@@ -110,6 +114,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gz_channel_bool": False,
     "guv_channel_bool": False,
     "gxy_channel_bool": False,
@@ -159,6 +168,8 @@ forward_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "max_chunk_size": 128,
     "chunk_by_rows": True,
     "out_group": "GravityForward",
@@ -168,6 +179,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
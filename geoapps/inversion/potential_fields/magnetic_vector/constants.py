@@ -106,10 +106,14 @@ inversion_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "store_sensitivities": "ram",
     "max_ram": None,
     "max_chunk_size": 128,
     "chunk_by_rows": True,
+    "sensitivity_dtype": "float64",
+    "sensitivity_compressor": "lz4",
     "out_group": "MagneticVectorInversion",
     "generate_sweep": False,
     "monitoring_directory": None,
@@ -117,6 +121,11 @@ inversion_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "tmi_channel_bool": False,
     "bxx_channel_bool": False,
     "bxy_channel_bool": False,
@@ -172,6 +181,8 @@ forward_defaults = {
     "parallelized": True,
     "n_cpu": None,
     "tile_spatial": 1,
+    "tile_method": "kmeans",
+    "max_tile_memory": None,
     "max_chunk_size": 128,
     "chunk_by_rows": True,
     "out_group": "MagneticVectorForward",
@@ -181,6 +192,11 @@ forward_defaults = {
     "run_command": "geoapps.inversion.driver",
     "conda_environment": "geoapps",
     "distributed_workers": None,
+    "profile": False,
+    "save_buffer_iterations": 1,
+    "save_buffer_memory": None,
+    "cache_tiles": False,
+    "cache_neighbours": False,
     "gradient_type": "total",
     "alpha_s": 1.0,
     "alpha_x": 1.0,
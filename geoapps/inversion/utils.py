@@ -7,8 +7,15 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+from tempfile import NamedTemporaryFile
+
 import numpy as np
-from scipy.spatial import ConvexHull
+from discretize import TreeMesh
+from scipy import sparse
+from scipy.spatial import ConvexHull, cKDTree
+from SimPEG import maps
 
 
 def calculate_2D_trend(
@@ -98,3 +105,241 @@ def calculate_2D_trend(
         f"Removed {order}th order polynomial trend with mean: {np.mean(data_trend):.6g}"
     )
     return data_trend, params
+
+
+def hash_arrays(*arrays: np.ndarray, digest=None):
+    """
+    Hash the type, shape and content of arrays.
+
+    :param arrays: Arrays to hash.
+    :param digest: Existing :obj:`hashlib.sha256` digest to update, a copy
+        is made so that the input digest can be re-used.
+
+    :return: Updated :obj:`hashlib.sha256` digest.
+    """
+    digest = hashlib.sha256() if digest is None else digest.copy()
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(memoryview(array).cast("B"))
+
+    return digest
+
+
+class StoredTileMap(maps.TileMap):
+    """
+    TileMap with a projection stored by :func:`save_tile_mapping`, so that
+    the containing cells of the global mesh are not searched again.
+
+    :param global_mesh: Global TreeMesh of the inversion.
+    :param global_active: Active cells of the global mesh.
+    :param local_mesh: Nested TreeMesh of the tile.
+    :param projection: Stored projection from the global to the local mesh.
+    :param local_active: Stored active cells of the local mesh.
+    """
+
+    def __init__(
+        self,
+        global_mesh: TreeMesh,
+        global_active: np.ndarray,
+        local_mesh: TreeMesh,
+        projection: sparse.spmatrix,
+        local_active: np.ndarray,
+        **kwargs,
+    ):
+        self._stored_projection = projection
+        super().__init__(global_mesh, global_active, local_mesh, **kwargs)
+        self.local_active = local_active
+
+    @property
+    def projection(self):
+        """
+        Stored projection matrix with partial volumes.
+        """
+        return self._stored_projection
+
+
+def save_tile_mapping(path: str, nested_mesh: TreeMesh, mapping: maps.TileMap):
+    """
+    Store the nested mesh and projection of a TileMap on disk.
+
+    :param path: File path without extension.
+    :param nested_mesh: Local TreeMesh of the tile.
+    :param mapping: TileMap from the global to the nested mesh.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    indexes, levels = nested_mesh.__getstate__()
+
+    # Write to temporary files first so that incomplete entries are never read
+    with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as file:
+        np.savez(
+            file,
+            h0=nested_mesh.h[0],
+            h1=nested_mesh.h[1],
+            h2=nested_mesh.h[2],
+            x0=nested_mesh.x0,
+            indexes=indexes,
+            levels=levels,
+            local_active=mapping.local_active,
+        )
+    with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as projection:
+        sparse.save_npz(projection, mapping.projection, compressed=False)
+
+    os.replace(projection.name, path + "_projection.npz")
+    os.replace(file.name, path + ".npz")
+
+
+def load_tile_mapping(
+    path: str, global_mesh: TreeMesh, global_active: np.ndarray, **kwargs
+) -> tuple[TreeMesh, maps.TileMap] | None:
+    """
+    Load a nested mesh and TileMap stored by :func:`save_tile_mapping`.
+
+    :param path: File path without extension.
+    :param global_mesh: Global TreeMesh of the inversion.
+    :param global_active: Active cells of the global mesh.
+    :param kwargs: Keyword arguments passed to the TileMap.
+
+    :return: Nested mesh and TileMap, or None if not found.
+    """
+    if not os.path.exists(path + ".npz") or not os.path.exists(
+        path + "_projection.npz"
+    ):
+        return None
+
+    try:
+        with np.load(path + ".npz") as stored:
+            nested_mesh = TreeMesh(
+                [stored["h0"], stored["h1"], stored["h2"]], x0=stored["x0"]
+            )
+            nested_mesh.__setstate__((stored["indexes"], stored["levels"]))
+            local_active = stored["local_active"]
+
+        projection = sparse.load_npz(path + "_projection.npz")
+    except (OSError, KeyError, ValueError):
+        return None
+
+    mapping = StoredTileMap(
+        global_mesh, global_active, nested_mesh, projection, local_active, **kwargs
+    )
+
+    return nested_mesh, mapping
+
+
+def nested_cells_estimator(
+    mesh: TreeMesh,
+    active_cells: np.ndarray,
+    padding_cells: int = 6,
+    minimum_level: int = 3,
+):
+    """
+    Build a function estimating the number of active cells of the nested
+    mesh created around a set of receivers, following the refinement of
+    :func:`SimPEG.utils.drivers.create_nested_mesh` by concentric shells of
+    padding cells.
+
+    Global cells finer than the level preserved at their distance from the
+    receivers count as the fraction of the coarser nested cell they fill.
+
+    :param mesh: Global TreeMesh of the inversion.
+    :param active_cells: Active cells of the global mesh.
+    :param padding_cells: Number of cells in each concentric shell.
+    :param minimum_level: Number of shells refined around the receivers.
+
+    :return: Function of receiver locations, shape(*, 2+), returning the
+        estimated number of nested active cells.
+    """
+    centers = mesh.gridCC[active_cells, :2]
+    levels = mesh.cell_levels_by_index(np.where(active_cells)[0])
+    base_cell = np.min([mesh.h[0][0], mesh.h[1][0]])
+    pad_distances = (
+        base_cell * padding_cells * np.cumsum(2.0 ** np.arange(minimum_level))
+    )
+    background = 8.0 ** -np.maximum(levels - (mesh.max_level - minimum_level), 0)
+    n_background = background.sum()
+
+    def estimator(locations: np.ndarray) -> float:
+        limits = np.r_[
+            locations[:, :2].min(axis=0) - pad_distances[-1],
+            locations[:, :2].max(axis=0) + pad_distances[-1],
+        ]
+        indices = np.where(
+            np.all((centers >= limits[:2]) & (centers <= limits[2:]), axis=1)
+        )[0]
+        distance, _ = cKDTree(locations[:, :2]).query(
+            centers[indices], distance_upper_bound=pad_distances[-1]
+        )
+        shells = np.searchsorted(pad_distances, distance, side="right")
+        refined = 8.0 ** -np.maximum(levels[indices] - (mesh.max_level - shells), 0)
+
+        return n_background - background[indices].sum() + refined.sum()
+
+    return estimator
+
+
+def balanced_tiles(
+    locations: np.ndarray,
+    mesh: TreeMesh,
+    active_cells: np.ndarray,
+    n_tiles: int,
+    max_cost: float | None = None,
+    padding_cells: int = 6,
+    minimum_level: int = 3,
+) -> tuple[list[np.ndarray], np.ndarray]:
+    """
+    Tile receivers such that the cost of the tiles, measured as their number
+    of receivers times the number of active cells of their nested mesh, is
+    balanced.
+
+    The most expensive tile is repeatedly split in two along its longest
+    horizontal extent, at the quartile or median of its receivers that best
+    balances the cost of both halves, until the requested number of tiles is
+    reached and no tile exceeds the maximum cost.
+
+    :param locations: Receiver locations, shape(*, 2+).
+    :param mesh: Global TreeMesh of the inversion.
+    :param active_cells: Active cells of the global mesh.
+    :param n_tiles: Minimum number of tiles.
+    :param max_cost: Maximum cost of a tile, exceeded only by single receivers.
+    :param padding_cells: Number of cells in each concentric shell of the
+        nested meshes.
+    :param minimum_level: Number of shells refined around the receivers.
+
+    :return: List of receiver indices per tile and the predicted cost of
+        each tile.
+    """
+    estimator = nested_cells_estimator(
+        mesh, active_cells, padding_cells=padding_cells, minimum_level=minimum_level
+    )
+    tiles = [np.arange(locations.shape[0])]
+    costs = [len(tiles[0]) * estimator(locations)]
+
+    while True:
+        splittable = [ind for ind, tile in enumerate(tiles) if len(tile) > 1]
+        if not splittable:
+            break
+
+        ind = max(splittable, key=lambda tile_id: costs[tile_id])
+        if len(tiles) >= n_tiles and (max_cost is None or costs[ind] <= max_cost):
+            break
+
+        tile = tiles.pop(ind)
+        costs.pop(ind)
+        xy = locations[tile, :2]
+        axis = int(np.argmax(xy.max(axis=0) - xy.min(axis=0)))
+        order = tile[np.argsort(xy[:, axis], kind="stable")]
+
+        # Split where the costs of both halves are the most even
+        best = None
+        for split in np.unique(
+            np.clip(np.round(np.r_[0.25, 0.5, 0.75] * len(tile)), 1, len(tile) - 1)
+        ).astype(int):
+            halves = [np.sort(order[:split]), np.sort(order[split:])]
+            split_costs = [len(half) * estimator(locations[half]) for half in halves]
+            if best is None or max(split_costs) < max(best[1]):
+                best = halves, split_costs
+
+        tiles += best[0]
+        costs += best[1]
+
+    return tiles, np.asarray(costs)
@@ -23,6 +23,8 @@ defaults = {
     "fixed_contours": None,
     "max_distance": 500.0,
     "resolution": 50.0,
+    "tile_size": None,
+    "workers": 1,
     "generate_sweep": False,
     "run_command": "geoapps.iso_surfaces.driver",
     "monitoring_directory": None,
@@ -100,6 +102,23 @@ default_ui_json.update(
             "main": True,
             "value": 50.0,
         },
+        "tile_size": {
+            "enabled": False,
+            "optional": True,
+            "label": "Tile size (cells)",
+            "main": True,
+            "min": 2,
+            "tooltip": "Process the grid by bricks of cells to limit memory usage.",
+            "value": 64,
+        },
+        "workers": {
+            "group": "Python run preferences",
+            "label": "Number of processes",
+            "main": True,
+            "min": 1,
+            "tooltip": "Extract the levels in parallel processes.",
+            "value": 1,
+        },
         "generate_sweep": {
             "label": "Generate sweep file",
             "group": "Python run preferences",
@@ -8,15 +8,17 @@
 
 from __future__ import annotations
 
+import itertools
 import os
 import sys
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from tempfile import TemporaryDirectory
 
 import numpy as np
 from geoh5py.groups import ContainerGroup
 from geoh5py.objects import BlockModel, ObjectBase, Surface
 from geoh5py.ui_json.utils import monitored_directory_copy
-from scipy.interpolate import interp1d
 from skimage.measure import marching_cubes
 from tqdm import tqdm
 
@@ -58,6 +60,8 @@ class IsoSurfacesDriver(BaseDriver):
             levels,
             resolution=self.params.resolution,
             max_distance=self.params.max_distance,
+            tile_size=self.params.tile_size,
+            workers=self.params.workers,
         )
 
         container = ContainerGroup.create(self.params.geoh5, name="Isosurface")
@@ -89,6 +93,8 @@ class IsoSurfacesDriver(BaseDriver):
         levels: list,
         resolution: float = 100,
         max_distance: float = np.inf,
+        tile_size: int | None = None,
+        workers: int | None = 1,
     ):
         """
         Generate 3D iso surface from an entity vertices or centroids and values.
@@ -112,6 +118,16 @@ class IsoSurfacesDriver(BaseDriver):
             Grid size used to generate the iso surface.
             Only used for input entities other than BlockModel.
 
+        tile_size: int, default=None
+            Number of grid cells along each side of the bricks processed at once.
+            Bricks overlap by one grid node and their surfaces are welded along
+            the seams, such that the memory is bounded by the brick size.
+            The full grid is processed at once if None.
+
+        workers: int, default=1
+            Number of processes extracting the levels in parallel. Levels are
+            extracted serially if 1, or on all cores if None.
+
         Returns
         -------
         surfaces: list of numpy.ndarrays
@@ -150,59 +166,93 @@ class IsoSurfacesDriver(BaseDriver):
                     )
                 ]
 
-            y, x, z = np.meshgrid(grid[1], grid[0], grid[2])
-            values = weighted_average(
-                locations,
-                np.c_[x.flatten(), y.flatten(), z.flatten()],
-                [values],
-                threshold=resolution / 2.0,
-                n=8,
-                max_distance=max_distance,
-            )
-            values = values[0].reshape(x.shape)
+        shape = [len(nodes) for nodes in grid]
+        if tile_size is None:
+            tile_size = np.max(shape)
 
-        lower, upper = np.nanmin(values), np.nanmax(values)
-        surfaces = []
+        if workers is None:
+            workers = os.cpu_count()
+
+        executor = None
+        if workers > 1 and len(levels) > 1:
+            executor = ProcessPoolExecutor(max_workers=np.min([workers, len(levels)]))
+
+        lower, upper = np.inf, -np.inf
+        parts = [[] for _ in levels]
         print("Running marching cubes on levels.")
-        skip = []
-        for level in tqdm(levels):
-            try:
-                if level < lower or level > upper:
-                    skip += [level]
+        try:
+            for brick in tqdm(IsoSurfacesDriver.get_bricks(shape, tile_size)):
+                if isinstance(entity, BlockModel):
+                    brick_values = values[brick]
+                else:
+                    brick_values = IsoSurfacesDriver.interpolate_brick(
+                        locations,
+                        values,
+                        [nodes[ind] for nodes, ind in zip(grid, brick)],
+                        resolution=resolution,
+                        max_distance=max_distance,
+                    )
+
+                if brick_values is None or np.all(np.isnan(brick_values)):
                     continue
-                verts, faces, _, _ = marching_cubes(values, level=level)
 
-                # Remove all vertices and cells with nan
-                nan_verts = np.any(np.isnan(verts), axis=1)
-                rem_cells = np.any(nan_verts[faces], axis=1)
+                brick_lower = np.nanmin(brick_values)
+                brick_upper = np.nanmax(brick_values)
+                lower, upper = np.min([lower, brick_lower]), np.max(
+                    [upper, brick_upper]
+                )
+                offset = np.r_[[ind.start for ind in brick]]
+
+                counts = [
+                    count
+                    for count, level in enumerate(levels)
+                    if brick_lower <= level <= brick_upper
+                ]
+                results = IsoSurfacesDriver.extract_levels(
+                    brick_values, [levels[count] for count in counts], executor
+                )
+                for count, result in zip(counts, results):
+                    if result is not None:
+                        parts[count] += [(result[0] + offset, result[1])]
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-                active = np.arange(nan_verts.shape[0])
-                active[nan_verts] = nan_verts.shape[0]
-                _, inv_map = np.unique(active, return_inverse=True)
+        surfaces = []
+        skip = []
+        for level, level_parts in zip(levels, parts):
+            if level < lower or level > upper:
+                skip += [level]
+                continue
+
+            if len(level_parts) == 0:
+                surfaces += [[[], []]]
+                continue
+
+            verts = np.vstack([part[0] for part in level_parts])
+            n_verts = np.cumsum([0] + [part[0].shape[0] for part in level_parts])
+            faces = np.vstack(
+                [part[1] + n_vert for part, n_vert in zip(level_parts, n_verts)]
+            )
 
-                verts = verts[nan_verts == False, :]
-                faces = faces[rem_cells == False, :]
-                faces = inv_map[faces].astype("uint32")
+            if len(level_parts) > 1:
+                verts, faces = IsoSurfacesDriver.weld_vertices(verts, faces)
 
-                vertices = []
-                for i in range(3):
-                    F = interp1d(
-                        np.arange(grid[i].shape[0]), grid[i], fill_value="extrapolate"
-                    )
-                    vertices += [F(verts[:, i])]
+            faces = faces.astype("uint32")
 
-                if isinstance(entity, BlockModel):
-                    vertices = rotate_xyz(
-                        np.vstack(vertices).T, [0, 0, 0], entity.rotation
-                    )
-                    vertices[:, 0] += entity.origin["x"]
-                    vertices[:, 1] += entity.origin["y"]
-                    vertices[:, 2] += entity.origin["z"]
+            # Map grid indices to coordinates, linear between nodes
+            vertices = np.vstack(
+                [
+                    np.interp(verts[:, i], np.arange(nodes.shape[0]), nodes)
+                    for i, nodes in enumerate(grid)
+                ]
+            ).T
 
-                else:
-                    vertices = np.vstack(vertices).T
-            except RuntimeError:
-                vertices, faces = [], []
+            if isinstance(entity, BlockModel):
+                vertices = rotate_xyz(vertices, [0, 0, 0], entity.rotation)
+                vertices[:, 0] += entity.origin["x"]
+                vertices[:, 1] += entity.origin["y"]
+                vertices[:, 2] += entity.origin["z"]
 
             surfaces += [[vertices, faces]]
 
@@ -210,6 +260,169 @@ class IsoSurfacesDriver(BaseDriver):
             warnings.warn(f"The following levels were out of bound and ignored: {skip}")
         return surfaces
 
+    @staticmethod
+    def extract_levels(
+        values: np.ndarray, levels: list[float], executor: Executor | None = None
+    ) -> list[tuple[np.ndarray, np.ndarray] | None]:
+        """
+        Run marching cubes on a volume for multiple levels.
+
+        :param values: Volume of values on a regular grid.
+        :param levels: List of iso values.
+        :param executor: Process pool used to extract the levels in parallel.
+            The volume is shared with the workers through a memory-mapped file.
+
+        :return: List of (vertices, faces) in grid index coordinates, or None
+            if no surface is found, for each level.
+        """
+        if executor is None or len(levels) < 2:
+            return [marching_cubes_level(values, level) for level in levels]
+
+        with TemporaryDirectory() as tempdir:
+            file_name = os.path.join(tempdir, "values.npy")
+            shared = np.lib.format.open_memmap(
+                file_name, mode="w+", dtype=values.dtype, shape=values.shape
+            )
+            shared[:] = values
+            shared.flush()
+            del shared
+
+            futures = [
+                executor.submit(marching_cubes_level, file_name, level)
+                for level in levels
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def get_bricks(shape: list[int], tile_size: int) -> list[tuple[slice, ...]]:
+        """
+        Split a regular grid into bricks overlapping by one node.
+
+        :param shape: Number of nodes along each dimension of the grid.
+        :param tile_size: Maximum number of cells along each side of a brick.
+
+        :return: List of slices indexing the nodes of each brick.
+        """
+        tile_size = int(np.max([tile_size, 1]))
+        starts = [
+            np.arange(0, np.max([n_nodes - 1, 1]), tile_size) for n_nodes in shape
+        ]
+
+        return [
+            tuple(
+                slice(start, np.min([start + tile_size + 1, n_nodes]))
+                for start, n_nodes in zip(corner, shape)
+            )
+            for corner in itertools.product(*starts)
+        ]
+
+    @staticmethod
+    def interpolate_brick(
+        locations: np.ndarray,
+        values: np.ndarray,
+        nodes: list[np.ndarray],
+        resolution: float = 100,
+        max_distance: float = np.inf,
+    ) -> np.ndarray | None:
+        """
+        Interpolate values on the nodes of a regular brick by inverse distance weighting.
+
+        :param locations: shape(*, 3) Input coordinate locations.
+        :param values: Values defined at the input locations.
+        :param nodes: Node coordinates of the brick along each dimension.
+        :param resolution: Grid size, used as smoothing threshold.
+        :param max_distance: Maximum distance from input locations to interpolate.
+
+        :return: Array of interpolated values with shape of the brick, or None
+            if no input location lies within 'max_distance' of the brick.
+        """
+        # Only locations within reach of the brick can contribute to the average
+        in_reach = np.ones(locations.shape[0], dtype=bool)
+        if np.isfinite(max_distance):
+            for i in range(3):
+                in_reach &= locations[:, i] >= nodes[i][0] - max_distance
+                in_reach &= locations[:, i] <= nodes[i][-1] + max_distance
+
+        if not np.any(in_reach):
+            return None
+
+        x, y, z = np.meshgrid(*nodes, indexing="ij")
+        brick_values = weighted_average(
+            locations[in_reach],
+            np.c_[x.flatten(), y.flatten(), z.flatten()],
+            [values[in_reach]],
+            threshold=resolution / 2.0,
+            n=8,
+            max_distance=max_distance,
+        )
+
+        return brick_values[0].reshape(x.shape)
+
+    @staticmethod
+    def weld_vertices(
+        vertices: np.ndarray, faces: np.ndarray, decimals: int = 6
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Merge duplicated vertices, such as along the seams of adjacent bricks.
+
+        :param vertices: shape(*, 3) Vertices in grid index coordinates.
+        :param faces: shape(*, 3) Triangles indexing the vertices.
+        :param decimals: Number of decimals used to identify duplicated vertices.
+
+        :return vertices: Unique vertices.
+        :return faces: Re-indexed triangles, without collapsed triangles.
+        """
+        _, index, inverse = np.unique(
+            np.round(vertices, decimals),
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        faces = inverse.ravel()[faces]
+        collapsed = (
+            (faces[:, 0] == faces[:, 1])
+            | (faces[:, 1] == faces[:, 2])
+            | (faces[:, 0] == faces[:, 2])
+        )
+
+        return vertices[index], faces[~collapsed]
+
+
+def marching_cubes_level(
+    values: np.ndarray | str, level: float
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Run marching cubes on a volume and remove vertices and faces with nan.
+
+    :param values: Volume of values on a regular grid, or path to a '.npy'
+        file opened as a memory-mapped array.
+    :param level: Iso value.
+
+    :return: Vertices in grid index coordinates and faces, or None if no
+        surface is found.
+    """
+    if isinstance(values, str):
+        values = np.load(values, mmap_mode="r")
+
+    try:
+        verts, faces, _, _ = marching_cubes(values, level=level)
+    except (RuntimeError, ValueError):
+        return None
+
+    # Remove all vertices and cells with nan
+    nan_verts = np.any(np.isnan(verts), axis=1)
+    rem_cells = np.any(nan_verts[faces], axis=1)
+
+    active = np.arange(nan_verts.shape[0])
+    active[nan_verts] = nan_verts.shape[0]
+    _, inv_map = np.unique(active, return_inverse=True)
+
+    verts = verts[nan_verts == False, :]
+    faces = faces[rem_cells == False, :]
+    faces = inv_map[faces]
+
+    return verts, faces
+
 
 if __name__ == "__main__":
     file = sys.argv[1]
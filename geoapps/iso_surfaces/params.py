@@ -34,6 +34,8 @@ class IsoSurfacesParams(BaseParams):
         self._fixed_contours = None
         self._max_distance = None
         self._resolution = None
+        self._tile_size = None
+        self._workers = None
         self._export_as = None
 
         if input_file is None:
@@ -135,6 +137,28 @@ class IsoSurfacesParams(BaseParams):
     def resolution(self, val):
         self.setter_validator("resolution", val)
 
+    @property
+    def tile_size(self) -> int | None:
+        """
+        Number of grid cells along each side of the bricks processed at once.
+        """
+        return self._tile_size
+
+    @tile_size.setter
+    def tile_size(self, val):
+        self.setter_validator("tile_size", val)
+
+    @property
+    def workers(self) -> int | None:
+        """
+        Number of processes extracting the levels in parallel.
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, val):
+        self.setter_validator("workers", val)
+
     @property
     def export_as(self) -> str | None:
         """
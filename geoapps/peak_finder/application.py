@@ -29,6 +29,7 @@ from geoapps.peak_finder.constants import (
     template_dict,
 )
 from geoapps.utils import geophysical_systems, warn_module_not_found
+from geoapps.utils.surveys import LineIndex
 
 from . import PeakFinderParams
 from .driver import PeakFinderDriver
@@ -771,7 +772,7 @@ class PeakFinder(ObjectDataSelection):
         if not isinstance(line_data, ReferencedData):
             return
 
-        indices = np.where(np.asarray(line_data.values) == line_id)[0]
+        indices = LineIndex.from_data(line_data).get(line_id)
 
         if len(indices) == 0:
             return
@@ -36,6 +36,8 @@ defaults = {
     "min_channels": 1,
     "ga_group_name": "peak_finder",
     "structural_markers": False,
+    "parallel_backend": "threads",
+    "n_cpu": None,
     "line_id": None,
     "group_auto": True,
     "center": None,
@@ -147,6 +149,23 @@ default_ui_json.update(
             "label": "Export all markers",
             "value": False,
         },
+        "parallel_backend": {
+            "choiceList": ["threads", "processes"],
+            "main": True,
+            "group": "Python run preferences",
+            "label": "Parallel backend",
+            "tooltip": "Process the lines with a pool of threads or of processes.",
+            "value": "threads",
+        },
+        "n_cpu": {
+            "min": 1,
+            "main": True,
+            "group": "Python run preferences",
+            "optional": True,
+            "enabled": False,
+            "label": "Number of CPUs",
+            "value": 1,
+        },
         "line_id": None,
         "group_auto": {
             "label": "Auto-group",
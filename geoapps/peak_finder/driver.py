@@ -8,8 +8,11 @@
 
 from __future__ import annotations
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from os import path
+from tempfile import TemporaryDirectory
 
 import numpy as np
 from dask import compute, delayed
@@ -26,6 +29,7 @@ from geoapps.peak_finder.utils import default_groups_from_property_group, find_a
 from geoapps.shared_utils.utils import hex_to_rgb
 from geoapps.utils import geophysical_systems
 from geoapps.utils.formatters import string_name
+from geoapps.utils.surveys import LineIndex
 
 
 class PeakFinderDriver(BaseDriver):
@@ -54,8 +58,7 @@ class PeakFinderDriver(BaseDriver):
             self.params.geoh5, name=string_name(self.params.ga_group_name)
         )
 
-        line_field = self.params.line_field
-        lines = np.unique(line_field.values)
+        line_index = LineIndex.from_data(self.params.line_field)
 
         if self.params.group_auto and any(prop_group):
             channel_groups = default_groups_from_property_group(prop_group[0])
@@ -81,29 +84,46 @@ class PeakFinderDriver(BaseDriver):
             )
 
         print("Submitting parallel jobs:")
-        anomalies = []
         locations = survey.vertices.copy()
+        line_indices = [line_index.get(line_id) for line_id in line_index.ids.tolist()]
+        kwargs = {
+            "data_normalization": normalization,
+            "smoothing": self.params.smoothing,
+            "min_amplitude": self.params.min_amplitude,
+            "min_value": self.params.min_value,
+            "min_width": self.params.min_width,
+            "max_migration": self.params.max_migration,
+            "min_channels": self.params.min_channels,
+            "minimal_output": True,
+        }
+
+        if self.params.parallel_backend == "processes":
+            results = self.find_anomalies_processes(
+                locations,
+                line_indices,
+                active_channels,
+                channel_groups,
+                workers=self.params.n_cpu,
+                **kwargs,
+            )
+        elif self.params.parallel_backend in [None, "threads"]:
+            anomalies = []
+            line_computation = delayed(find_anomalies, pure=True)
+            for indices in tqdm(line_indices):
+                anomalies += [
+                    line_computation(
+                        locations, indices, active_channels, channel_groups, **kwargs
+                    )
+                ]
+
+            print("Processing and collecting results:")
+            with ProgressBar():
+                results = compute(anomalies, num_workers=self.params.n_cpu)[0]
+        else:
+            raise ValueError(
+                f"Unrecognized parallel backend: {self.params.parallel_backend}"
+            )
 
-        line_computation = delayed(find_anomalies, pure=True)
-        for line_id in tqdm(list(lines)):
-            line_indices = np.where(line_field.values == line_id)[0]
-
-            anomalies += [
-                line_computation(
-                    locations,
-                    line_indices,
-                    active_channels,
-                    channel_groups,
-                    data_normalization=normalization,
-                    smoothing=self.params.smoothing,
-                    min_amplitude=self.params.min_amplitude,
-                    min_value=self.params.min_value,
-                    min_width=self.params.min_width,
-                    max_migration=self.params.max_migration,
-                    min_channels=self.params.min_channels,
-                    minimal_output=True,
-                )
-            ]
         (
             channel_group,
             tau,
@@ -119,10 +139,6 @@ class PeakFinderDriver(BaseDriver):
             peaks,
         ) = ([], [], [], [], [], [], [], [], [], [], [], [])
 
-        print("Processing and collecting results:")
-        with ProgressBar():
-            results = compute(anomalies)[0]
-
         for line in tqdm(results):
             for group in line:
                 if "channel_group" in group and len(group["cox"]) > 0:
@@ -323,6 +339,126 @@ class PeakFinderDriver(BaseDriver):
         ):
             monitored_directory_copy(self.params.monitoring_directory, output_group)
 
+    @staticmethod
+    def find_anomalies_processes(
+        locations: np.ndarray,
+        line_indices: list[np.ndarray],
+        channels: dict,
+        channel_groups: dict,
+        workers: int | None = None,
+        **kwargs,
+    ) -> list:
+        """
+        Run :func:`find_anomalies` on a pool of processes.
+
+        The locations and channel values are written once to memory-mapped
+        arrays shared by the workers, so that each task only receives the
+        indices of a line.
+
+        :param locations: Array of vertices coordinates, shape(*, 3).
+        :param line_indices: List of vertices indices for each line.
+        :param channels: Dictionary of channel parameters, with "values".
+        :param channel_groups: Dictionary of channel groups.
+        :param workers: Number of processes, defaults to os.cpu_count().
+        :param kwargs: Keyword arguments passed to :func:`find_anomalies`.
+
+        :return: List of anomalies for each line, in the order of line_indices.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        value_uids = [uid for uid, params in channels.items() if "values" in params]
+        metadata = {
+            uid: {key: val for key, val in params.items() if key != "values"}
+            for uid, params in channels.items()
+        }
+
+        with TemporaryDirectory() as tempdir:
+            shared = np.lib.format.open_memmap(
+                path.join(tempdir, "locations.npy"),
+                mode="w+",
+                dtype=locations.dtype,
+                shape=locations.shape,
+            )
+            shared[:] = locations
+            shared.flush()
+
+            if value_uids:
+                shared = np.lib.format.open_memmap(
+                    path.join(tempdir, "values.npy"),
+                    mode="w+",
+                    dtype=np.result_type(
+                        *[channels[uid]["values"] for uid in value_uids]
+                    ),
+                    shape=(len(value_uids), locations.shape[0]),
+                )
+                for ind, uid in enumerate(value_uids):
+                    shared[ind] = channels[uid]["values"]
+                shared.flush()
+            del shared
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_shared_channels,
+                initargs=(tempdir, metadata, value_uids, channel_groups, kwargs),
+            ) as executor:
+                results = list(
+                    tqdm(
+                        executor.map(
+                            find_anomalies_line,
+                            line_indices,
+                            chunksize=max(1, len(line_indices) // (4 * workers)),
+                        ),
+                        total=len(line_indices),
+                    )
+                )
+
+        return results
+
+
+_shared_channels: dict = {}
+
+
+def init_shared_channels(
+    tempdir: str,
+    metadata: dict,
+    value_uids: list,
+    channel_groups: dict,
+    kwargs: dict,
+):
+    """
+    Load the memory-mapped locations and channel values in a worker process.
+    """
+    locations = np.load(path.join(tempdir, "locations.npy"), mmap_mode="r")
+    channels = {uid: dict(params) for uid, params in metadata.items()}
+
+    if value_uids:
+        values = np.asarray(np.load(path.join(tempdir, "values.npy"), mmap_mode="r"))
+        for ind, uid in enumerate(value_uids):
+            channels[uid]["values"] = values[ind]
+
+    _shared_channels.update(
+        {
+            "locations": np.asarray(locations),
+            "channels": channels,
+            "channel_groups": channel_groups,
+            "kwargs": kwargs,
+        }
+    )
+
+
+def find_anomalies_line(line_indices: np.ndarray) -> list:
+    """
+    Run :func:`find_anomalies` on one line of the shared channels.
+    """
+    return find_anomalies(
+        _shared_channels["locations"],
+        line_indices,
+        _shared_channels["channels"],
+        _shared_channels["channel_groups"],
+        **_shared_channels["kwargs"],
+    )
+
 
 if __name__ == "__main__":
     file = sys.argv[1]
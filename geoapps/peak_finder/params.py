@@ -41,6 +41,8 @@ class PeakFinderParams(BaseParams):
         self._min_channels = None
         self._ga_group_name = None
         self._structural_markers = None
+        self._parallel_backend = None
+        self._n_cpu = None
         self._line_id = None
         self._group_auto = None
         self._center = None
@@ -195,6 +197,17 @@ class PeakFinderParams(BaseParams):
     def monitoring_directory(self, val):
         self.setter_validator("monitoring_directory", val)
 
+    @property
+    def n_cpu(self) -> int | None:
+        """
+        Number of workers used to process the lines.
+        """
+        return self._n_cpu
+
+    @n_cpu.setter
+    def n_cpu(self, val):
+        self.setter_validator("n_cpu", val)
+
     @property
     def objects(self):
         return self._objects
@@ -203,6 +216,17 @@ class PeakFinderParams(BaseParams):
     def objects(self, val):
         self.setter_validator("objects", val, fun=self._uuid_promoter)
 
+    @property
+    def parallel_backend(self) -> str:
+        """
+        Pool of 'threads' or 'processes' used to process the lines.
+        """
+        return self._parallel_backend
+
+    @parallel_backend.setter
+    def parallel_backend(self, val):
+        self.setter_validator("parallel_backend", val)
+
     @property
     def plot_result(self):
         return self._plot_result
@@ -20,7 +20,8 @@ class LineDataDerivatives:
 
     :param locations: An array of data locations, either as distance along line or 3D coordinates.
         For 3D coordinates, the locations are automatically converted and sorted as distance from the origin.
-    :param values: Data values used to compute derivatives over, shape(locations.shape[0],).
+    :param values: Data values used to compute derivatives over, shape(locations.shape[0],),
+        or shape(n_channels, locations.shape[0]) to process several channels at once along the last axis.
     :param epsilon: Adjustable constant used in :obj:`scipy.interpolate.Rbf`. Defaults to 20x the average sampling
     :param interpolation: Type on interpolation accepted by the :obj:`scipy.interpolate.Rbf` routine:
         'multiquadric', 'inverse', 'gaussian', 'linear', 'cubic', 'quintic', 'thin_plate'
@@ -43,6 +44,7 @@ class LineDataDerivatives:
         **kwargs,
     ):
         self._locations_resampled = None
+        self._resampling = None
         self._epsilon = epsilon
         self.x_locations = None
         self.y_locations = None
@@ -122,7 +124,7 @@ class LineDataDerivatives:
         Number of padding cells added for the FFT
         """
         if getattr(self, "_sampling_width", None) is None:
-            self._sampling_width = int(np.floor(len(self.values_resampled)))
+            self._sampling_width = int(np.floor(self.values_resampled.shape[-1]))
 
         return self._sampling_width
 
@@ -142,6 +144,7 @@ class LineDataDerivatives:
         self.sorting = None
         self.values_resampled = None
         self._locations_resampled = None
+        self._resampling = None
 
         if locations is not None:
             if locations.ndim > 1:
@@ -191,6 +194,32 @@ class LineDataDerivatives:
         """
         return self._locations_resampled
 
+    @property
+    def resampling(self) -> tuple[np.ndarray, ...]:
+        """
+        Linear interpolation from the locations to the resampled locations,
+        shared by all channels: sorting, lower and upper neighbours, distance
+        from the lower neighbour and interval length.
+        """
+        if getattr(self, "_resampling", None) is None:
+            sorting = np.argsort(self.locations, kind="mergesort")
+            locations = self.locations[sorting]
+            upper = np.clip(
+                np.searchsorted(locations, self._locations_resampled),
+                1,
+                len(locations) - 1,
+            )
+            lower = upper - 1
+            self._resampling = (
+                sorting,
+                lower,
+                upper,
+                self._locations_resampled - locations[lower],
+                locations[upper] - locations[lower],
+            )
+
+        return self._resampling
+
     @property
     def values(self):
         """
@@ -203,7 +232,7 @@ class LineDataDerivatives:
         self.values_resampled = None
         self._values = None
         if (values is not None) and (self.sorting is not None):
-            self._values = values[self.sorting]
+            self._values = values[..., self.sorting]
 
     @property
     def sampling(self):
@@ -222,9 +251,11 @@ class LineDataDerivatives:
         Values re-sampled on a regular interval
         """
         if getattr(self, "_values_resampled", None) is None:
-            # self._values_resampled = self.values_padded[self.sampling_width: -self.sampling_width]
-            F = interp1d(self.locations, self.values, fill_value="extrapolate")
-            self._values_resampled = F(self._locations_resampled)
+            sorting, lower, upper, distance, interval = self.resampling
+            values = np.asarray(self.values, dtype=float)[..., sorting]
+            self._values_resampled = (
+                values[..., upper] - values[..., lower]
+            ) / interval * distance + values[..., lower]
             self._values_resampled_raw = self._values_resampled.copy()
             if self._smoothing > 0:
                 mean_values = running_mean(
@@ -300,11 +331,17 @@ class LineDataDerivatives:
         deriv = self.values_resampled
         for _ in range(order):
             deriv = (
-                deriv[1:] - deriv[:-1]  # pylint: disable=unsubscriptable-object
+                deriv[..., 1:]
+                - deriv[..., :-1]  # pylint: disable=unsubscriptable-object
             ) / self.sampling
-            deriv = np.r_[
-                2 * deriv[0] - deriv[1], deriv  # pylint: disable=unsubscriptable-object
-            ]
+            deriv = np.concatenate(
+                [
+                    2 * deriv[..., :1]
+                    - deriv[..., 1:2],  # pylint: disable=unsubscriptable-object
+                    deriv,
+                ],
+                axis=-1,
+            )
 
         return deriv
 
@@ -421,20 +458,32 @@ def find_anomalies(
         "end": [],
         "amplitude": [],
         "group": [],
-        "channel_group": [],
     }
     data_uid = list(channels)
     property_groups = [pg for pg in channel_groups.values()]
     group_prop_size = np.r_[[len(grp["properties"]) for grp in channel_groups.values()]]
-    for cc, (uid, params) in enumerate(channels.items()):
-        if "values" not in list(params):
-            continue
 
-        values = params["values"][line_indices].copy()
-        profile.values = values
-        values = profile.values_resampled
-        dx = profile.derivative(order=1)
-        ddx = profile.derivative(order=2)
+    # Membership of each channel to the channel groups
+    channel_membership = np.array(
+        [[uid in group["properties"] for group in property_groups] for uid in data_uid],
+        dtype=bool,
+    ).reshape((len(data_uid), len(property_groups)))
+
+    # Resample, smooth and differentiate all channels of the line at once
+    channel_index = [
+        cc for cc, params in enumerate(channels.values()) if "values" in params
+    ]
+    if channel_index:
+        profile.values = np.vstack(
+            [channels[data_uid[cc]]["values"][line_indices] for cc in channel_index]
+        )
+        values_resampled = profile.values_resampled
+        derivatives = profile.derivative(order=1), profile.derivative(order=2)
+
+    for row, cc in enumerate(channel_index):
+        values = values_resampled[row]
+        dx = derivatives[0][row]
+        ddx = derivatives[1][row]
         peaks = np.where(
             (np.diff(np.sign(dx)) != 0)
             & (ddx[1:] < 0)
@@ -460,71 +509,57 @@ def find_anomalies(
         if len(peaks) == 0 or len(lows) < 2 or len(up_inflx) < 2 or len(dwn_inflx) < 2:
             continue
 
-        for peak in peaks:
-            ind = np.median(
-                [0, lows.shape[0] - 1, np.searchsorted(locs[lows], locs[peak]) - 1]
-            ).astype(int)
-            start = lows[ind]
-            ind = np.median(
-                [0, lows.shape[0] - 1, np.searchsorted(locs[lows], locs[peak])]
-            ).astype(int)
-            end = np.min([locs.shape[0] - 1, lows[ind]])
-            ind = np.median(
-                [
-                    0,
-                    up_inflx.shape[0] - 1,
-                    np.searchsorted(locs[up_inflx], locs[peak]) - 1,
-                ]
-            ).astype(int)
-            inflx_up = up_inflx[ind]
-            ind = np.median(
-                [
-                    0,
-                    dwn_inflx.shape[0] - 1,
-                    np.searchsorted(locs[dwn_inflx], locs[peak]),
-                ]
-            ).astype(int)
-            inflx_dwn = np.min([locs.shape[0] - 1, dwn_inflx[ind] + 1])
-            # Check amplitude and width thresholds
-            delta_amp = (
-                np.abs(
-                    np.min(
-                        [
-                            values[peak]  # pylint: disable=unsubscriptable-object
-                            - values[start],  # pylint: disable=unsubscriptable-object
-                            values[peak]  # pylint: disable=unsubscriptable-object
-                            - values[end],  # pylint: disable=unsubscriptable-object
-                        ]
-                    )
-                )
-                / (np.std(values) + 2e-32)
-            ) * 100.0
-            delta_x = locs[end] - locs[start]
-            amplitude = (
-                np.sum(
-                    np.abs(values[start:end])  # pylint: disable=unsubscriptable-object
+        # Bracket all peaks by the nearest lows and inflection points at once
+        ind = np.searchsorted(locs[lows], locs[peaks])
+        start = lows[np.clip(ind - 1, 0, lows.shape[0] - 1)]
+        end = np.minimum(locs.shape[0] - 1, lows[np.clip(ind, 0, lows.shape[0] - 1)])
+        ind = np.searchsorted(locs[up_inflx], locs[peaks])
+        inflx_up = up_inflx[np.clip(ind - 1, 0, up_inflx.shape[0] - 1)]
+        ind = np.searchsorted(locs[dwn_inflx], locs[peaks])
+        inflx_dwn = np.minimum(
+            locs.shape[0] - 1, dwn_inflx[np.clip(ind, 0, dwn_inflx.shape[0] - 1)] + 1
+        )
+
+        # Check amplitude and width thresholds
+        delta_amp = (
+            np.abs(
+                np.minimum(
+                    values[peaks]
+                    - values[start],  # pylint: disable=unsubscriptable-object
+                    values[peaks]
+                    - values[end],  # pylint: disable=unsubscriptable-object
                 )
-                * profile.sampling
             )
-            if (delta_amp > min_amplitude) & (delta_x > min_width):
-                anomalies["channel"] += [cc]
-                anomalies["start"] += [start]
-                anomalies["inflx_up"] += [inflx_up]
-                anomalies["peak"] += [peak]
-                anomalies["peak_values"] += [
-                    values[peak]  # pylint: disable=unsubscriptable-object
-                ]
-                anomalies["inflx_dwn"] += [inflx_dwn]
-                anomalies["amplitude"] += [amplitude]
-                anomalies["end"] += [end]
-                anomalies["group"] += [-1]
-                anomalies["channel_group"] += [
-                    [
-                        key
-                        for key, channel_group in enumerate(channel_groups.values())
-                        if uid in channel_group["properties"]
-                    ]
+            / (np.std(values) + 2e-32)
+        ) * 100.0
+        delta_x = locs[end] - locs[start]
+        keep = (delta_amp > min_amplitude) & (delta_x > min_width)
+
+        if not np.any(keep):
+            continue
+
+        amplitude = (
+            np.r_[
+                [
+                    np.sum(
+                        np.abs(values[first:last])
+                    )  # pylint: disable=unsubscriptable-object
+                    for first, last in zip(start[keep], end[keep])
                 ]
+            ]
+            * profile.sampling
+        )
+        anomalies["channel"] += [np.full(keep.sum(), cc)]
+        anomalies["start"] += [start[keep]]
+        anomalies["inflx_up"] += [inflx_up[keep]]
+        anomalies["peak"] += [peaks[keep]]
+        anomalies["peak_values"] += [
+            values[peaks[keep]]  # pylint: disable=unsubscriptable-object
+        ]
+        anomalies["inflx_dwn"] += [inflx_dwn[keep]]
+        anomalies["amplitude"] += [amplitude]
+        anomalies["end"] += [end[keep]]
+        anomalies["group"] += [np.full(keep.sum(), -1)]
 
     if len(anomalies["peak"]) == 0:
         if return_profile:
@@ -536,21 +571,35 @@ def find_anomalies(
 
     # Re-cast as numpy arrays
     for key, values in anomalies.items():
-        if key == "channel_group":
-            continue
         anomalies[key] = np.hstack(values)
 
+    membership = channel_membership[anomalies["channel"]]
     group_id = -1
     peaks_position = locs[anomalies["peak"]]
+
+    # Sorted positions to search for neighbours within the migration window
+    order = np.argsort(peaks_position, kind="stable")
+    sorted_position = peaks_position[order]
+    margin = 1e-6 * max_migration + 1e-8
     for i in range(peaks_position.shape[0]):
         # Skip if already labeled
         if anomalies["group"][i] != -1:
             continue
 
         group_id += 1  # Increment group id
-        dist = np.abs(peaks_position[i] - peaks_position)
+        window = np.searchsorted(
+            sorted_position,
+            [
+                peaks_position[i] - max_migration - margin,
+                peaks_position[i] + max_migration + margin,
+            ],
+        )
+        near = np.sort(order[window[0] : window[1]])
         # Find anomalies across channels within horizontal range
-        near = np.where((dist < max_migration) & (anomalies["group"] == -1))[0]
+        near = near[
+            (np.abs(peaks_position[i] - peaks_position[near]) < max_migration)
+            & (anomalies["group"][near] == -1)
+        ]
         # Reject from group if channel gap > 1
         u_gates, u_count = np.unique(anomalies["channel"][near], return_counts=True)
         if len(u_gates) > 1 and np.any((u_gates[1:] - u_gates[:-1]) > 2):
@@ -562,13 +611,12 @@ def find_anomalies(
         for gate in u_gates[np.where(u_count > 1)]:
             mask = np.ones_like(near, dtype="bool")
             sub_ind = anomalies["channel"][near] == gate
-            sub_ind[np.where(sub_ind)[0][np.argmin(dist[near][sub_ind])]] = False
+            dist = np.abs(peaks_position[i] - peaks_position[near])
+            sub_ind[np.where(sub_ind)[0][np.argmin(dist[sub_ind])]] = False
             mask[sub_ind] = False
             near = near[mask]
 
-        score = np.zeros(len(channel_groups))
-        for ids in near:
-            score[anomalies["channel_group"][ids]] += 1
+        score = membership[near].sum(axis=0)
 
         # Find groups with largest channel overlap
         max_scores = np.where(score == score.max())[0]
@@ -581,11 +629,7 @@ def find_anomalies(
 
         channel_group = property_groups[in_group]
         # Remove anomalies not in group
-        mask = [
-            data_uid[anomalies["channel"][id]] in channel_group["properties"]
-            for id in near
-        ]
-        near = near[mask, ...]
+        near = near[membership[near, in_group]]
         if len(near) == 0:
             continue
         anomalies["group"][near] = group_id
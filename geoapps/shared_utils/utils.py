@@ -63,6 +63,70 @@ def get_locations(workspace: Workspace, entity: UUID | Entity):
     return locations
 
 
+def chunked_query(
+    tree: cKDTree,
+    xyz: np.ndarray,
+    n: int = 1,
+    chunk_size: int | None = None,
+    workers: int = -1,
+):
+    """
+    Query nearest neighbours of locations in blocks of fixed size.
+
+    :param tree: Tree of the input locations.
+    :param xyz: shape(*, tree.m) Query locations.
+    :param n: Number of nearest neighbours.
+    :param chunk_size: Maximum number of query locations per block.
+        Defaults to all locations in one block.
+    :param workers: Number of threads used by each query, -1 for all cores.
+
+    :return: Generator of (block, rad, ind) with 'block' the slice of
+        query locations and 'rad', 'ind' arrays of shape(*, n) for the
+        distances and indices of the nearest neighbours.
+    """
+    if chunk_size is None:
+        chunk_size = xyz.shape[0]
+    chunk_size = np.max([chunk_size, 1])
+
+    for start in range(0, xyz.shape[0], chunk_size):
+        block = slice(start, start + chunk_size)
+        rad, ind = tree.query(xyz[block], n, workers=workers)
+        yield block, np.c_[rad], np.c_[ind]
+
+
+def tree_query(
+    tree: cKDTree,
+    xyz: np.ndarray,
+    n: int = 1,
+    chunk_size: int | None = None,
+    workers: int = -1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Query nearest neighbours of locations block by block into preallocated arrays.
+
+    :param tree: Tree of the input locations.
+    :param xyz: shape(*, tree.m) Query locations.
+    :param n: Number of nearest neighbours.
+    :param chunk_size: Maximum number of query locations per block.
+    :param workers: Number of threads used by each query, -1 for all cores.
+
+    :return rad: Distances to the nearest neighbours, shape(*, ) if n=1 else shape(*, n).
+    :return ind: Indices of the nearest neighbours, shape(*, ) if n=1 else shape(*, n).
+    """
+    rad = np.empty((xyz.shape[0], n))
+    ind = np.empty((xyz.shape[0], n), dtype=int)
+    for block, rad_block, ind_block in chunked_query(
+        tree, xyz, n=n, chunk_size=chunk_size, workers=workers
+    ):
+        rad[block] = rad_block
+        ind[block] = ind_block
+
+    if n == 1:
+        return rad[:, 0], ind[:, 0]
+
+    return rad, ind
+
+
 def weighted_average(
     xyz_in: np.ndarray,
     xyz_out: np.ndarray,
@@ -71,10 +135,15 @@ def weighted_average(
     n: int = 8,
     return_indices: bool = False,
     threshold: float = 1e-1,
+    chunk_size: int | None = None,
+    workers: int = -1,
 ) -> list:
     """
     Perform a inverse distance weighted averaging on a list of values.
 
+    Values sharing the same no-data (nan) pattern are averaged together
+    from a single nearest neighbours query.
+
     :param xyz_in: shape(*, 3) Input coordinate locations.
     :param xyz_out: shape(*, 3) Output coordinate locations.
     :param values: Values to be averaged from the input to output locations.
@@ -83,6 +152,10 @@ def weighted_average(
     :param return_indices: If True, return the indices of the nearest neighbours from the input locations.
     :param threshold: Small value added to the radial distance to avoid zero division.
         The value can also be used to smooth the interpolation.
+    :param chunk_size: Maximum number of output locations processed at once.
+        Limits the peak memory for large number of output locations.
+    :param workers: Number of threads used by the nearest neighbours queries,
+        -1 for all cores.
 
     :return avg_values: List of values averaged to the output coordinates
     """
@@ -93,30 +166,43 @@ def weighted_average(
         [vals.shape[0] == xyz_in.shape[0] for vals in values]
     ), "Input 'values' must have the same shape as input 'locations'"
 
-    avg_values = []
-    for value in values:
-        sub = ~np.isnan(value)
+    # Group the values by no-data pattern to share trees and queries
+    groups: dict[bytes, list[int]] = {}
+    for channel, value in enumerate(values):
+        groups.setdefault(np.isnan(value).tobytes(), []).append(channel)
+
+    avg_values = [None] * len(values)
+    indices = None
+    for channels in groups.values():
+        sub = ~np.isnan(values[channels[0]])
         tree = cKDTree(xyz_in[sub, :])
-        rad, ind = tree.query(xyz_out, n)
-        ind = np.c_[ind]
-        rad = np.c_[rad]
-        rad[rad > max_distance] = np.nan
+        data = np.vstack([values[channel][sub] for channel in channels]).T
+        values_interp = np.zeros((xyz_out.shape[0], len(channels)))
+        ind = np.zeros((xyz_out.shape[0], n), dtype=int)
+
+        for block, rad, ind_block in chunked_query(
+            tree, xyz_out, n=n, chunk_size=chunk_size, workers=workers
+        ):
+            weight = 1.0 / (rad + threshold)
+            weight[rad > max_distance] = 0.0
+
+            total = weight.sum(axis=1)
+            values_block = np.einsum("ij,ijk->ik", weight, data[ind_block, :])
+            values_block[total > 0] /= total[total > 0, None]
+            values_block[total == 0] = np.nan
 
-        values_interp = np.zeros(xyz_out.shape[0])
-        weight = np.zeros(xyz_out.shape[0])
+            values_interp[block] = values_block
+            ind[block] = ind_block
 
-        for i in range(n):
-            v = value[sub][ind[:, i]] / (rad[:, i] + threshold)
-            values_interp = np.nansum([values_interp, v], axis=0)
-            w = 1.0 / (rad[:, i] + threshold)
-            weight = np.nansum([weight, w], axis=0)
+        for count, channel in enumerate(channels):
+            avg_values[channel] = values_interp[:, count]
 
-        values_interp[weight > 0] = values_interp[weight > 0] / weight[weight > 0]
-        values_interp[weight == 0] = np.nan
-        avg_values += [values_interp]
+        # Indices refer to the non-nan locations of the last values
+        if len(values) - 1 in channels:
+            indices = ind
 
     if return_indices:
-        return avg_values, ind
+        return avg_values, indices
 
     return avg_values
 
@@ -177,7 +263,11 @@ def window_xy(
 
 
 def downsample_xy(
-    x: np.ndarray, y: np.ndarray, distance: float, mask: np.ndarray = None
+    x: np.ndarray,
+    y: np.ndarray,
+    distance: float,
+    mask: np.ndarray = None,
+    method: str = "radius",
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
 
     """
@@ -188,29 +278,61 @@ def downsample_xy(
     :param distance: Desired coordinate spacing.
     :param mask: Optionally provide an existing mask and return the union
         of the two masks and it's effect on x and y.
+    :param method: Downsampling strategy, one of
+        "radius": Sequentially keep locations and drop their neighbours
+        within 'distance'.
+        "grid": Bin locations on a grid of cells of size 'distance' and
+        keep the location closest to the center of each cell. Vectorized
+        alternative for large number of scattered locations.
 
     :return: mask: Boolean mask that was applied to x, and y.
     :return: x[mask]: Masked input array x.
     :return: y[mask]: Masked input array y.
 
     """
-
-    downsample_mask = np.ones_like(x, dtype=bool)
     xy = np.c_[x.ravel(), y.ravel()]
-    tree = cKDTree(xy)
 
-    mask_ind = np.where(downsample_mask)[0]
-    nstn = xy.shape[0]
-    for i in range(nstn):
-        if downsample_mask[mask_ind[i]]:
-            ind = tree.query_ball_point(xy[i, :2], distance)
-            downsample_mask[mask_ind[ind]] = False
-            downsample_mask[mask_ind[i]] = True
+    if method == "radius":
+        downsample_mask = np.ones_like(x, dtype=bool)
+        tree = cKDTree(xy)
+
+        mask_ind = np.where(downsample_mask)[0]
+        nstn = xy.shape[0]
+        for i in range(nstn):
+            if downsample_mask[mask_ind[i]]:
+                ind = tree.query_ball_point(xy[i, :2], distance)
+                downsample_mask[mask_ind[ind]] = False
+                downsample_mask[mask_ind[i]] = True
+
+    elif method == "grid":
+        if distance is None or distance <= 0 or xy.shape[0] == 0:
+            downsample_mask = np.ones_like(x, dtype=bool)
+        else:
+            origin = xy.min(axis=0)
+            cells = np.floor((xy - origin) / distance + 0.5)
+            offset = np.linalg.norm(xy - origin - cells * distance, axis=1)
+            cells = cells.astype(np.int64)
+            key = cells[:, 0] * (cells[:, 1].max() + 1) + cells[:, 1]
+
+            # Sort by offset then stable sort by cell: first of each cell is kept
+            order = np.argsort(offset)
+            order = order[np.argsort(key[order], kind="stable")]
+            key = key[order]
+            first = np.r_[True, key[1:] != key[:-1]]
+            downsample_mask = np.zeros(xy.shape[0], dtype=bool)
+            downsample_mask[order[first]] = True
+            downsample_mask = downsample_mask.reshape(x.shape)
+
+    else:
+        raise ValueError(
+            f"Unrecognized downsampling method: {method}. "
+            "Must be one of 'radius' or 'grid'."
+        )
 
     if mask is not None:
         downsample_mask &= mask
 
-    xy = xy[downsample_mask]
+    xy = xy[downsample_mask.ravel()]
     return downsample_mask, xy[:, 0], xy[:, 1]
 
 
@@ -261,6 +383,7 @@ def filter_xy(
     window: dict = None,
     angle: float = None,
     mask: np.ndarray = None,
+    method: str = "radius",
 ) -> np.array:
     """
     Window and down-sample locations based on distance and window parameters.
@@ -278,9 +401,12 @@ def filter_xy(
     :param angle: Angle through which the locations must be rotated
         to take on a east-west, north-south orientation.  Supersedes
         the 'azimuth' key/value pair in the window dictionary if it
-        exists.
+        exists. Locations are rotated about the window center, or the
+        origin if no window is provided.
     :param mask: Boolean mask to be combined with filter_xy masks via
         logical 'and' operation.
+    :param method: Downsampling strategy used for scattered locations,
+        one of 'radius' or 'grid'. See :func:`downsample_xy`.
 
     :return mask: Boolean mask to be applied input arrays x and y.
     """
@@ -297,7 +423,8 @@ def filter_xy(
 
     is_rotated = False if (azim is None) | (azim == 0) else True
     if is_rotated:
-        xy_locs = rotate_xyz(np.c_[x.ravel(), y.ravel()], window["center"], azim)
+        center = [0.0, 0.0] if window is None else list(window["center"][:2])
+        xy_locs = rotate_xyz(np.c_[x.ravel(), y.ravel()], center, azim)
         xr = xy_locs[:, 0].reshape(x.shape)
         yr = xy_locs[:, 1].reshape(y.shape)
 
@@ -325,7 +452,7 @@ def filter_xy(
         if is_grid:
             mask, _, _ = downsample_grid(x, y, distance, mask=mask)
         else:
-            mask, _, _ = downsample_xy(x, y, distance, mask=mask)
+            mask, _, _ = downsample_xy(x, y, distance, mask=mask, method=method)
 
     return mask
 
@@ -451,7 +578,10 @@ def octree_2_treemesh(mesh):
 
     # Convert array_ind to points in coordinates of underlying cpp tree
     # array_ind is ix, iy, iz(top-down) need it in ix, iy, iz (bottom-up)
-    cells = np.vstack(mesh.octree_cells.tolist())
+    cells = mesh.octree_cells
+    if cells.dtype.names is not None:
+        cells = np.column_stack([cells[name] for name in cells.dtype.names])
+    cells = cells.astype(int)
     levels = cells[:, -1]
     array_ind = cells[:, :-1]
     array_ind = 2 * array_ind + levels[:, None]  # get cell center index
@@ -23,6 +23,7 @@ from geoapps.base.application import BaseApplication
 from geoapps.base.selection import ObjectDataSelection, TopographyOptions
 from geoapps.utils import warn_module_not_found
 from geoapps.utils.formatters import string_name
+from geoapps.utils.surveys import LineIndex
 
 with warn_module_not_found():
     from ipywidgets import (
@@ -146,8 +147,10 @@ class Surface2D(ObjectDataSelection):
             tree_topo = cKDTree(topo_xy)
 
         if self.type.value == "Sections":
-            lines_id = self.workspace.get_entity(self.lines.data.value)[0].values
-            lines = np.unique(lines_id).tolist()
+            line_index = LineIndex.from_data(
+                self.workspace.get_entity(self.lines.data.value)[0]
+            )
+            lines = line_index.ids.tolist()
             model_vertices = []
             model_cells = []
             model_count = 0
@@ -155,7 +158,7 @@ class Surface2D(ObjectDataSelection):
             line_ids = []
             for line in lines:
 
-                line_ind = np.where(lines_id == line)[0]
+                line_ind = line_index.get(line)
 
                 n_sounding = len(line_ind)
                 if n_sounding < 2:
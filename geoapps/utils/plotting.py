@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from copy import copy
 
 import numpy as np
@@ -15,7 +16,12 @@ from geoh5py.groups import SimPEGGroup
 from geoh5py.objects import BlockModel, Curve, Grid2D, Points, Surface
 from geoh5py.workspace import Workspace
 
-from geoapps.shared_utils.utils import filter_xy, get_inversion_output
+from geoapps.shared_utils.utils import (
+    filter_xy,
+    get_inversion_output,
+    rotate_xyz,
+    window_xy,
+)
 from geoapps.utils import warn_module_not_found
 
 with warn_module_not_found():
@@ -95,6 +101,154 @@ def format_axis(channel, axis, log, threshold, nticks=5):
     return axis, label, ticks, ticklabels.tolist()
 
 
+class FilterCache:
+    """
+    Least-recently-used cache of :func:`filter_xy` masks and rotated
+    coordinates used by interactive plots.
+
+    Entries are keyed on the entity uid, the identity of its locations array,
+    the window center, size and azimuth and the resolution. Downsampling masks
+    are stored independently of the window center and size so that panning
+    only recomputes the (cheap) window mask.
+
+    :param max_bytes: Upper bound on the memory held by cached arrays.
+    """
+
+    def __init__(self, max_bytes: int = 2**28):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memory currently held by cached arrays.
+        """
+        return self._nbytes
+
+    def clear(self):
+        """
+        Invalidate all entries, e.g. when the workspace changes.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+    def get(self, key: tuple, locations: np.ndarray):
+        """
+        Return a cached value, or None if missing or computed from other locations.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry[0] is not locations:
+            self._nbytes -= self._entries.pop(key)[2]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: tuple, locations: np.ndarray, value: tuple | np.ndarray):
+        """
+        Store a value and evict the least recently used entries beyond 'max_bytes'.
+        """
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key)[2]
+
+        arrays = value if isinstance(value, tuple) else (value,)
+        nbytes = int(np.sum([array.nbytes for array in arrays]))
+
+        if nbytes > self.max_bytes:
+            return value
+
+        self._entries[key] = (locations, value, nbytes)
+        self._nbytes += nbytes
+
+        while self._nbytes > self.max_bytes:
+            self._nbytes -= self._entries.popitem(last=False)[1][2]
+
+        return value
+
+    def filter_xy(
+        self,
+        entity,
+        x: np.ndarray,
+        y: np.ndarray,
+        distance: float = None,
+        window: dict = None,
+        method: str = "radius",
+    ) -> np.ndarray:
+        """
+        Cached equivalent of :func:`geoapps.shared_utils.utils.filter_xy`.
+
+        :param entity: Object providing the uid and locations of x and y.
+        :param x: Easting coordinates, as vector or meshgrid-like array.
+        :param y: Northing coordinates, as vector or meshgrid-like array.
+        :param distance: Desired coordinate spacing.
+        :param window: Window parameters with "center", "size" and
+            optional "azimuth".
+        :param method: Downsampling strategy used for scattered locations.
+
+        :return mask: Boolean mask to be applied input arrays x and y.
+        """
+        locations = getattr(entity, "vertices", None)
+        if locations is None:
+            locations = getattr(entity, "centroids", None)
+
+        if locations is None:
+            return filter_xy(x, y, distance=distance, window=window, method=method)
+
+        base = (entity.uid, id(locations), x.shape)
+        azimuth = None
+        window_key = None
+        if window is not None:
+            azimuth = window.get("azimuth", None)
+            window_key = (
+                tuple(window["center"][:2]),
+                tuple(window["size"]),
+                azimuth,
+            )
+
+        key = base + ("mask", window_key, distance, method)
+        mask = self.get(key, locations)
+        if mask is not None:
+            return mask
+
+        mask = np.ones_like(x, dtype=bool)
+        if window is not None:
+            xr, yr = x, y
+            if azimuth not in [None, 0]:
+                # Rotations about the origin are shared by all window centers
+                rot_key = base + ("rotation", azimuth)
+                rotated = self.get(rot_key, locations)
+                if rotated is None:
+                    rotated = self.set(
+                        rot_key,
+                        locations,
+                        rotate_xyz(np.c_[x.ravel(), y.ravel()], [0.0, 0.0], azimuth),
+                    )
+                center = np.asarray(window["center"][:2], dtype=float)
+                shift = center - rotate_xyz(center[None, :], [0.0, 0.0], azimuth)[0]
+                xr = (rotated[:, 0] + shift[0]).reshape(x.shape)
+                yr = (rotated[:, 1] + shift[1]).reshape(y.shape)
+
+            mask, _, _ = window_xy(xr, yr, window, mask=mask)
+
+        if distance not in [None, 0]:
+            ds_key = base + ("downsample", distance, azimuth, method)
+            ds_mask = self.get(ds_key, locations)
+            if ds_mask is None:
+                ds_mask = self.set(
+                    ds_key,
+                    locations,
+                    filter_xy(x, y, distance=distance, angle=azimuth, method=method),
+                )
+            mask = mask & ds_mask
+
+        return self.set(key, locations, mask)
+
+
 def plot_plan_data_selection(entity, data, **kwargs):
     """
     Plot data values in 2D with contours
@@ -163,6 +317,9 @@ def plot_plan_data_selection(entity, data, **kwargs):
     if "window" in kwargs:
         window = kwargs["window"]
 
+    method = kwargs.get("method", "radius")
+    filter_cache = kwargs.get("filter_cache", None)
+
     if (
         data is not None
         and getattr(data, "entity_type", None) is not None
@@ -184,7 +341,12 @@ def plot_plan_data_selection(entity, data, **kwargs):
     if isinstance(entity, Grid2D):
         x = entity.centroids[:, 0].reshape(entity.shape, order="F")
         y = entity.centroids[:, 1].reshape(entity.shape, order="F")
-        indices = filter_xy(x, y, resolution, window=window)
+        if filter_cache is not None:
+            indices = filter_cache.filter_xy(
+                entity, x, y, resolution, window=window, method=method
+            )
+        else:
+            indices = filter_xy(x, y, resolution, window=window, method=method)
 
         ind_x, ind_y = (
             np.any(indices, axis=1),
@@ -211,12 +373,17 @@ def plot_plan_data_selection(entity, data, **kwargs):
 
     else:
         x, y = entity.vertices[:, 0], entity.vertices[:, 1]
-        if indices is None:
+        if indices is None and filter_cache is not None:
+            indices = filter_cache.filter_xy(
+                entity, x, y, resolution, window=window, method=method
+            )
+        elif indices is None:
             indices = filter_xy(
                 x,
                 y,
                 resolution,
                 window=window,
+                method=method,
             )
         X, Y = x[indices], y[indices]
 
@@ -285,7 +452,7 @@ def plot_plan_data_selection(entity, data, **kwargs):
                     locations[ind, 1],
                     entity.workspace.get_entity(key)[0].values[ind],
                 )
-                ind_line = filter_xy(x, y, resolution, window=window)
+                ind_line = filter_xy(x, y, resolution, window=window, method=method)
                 axis.scatter(x[ind_line], y[ind_line], marker_size * 2, "k", marker="+")
                 line_selection[ind[ind_line]] = True
 
@@ -331,6 +498,7 @@ def plot_profile_data_selection(
                     locations[ind, 0],
                     locations[ind, 1],
                     resolution,
+                    method="grid",
                 )
 
                 ind = ind[dwn_ind]
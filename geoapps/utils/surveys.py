@@ -11,11 +11,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from geoapps.inversion.components.data import InversionData
 
+from collections import OrderedDict
 from typing import Callable
 
 import numpy as np
 from discretize import TensorMesh, TreeMesh
-from geoh5py.data import FloatData
+from geoh5py.data import FloatData, ReferencedData
 from geoh5py.objects import CurrentElectrode, PotentialElectrode
 from geoh5py.workspace import Workspace
 from scipy.spatial import cKDTree
@@ -218,6 +219,108 @@ def survey_lines(survey, start_loc: list[int | float], save: str | None = None):
     return np.array(lines)[inds]
 
 
+class LineIndex:
+    """
+    Vertices indices grouped by line id, stored as a single sorted index
+    array and offsets (CSR layout).
+
+    Indices of a line are sliced in constant time and returned in
+    increasing order, as with :obj:`numpy.where`.
+
+    :param lines: Line id of every vertex.
+    """
+
+    _cache: OrderedDict = OrderedDict()
+    _max_cache = 16
+
+    def __init__(self, lines: np.ndarray):
+        self._lines = lines
+        lines = np.asarray(lines)
+        order = np.argsort(lines, kind="stable")
+
+        if lines.dtype.kind == "f":
+            order = order[~np.isnan(lines[order])]
+
+        ids, counts = np.unique(lines[order], return_counts=True)
+
+        self._ids = ids
+        self._indices = order
+        self._offsets = np.r_[0, np.cumsum(counts)]
+        self._lookup = {line: ind for ind, line in enumerate(ids.tolist())}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, line_id) -> bool:
+        return line_id in self._lookup
+
+    @classmethod
+    def from_data(cls, data: ReferencedData) -> LineIndex:
+        """
+        Get the line index of a line field, re-using the one built for the
+        same values if available.
+
+        :param data: Line field.
+
+        :return: Line index of the data values.
+        """
+        cached = cls._cache.get(data.uid)
+
+        if cached is None or cached.lines is not data.values:
+            cached = cls(data.values)
+            cls._cache[data.uid] = cached
+
+            if len(cls._cache) > cls._max_cache:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(data.uid)
+
+        return cached
+
+    def get(self, line_id) -> np.ndarray:
+        """
+        Indices of the vertices on a line.
+
+        :param line_id: Line identifier.
+
+        :return: Sorted vertices indices, empty if the line is not found.
+        """
+        ind = self._lookup.get(line_id)
+
+        if ind is None:
+            return self._indices[:0]
+
+        return self._indices[self._offsets[ind] : self._offsets[ind + 1]]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """
+        Sorted unique line ids.
+        """
+        return self._ids
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        Vertices indices sorted by line id.
+        """
+        return self._indices
+
+    @property
+    def lines(self) -> np.ndarray:
+        """
+        Line ids the index was built from.
+        """
+        return self._lines
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        Start of each line in :obj:`indices`, with the total count appended.
+        """
+        return self._offsets
+
+
 def slice_and_map(obj: np.ndarray, slicer: np.ndarray | Callable):
     """
     Slice an array and return both sliced array and global to local map.
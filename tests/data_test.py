@@ -8,6 +8,7 @@
 import os
 
 import numpy as np
+import pytest
 import SimPEG
 from discretize.utils import mesh_builder_xyz, refine_tree_xyz
 from geoh5py.objects import Points
@@ -149,6 +150,25 @@ def test_survey_data(tmp_path):
             workspace.get_entity("Iteration_99_bzz_Residual")[0].values == 0
         ), "Residual data should be zero."
 
+    # test background writes
+    driver.writer.submit(
+        driver.directive_list[-2].save_buffer,
+        [(98, survey_dobs)],
+        [(0, "0 1.0 2.0 3.0 now\n")],
+    )
+    driver.writer.close()
+
+    with workspace.open():
+        bxx_test = workspace.get_entity("Iteration_98_bxx")[0].values
+        log = workspace.get_entity("SimPEG.out")[0].values.decode()
+
+    np.testing.assert_array_equal(bxx_test, bxx_data.values)
+    assert log == "iteration beta phi_d phi_m time\n0 1.0 2.0 3.0 now\n"
+
+    driver.writer.submit(driver.directive_list[-2].save_buffer, [(97, [None])])
+    with pytest.raises(RuntimeError, match="Writing the inversion outputs failed"):
+        driver.writer.close()
+
 
 def test_save_data(tmp_path):
     ws, params = setup_params(tmp_path)
@@ -147,3 +147,66 @@ def test_vertices(tmp_path):
     radius_error = np.abs((surf_radius - sphere_radius) / sphere_radius)
 
     assert radius_error < 0.05
+
+
+def test_tiled_vertices(tmp_path):
+    """
+    Test iso_surface processed by bricks against the full grid.
+    """
+    ws = Workspace(tmp_path / "iso_test.geoh5")
+
+    length = 10
+    verts = np.random.randn(5000, 3) * length
+    values = np.linalg.norm(verts, axis=1)
+
+    points = Points.create(
+        ws,
+        name="test_points",
+        vertices=verts,
+    )
+
+    surfaces = IsoSurfacesDriver.iso_surface(
+        points, values, [5.0, 8.0], resolution=1.0, max_distance=np.inf
+    )
+    tiled_surfaces = IsoSurfacesDriver.iso_surface(
+        points, values, [5.0, 8.0], resolution=1.0, max_distance=np.inf, tile_size=7
+    )
+
+    for surface, tiled_surface in zip(surfaces, tiled_surfaces):
+        assert tiled_surface[0].shape == surface[0].shape
+        assert tiled_surface[1].shape == surface[1].shape
+        np.testing.assert_allclose(
+            np.sort(tiled_surface[0], axis=0), np.sort(surface[0], axis=0), atol=1e-4
+        )
+
+
+def test_get_bricks():
+    bricks = IsoSurfacesDriver.get_bricks([10, 5, 3], 4)
+
+    assert len(bricks) == 3 * 1 * 1
+    assert [brick[0] for brick in bricks] == [slice(0, 5), slice(4, 9), slice(8, 10)]
+    assert all(brick[1] == slice(0, 5) for brick in bricks)
+    assert all(brick[2] == slice(0, 3) for brick in bricks)
+
+
+def test_parallel_levels(tmp_path):
+    """
+    Test iso_surface with levels extracted by a process pool.
+    """
+    ws = Workspace(tmp_path / "iso_test.geoh5")
+
+    verts = np.random.randn(2000, 3) * 10
+    values = np.linalg.norm(verts, axis=1)
+    points = Points.create(ws, name="test_points", vertices=verts)
+    levels = [4.0, 6.0, 8.0]
+
+    surfaces = IsoSurfacesDriver.iso_surface(
+        points, values, levels, resolution=1.0, workers=1
+    )
+    parallel_surfaces = IsoSurfacesDriver.iso_surface(
+        points, values, levels, resolution=1.0, workers=2
+    )
+
+    for surface, parallel_surface in zip(surfaces, parallel_surfaces):
+        np.testing.assert_allclose(parallel_surface[0], surface[0])
+        np.testing.assert_array_equal(parallel_surface[1], surface[1])
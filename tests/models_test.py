@@ -6,6 +6,8 @@
 #  (see LICENSE file at the root of this source code package).
 
 
+import os
+
 import numpy as np
 from geoh5py.objects import Points
 from geoh5py.workspace import Workspace
@@ -122,6 +124,53 @@ def test_model_from_object(tmp_path):
     np.testing.assert_array_almost_equal(m, m0, decimal=1)
 
 
+def test_shared_neighbours(tmp_path):
+    ws, params = setup_params(tmp_path)
+    inversion_window = InversionWindow(ws, params)
+    inversion_data = InversionData(ws, params, inversion_window.window)
+    inversion_topography = InversionTopography(
+        ws, params, inversion_data, inversion_window.window
+    )
+    inversion_mesh = InversionMesh(ws, params, inversion_data, inversion_topography)
+    cc = inversion_mesh.mesh.cell_centers
+    vals = cc[:, 2].copy()
+    nan_vals = vals.copy()
+    nan_vals[cc[:, 2] > np.median(cc[:, 2])] = np.nan
+
+    point_object = Points.create(ws, name="test_point", vertices=cc)
+    lower, upper = point_object.add_data(
+        {"lower": {"values": vals - 1.0}, "upper": {"values": nan_vals}}
+    )
+    params.lower_bound = lower.uid
+    params.upper_bound = upper.uid
+    neighbours = {}
+    lower_bound = InversionModel(
+        ws, params, inversion_mesh, "lower_bound", neighbours=neighbours
+    )
+    assert len(neighbours) == 1
+    upper_bound = InversionModel(
+        ws, params, inversion_mesh, "upper_bound", neighbours=neighbours
+    )
+    assert len(neighbours) == 2
+
+    nc = inversion_mesh.n_cells
+    np.testing.assert_allclose(lower_bound.model[:nc], vals - 1.0)
+    assert not np.any(np.isnan(upper_bound.model))
+
+    cache = os.path.join(params.workpath, "SimPEG_NeighbourCache")
+    assert not os.path.exists(cache)
+
+    params.cache_neighbours = True
+    cached = InversionModel(ws, params, inversion_mesh, "upper_bound")
+    np.testing.assert_allclose(cached.model, upper_bound.model)
+    (file,) = [file for file in os.listdir(cache) if file.endswith("_neighbours.npy")]
+
+    # Later models read the map from disk rather than querying the tree again
+    np.save(os.path.join(cache, file), np.zeros(nc, dtype=int))
+    from_disk = InversionModel(ws, params, inversion_mesh, "upper_bound")
+    np.testing.assert_allclose(from_disk.model[:nc], nan_vals[~np.isnan(nan_vals)][0])
+
+
 def test_permute_2_octree(tmp_path):
 
     ws, params = setup_params(tmp_path)
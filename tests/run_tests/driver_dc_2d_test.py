@@ -12,6 +12,7 @@ from geoh5py.workspace import Workspace
 
 from geoapps.inversion.electricals.direct_current.two_dimensions.driver import (
     DirectCurrent2DDriver,
+    DirectCurrentPseudo3DDriver,
 )
 from geoapps.inversion.electricals.direct_current.two_dimensions.params import (
     DirectCurrent2DParams,
@@ -124,6 +125,46 @@ def test_dc_2d_run(tmp_path, max_iterations=1, pytest=True):
         return driver.inverse_problem.model
 
 
+def test_dc_pseudo_3d_run(tmp_path):
+    workpath = str(tmp_path / "../test_dc_2d_fwr_run0/inversion_test.geoh5")
+
+    with Workspace(workpath) as geoh5:
+        potential = geoh5.get_entity("Iteration_0_dc")[0]
+        topography = geoh5.get_entity("topography")[0]
+        _ = survey_lines(potential.parent, [-100, 100], save="line_IDs")
+
+        params = DirectCurrent2DParams(
+            geoh5=geoh5,
+            inversion_type="direct current pseudo 3d",
+            topography_object=topography.uid,
+            data_object=potential.parent.uid,
+            potential_channel=potential.uid,
+            potential_uncertainty=1e-3,
+            line_object=geoh5.get_entity("line_IDs")[0].uid,
+            starting_model=1e-2,
+            reference_model=1e-2,
+            potential_channel_bool=True,
+            z_from_topo=True,
+            max_global_iterations=1,
+            n_cpu=2,
+            out_group="Pseudo3D",
+        )
+        params.write_input_file(path=tmp_path, name="Inv_run")
+
+    driver = DirectCurrentPseudo3DDriver.start(
+        os.path.join(tmp_path, "Inv_run.ui.json")
+    )
+
+    with driver.params.geoh5.open(mode="r"):
+        group = driver.params.geoh5.get_entity(driver.params.ga_group.uid)[0]
+        assert sorted(child.name for child in group.children) == sorted(
+            f"Pseudo3D Line {line_id}" for line_id in driver.line_ids
+        )
+
+    # Line workspaces are removed once merged into the results
+    assert not os.path.exists(driver.workpath)
+
+
 if __name__ == "__main__":
     # Full run
     m_start = test_dc_2d_fwr_run(
@@ -5,11 +5,15 @@
 #  geoapps is distributed under the terms and conditions of the MIT License
 #  (see LICENSE file at the root of this source code package).
 
+import json
 import os
 
 import numpy as np
+from geoh5py.ui_json import InputFile
 from geoh5py.workspace import Workspace
+from pytest import raises
 
+from geoapps.inversion.components.factories import SimulationFactory
 from geoapps.inversion.potential_fields import GravityParams
 from geoapps.inversion.potential_fields.gravity.driver import GravityDriver
 from geoapps.shared_utils.utils import get_inversion_output
@@ -106,6 +110,12 @@ def test_gravity_run(
 
     driver = GravityDriver.start(os.path.join(tmp_path, "Inv_run.ui.json"))
 
+    with open(driver.profiler.path + ".json", encoding="utf8") as file:
+        phases = [record["phase"] for record in json.load(file)]
+    assert all(
+        phase in phases for phase in ["data", "mesh", "sensitivities", "iteration 1"]
+    )
+
     with Workspace(driver.params.geoh5.h5file) as run_ws:
         output = get_inversion_output(
             driver.params.geoh5.h5file, driver.params.ga_group.uid
@@ -132,6 +142,124 @@ def test_gravity_run(
             return driver.inverse_problem.model
 
 
+def test_gravity_run_compressed_sensitivities(tmp_path):
+    workpath = str(tmp_path / "../test_gravity_fwr_run0/inversion_test.geoh5")
+
+    with Workspace(workpath) as geoh5:
+        gz = geoh5.get_entity("Iteration_0_gz")[0]
+        orig_gz = gz.values.copy()
+        mesh = geoh5.get_entity("mesh")[0]
+        topography = geoh5.get_entity("topography")[0]
+
+        np.random.seed(0)
+        params = GravityParams(
+            geoh5=geoh5,
+            mesh=mesh.uid,
+            topography_object=topography.uid,
+            resolution=0.0,
+            data_object=gz.parent.uid,
+            starting_model=1e-4,
+            reference_model=0.0,
+            s_norm=0.0,
+            x_norm=0.0,
+            y_norm=0.0,
+            z_norm=0.0,
+            gradient_type="components",
+            gz_channel_bool=True,
+            z_from_topo=False,
+            gz_channel=gz.uid,
+            gz_uncertainty=2e-3,
+            lower_bound=0.0,
+            max_global_iterations=1,
+            initial_beta_ratio=1e-2,
+            prctile=100,
+            store_sensitivities="disk",
+            sensitivity_dtype="float32",
+            sensitivity_compressor="zstd",
+            save_buffer_iterations=5,
+        )
+        params.write_input_file(path=tmp_path, name="Inv_run")
+
+    driver = GravityDriver.start(os.path.join(tmp_path, "Inv_run.ui.json"))
+    stores = driver.inversion_data.sensitivity_stores(driver.inverse_problem)
+    assert stores and all(
+        os.path.exists(os.path.join(store, name))
+        for store in stores
+        for name in ["J.zarr", "complete", "key"]
+    )
+
+    # Buffered iterations are written at the end of the inversion
+    with Workspace(driver.params.geoh5.h5file) as run_ws:
+        assert run_ws.get_entity("Iteration_1_model")[0] is not None
+        assert run_ws.get_entity("Iteration_1_gz")[0] is not None
+
+    output = get_inversion_output(
+        driver.params.geoh5.h5file, driver.params.ga_group.uid
+    )
+    output["data"] = orig_gz
+    # Single precision sensitivities should not move the final misfit
+    check_target(output, target_run, tolerance=0.1)
+
+    # Stores of a tile are evicted when its geometry changes
+    SimulationFactory._stamp_sensitivity_path(  # pylint: disable=protected-access
+        stores[0], "other geometry"
+    )
+    assert not os.path.exists(os.path.join(stores[0], "J.zarr"))
+
+
+def test_gravity_run_failed_iteration(tmp_path):
+    workpath = str(tmp_path / "../test_gravity_fwr_run0/inversion_test.geoh5")
+
+    with Workspace(workpath) as geoh5:
+        gz = geoh5.get_entity("Iteration_0_gz")[0]
+        mesh = geoh5.get_entity("mesh")[0]
+        topography = geoh5.get_entity("topography")[0]
+
+        np.random.seed(0)
+        params = GravityParams(
+            geoh5=geoh5,
+            mesh=mesh.uid,
+            topography_object=topography.uid,
+            resolution=0.0,
+            data_object=gz.parent.uid,
+            starting_model=1e-4,
+            reference_model=0.0,
+            gz_channel_bool=True,
+            z_from_topo=False,
+            gz_channel=gz.uid,
+            gz_uncertainty=2e-3,
+            lower_bound=0.0,
+            max_global_iterations=3,
+            initial_beta_ratio=1e-2,
+            prctile=100,
+            store_sensitivities="ram",
+            save_buffer_iterations=5,
+        )
+        params.write_input_file(path=tmp_path, name="Inv_run")
+
+    ifile = InputFile.read_ui_json(os.path.join(tmp_path, "Inv_run.ui.json"))
+    driver = GravityDriver(GravityParams(ifile))
+    callback = driver.optimization.callback
+
+    def failing_callback(xt):
+        if driver.optimization.iter > 1:
+            raise RuntimeError("Iteration failed")
+        callback(xt)
+
+    driver.optimization.callback = failing_callback
+
+    with driver.params.geoh5.open(mode="r+"):
+        with raises(RuntimeError, match="Iteration failed"):
+            driver.run()
+
+    # The iterations completed before the failure are still written
+    assert os.path.exists(driver.profiler.path + ".json")
+    with Workspace(driver.params.geoh5.h5file) as run_ws:
+        assert run_ws.get_entity("Iteration_1_model")[0] is not None
+        assert run_ws.get_entity("Iteration_1_gz")[0] is not None
+        assert run_ws.get_entity("Iteration_2_model")[0] is None
+
+
 if __name__ == "__main__":
     # Full run
     m_start = test_gravity_fwr_run(
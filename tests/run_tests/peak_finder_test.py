@@ -10,10 +10,13 @@ from pathlib import Path
 import numpy as np
 from geoh5py.objects import Curve
 from geoh5py.shared.utils import compare_entities
+from geoh5py.ui_json import InputFile
 from geoh5py.workspace import Workspace
 from ipywidgets import Widget
 
 from geoapps.peak_finder.application import PeakFinder, PeakFinderDriver
+from geoapps.peak_finder.params import PeakFinderParams
+from geoapps.peak_finder.utils import find_anomalies
 
 # pytest.skip("eliminating conflicting test.", allow_module_level=True)
 
@@ -93,3 +96,110 @@ def test_peak_finder_driver(tmp_path):
     with driver.params.geoh5.open(mode="r"):
         results = driver.params.geoh5.get_entity("PointMarkers")
         compare_entities(results[0], results[1], ignore=["_uid"])
+
+
+def test_peak_finder_processes(tmp_path):
+
+    uijson_path = Path(tmp_path) / r"../test_peak_finder_app0/Temp"
+    for file in os.listdir(uijson_path):
+        if file.endswith(".json"):
+            json_file = file
+
+    ifile = InputFile.read_ui_json(os.path.join(uijson_path, json_file))
+    ifile.data["parallel_backend"] = "processes"
+    ifile.data["n_cpu"] = 2
+    params = PeakFinderParams(input_file=ifile)
+    driver = PeakFinderDriver(params)
+
+    with params.geoh5.open(mode="r+"):
+        markers = params.geoh5.get_entity("PointMarkers")
+        driver.run()
+        results = params.geoh5.get_entity("PointMarkers")
+
+        assert len(results) == len(markers) + 1
+        compare_entities(results[0], results[-1], ignore=["_uid", "_parent"])
+
+
+def test_find_anomalies_baseline():
+    """
+    Compare the anomalies found on a fixed-seed synthetic line against the
+    values returned by the original loop-based implementation.
+    """
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 5000, 800)
+    locations = np.c_[x, 0.2 * x + 10 * np.sin(x / 500), np.zeros_like(x)]
+    centers = rng.uniform(300, 4700, 6)
+    widths = rng.uniform(60, 200, 6)
+    amplitudes = rng.uniform(1, 5, 6)
+    channels = {}
+    for ind in range(12):
+        decay = np.exp(-ind / 4)
+        values = sum(
+            amp
+            * decay
+            * np.exp(-(((x - (cen + ind * 3.0)) / (wid * (1 + ind / 10))) ** 2))
+            for cen, wid, amp in zip(centers, widths, amplitudes)
+        )
+        values += rng.normal(0, 0.01 * decay, x.size) + 0.05
+        channels[f"ch{ind:02d}"] = {"values": values, "time": np.r_[0.1 * (ind + 1)]}
+
+    uids = list(channels)
+    channel_groups = {
+        "early": {"properties": uids[:4]},
+        "middle": {"properties": uids[4:8]},
+        "late": {"properties": uids[8:]},
+        "early + middle": {"properties": uids[:8]},
+        "early + middle + late": {"properties": uids},
+        "middle + late": {"properties": uids[4:]},
+    }
+    groups = find_anomalies(
+        locations,
+        np.arange(x.size),
+        channels,
+        channel_groups,
+        min_amplitude=10,
+        min_width=100,
+        max_migration=60,
+        min_channels=3,
+    )
+
+    expected = [
+        {
+            "channels": list(range(12)),
+            "peak": [74, 74, 75, 75, 76, 76, 77, 77, 78, 79, 78, 80],
+            "start": [0] * 12,
+            "end": [129, 135, 137, 140, 146, 153, 157, 160, 163, 166, 168, 173],
+            "floats": [9116.823011, 38.330492, 78.022608],
+        },
+        {
+            "channels": list(range(12)),
+            "peak": [495, 496, 496, 496, 497, 497, 499, 498, 499, 500, 500, 501],
+            "start": [442, 434, 433, 431, 426, 417, 422, 412, 416, 404, 402, 402],
+            "end": [551, 553, 555, 554, 554, 554, 557, 556, 557, 558, 558, 559],
+            "floats": [6985.076955, 38.330492, 77.597559],
+        },
+        {
+            "channels": [0, 1, 2, 3, 4, 5, 6, 7, 8, 10],
+            "peak": [619, 620, 620, 620, 621, 623, 622, 623, 623, 624],
+            "start": [555, 557, 555, 554, 554, 554, 557, 556, 557, 558],
+            "end": [670, 669, 670, 670, 669, 670, 670, 669, 669, 667],
+            "floats": [7396.869584, 31.942076, 78.570552],
+        },
+        {
+            "channels": list(range(12)),
+            "peak": [689, 690, 690, 690, 691, 691, 691, 691, 691, 691, 692, 691],
+            "start": [670, 669, 670, 670, 669, 670, 670, 669, 669, 668, 667, 667],
+            "end": [720, 717, 719, 726, 727, 727, 729, 733, 734, 745, 739, 754],
+            "floats": [2451.637755, 19.165246, 79.457953],
+        },
+    ]
+
+    assert len(groups) == len(expected)
+    for group, values in zip(groups, expected):
+        for key in ["channels", "peak", "start", "end"]:
+            np.testing.assert_array_equal(group[key], values[key])
+        np.testing.assert_allclose(
+            [group["amplitude"], group["migration"], group["azimuth"]],
+            values["floats"],
+            rtol=1e-6,
+        )
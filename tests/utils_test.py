@@ -18,12 +18,30 @@ import geoh5py.objects
 import numpy as np
 import pytest
 from discretize import TreeMesh
-from geoh5py.objects import Grid2D
+from geoh5py.objects import Curve, Grid2D
 from geoh5py.objects.surveys.direct_current import CurrentElectrode, PotentialElectrode
 from geoh5py.workspace import Workspace
-
-from geoapps.driver_base.utils import running_mean, treemesh_2_octree
-from geoapps.inversion.utils import calculate_2D_trend
+from scipy.spatial import cKDTree
+from SimPEG import maps
+from SimPEG.utils.drivers import create_nested_mesh
+
+from geoapps.driver_base.utils import (
+    TopographySurface,
+    active_from_xyz,
+    cell_size_z,
+    octree_columns,
+    running_mean,
+    treemesh_2_octree,
+)
+from geoapps.inversion.utils import (
+    StoredTileMap,
+    balanced_tiles,
+    calculate_2D_trend,
+    hash_arrays,
+    load_tile_mapping,
+    save_tile_mapping,
+)
+from geoapps.peak_finder.utils import LineDataDerivatives
 from geoapps.shared_utils.utils import (
     cell_centers_to_faces,
     downsample_grid,
@@ -33,6 +51,7 @@ from geoapps.shared_utils.utils import (
     get_locations,
     octree_2_treemesh,
     rotate_xyz,
+    tree_query,
     weighted_average,
     window_xy,
 )
@@ -44,9 +63,11 @@ from geoapps.utils.models import (
     floating_active,
     get_drape_model,
 )
+from geoapps.utils.plotting import FilterCache
 from geoapps.utils.statistics import is_outlier
 from geoapps.utils.string import string_to_numeric
 from geoapps.utils.surveys import (
+    LineIndex,
     compute_alongline_distance,
     extract_dcip_survey,
     find_endpoints,
@@ -117,6 +138,37 @@ def test_get_drape_model(tmp_path):
     assert np.allclose(model_centers, resorted_mesh_centers)
 
 
+def test_drape_active_from_surface(tmp_path):
+    ws = Workspace(os.path.join(tmp_path, "test.geoh5"))
+    x = np.linspace(0, 100, 11)
+    locs = np.c_[x, np.zeros_like(x), np.zeros_like(x)]
+    model, mesh, sorting = get_drape_model(  # pylint: disable=W0632
+        ws,
+        "drape_test",
+        locs,
+        [5.0, 5.0],
+        50.0,
+        [20.0] * 4,
+        1.1,
+        return_colocated_mesh=True,
+        return_sorting=True,
+    )
+    assert np.allclose(cell_size_z(model), mesh.h_gridded[sorting, 1])
+
+    topo = np.c_[
+        np.random.randn(100) * 50.0 + 50.0,
+        np.random.randn(100) * 10.0,
+        np.random.randn(100) * 5.0 - 20.0,
+    ]
+    surface = TopographySurface(topo, chunk_size=10)
+    active = active_from_xyz(model, topo, grid_reference="bottom")
+    assert np.all(active == active_from_xyz(model, surface, grid_reference="bottom"))
+    ws.close()
+
+    with pytest.raises(ValueError, match="Method must be"):
+        TopographySurface(topo, method="cubic")
+
+
 def test_find_unique_tops_xz():
     x = np.linspace(0, 1, 5)
     z = np.linspace(-1, 1, 4)
@@ -245,6 +297,35 @@ def test_survey_lines(tmp_path):
     )
 
 
+def test_line_index(tmp_path):
+    workspace = Workspace(tmp_path / r"test_line_index.geoh5")
+    lines = np.random.randint(1, 6, 100)
+    curve = Curve.create(workspace, vertices=np.random.randn(100, 3))
+    line_field = curve.add_data(
+        {
+            "line_id": {
+                "values": lines,
+                "value_map": {ind: str(ind) for ind in range(1, 6)},
+                "type": "referenced",
+            }
+        }
+    )
+    line_index = LineIndex.from_data(line_field)
+
+    assert LineIndex.from_data(line_field) is line_index
+    np.testing.assert_array_equal(line_index.ids, np.unique(lines))
+
+    for line_id in line_index.ids:
+        np.testing.assert_array_equal(
+            line_index.get(line_id), np.where(lines == line_id)[0]
+        )
+
+    assert len(line_index.get(99)) == 0
+
+    line_field.values = np.ones(100, dtype=int)
+    assert LineIndex.from_data(line_field) is not line_index
+
+
 def test_extract_dcip_survey(tmp_path):
     name = "TestCurrents"
     n_data = 12
@@ -619,6 +700,24 @@ def test_running_mean():
         np.linalg.norm((mean_test[1:] + mean_test[:-1]) / 2 - mean_cent[1:-1]) < 1e-12
     ), "Centered averaging does not match expected values."
 
+    vecs = np.random.randn(3, 100)
+    np.testing.assert_array_equal(
+        running_mean(vecs, width=4)[1], running_mean(vecs[1], width=4)
+    )
+
+
+def test_line_data_derivatives():
+    locations = np.c_[np.sort(np.random.rand(200)) * 1000.0, np.zeros((200, 2))]
+    values = np.random.randn(4, 200)
+    profile = LineDataDerivatives(locations=locations, smoothing=3)
+    profile.values = values
+    batch = profile.values_resampled, profile.derivative(order=2)
+
+    for row, channel in enumerate(values):
+        profile.values = channel
+        np.testing.assert_array_equal(batch[0][row], profile.values_resampled)
+        np.testing.assert_array_equal(batch[1][row], profile.derivative(order=2))
+
 
 def test_weigted_average():
 
@@ -694,6 +793,35 @@ def test_weigted_average():
     out = weighted_average(xyz_in, xyz_out, values, threshold=1e30)
     assert out[0] == 2
 
+    # channels with different nan patterns and chunked outputs
+    xyz_in = np.random.rand(50, 3)
+    xyz_out = np.random.rand(30, 3)
+    values = [np.random.rand(50) for _ in range(3)]
+    values[1][::3] = np.nan
+    out = weighted_average(xyz_in, xyz_out, values, chunk_size=7)
+    for value, result in zip(values, out):
+        sub = ~np.isnan(value)
+        expected = weighted_average(xyz_in[sub], xyz_out, [value[sub]])[0]
+        np.testing.assert_allclose(result, expected)
+
+
+def test_tree_query():
+    xyz_in = np.random.rand(100, 3)
+    xyz_out = np.random.rand(55, 3)
+    tree = cKDTree(xyz_in)
+
+    rad, ind = tree_query(tree, xyz_out, chunk_size=10)
+    rad_test, ind_test = tree.query(xyz_out)
+    assert rad.shape == (55,)
+    np.testing.assert_allclose(rad, rad_test)
+    assert np.all(ind == ind_test)
+
+    rad, ind = tree_query(tree, xyz_out, n=4, chunk_size=10)
+    rad_test, ind_test = tree.query(xyz_out, 4)
+    assert rad.shape == (55, 4)
+    np.testing.assert_allclose(rad, rad_test)
+    assert np.all(ind == ind_test)
+
 
 def test_treemesh_2_octree(tmp_path):
 
@@ -771,6 +899,83 @@ def test_octree_2_treemesh(tmp_path):
             assert np.all((tmesh.cell_centers - mesh.cell_centers) < 1e-14)
 
 
+def test_octree_active_columns(tmp_path):
+    geotest = Geoh5Tester(geoh5, tmp_path, "test.geoh5")
+    with geotest.make() as workspace:
+        mesh = TreeMesh([[10] * 16, [10] * 16, [10] * 16], [0, 0, -160])
+        mesh.insert_cells([[55, 55, -25], [105, 95, -65]], mesh.max_level)
+        mesh.finalize()
+        omesh = treemesh_2_octree(workspace, mesh)
+
+        columns = octree_columns(omesh)
+        assert len(np.unique(columns)) == len(np.unique(omesh.centroids[:, :2], axis=0))
+
+        topo = np.c_[
+            np.random.rand(200, 2) * 200.0 - 20.0, np.random.randn(200) * 10.0 - 50.0
+        ]
+        locations = omesh.centroids.copy()
+        locations[:, 2] -= omesh.octree_cells["NCells"] * np.abs(omesh.w_cell_size) / 2
+        expected = locations[:, 2] < TopographySurface(topo).elevation(locations)
+        active = active_from_xyz(omesh, topo, grid_reference="bottom")
+
+        np.testing.assert_array_equal(active, expected)
+
+
+def test_tile_mapping_cache(tmp_path):
+    mesh = TreeMesh([[10] * 16, [10] * 16, [10] * 16], [0, 0, 0])
+    mesh.insert_cells([[55, 55, 75], [105, 105, 75]], mesh.max_level, finalize=True)
+    active_cells = mesh.cell_centers[:, 2] < 80
+    locations = np.c_[[55.0, 65.0], [55.0, 65.0], [85.0, 85.0]]
+    nested_mesh = create_nested_mesh(locations, mesh, minimum_level=3)
+    mapping = maps.TileMap(mesh, active_cells, nested_mesh, enforce_active=True)
+
+    key = hash_arrays(mesh.cell_centers, active_cells, locations).hexdigest()
+    assert key == hash_arrays(mesh.cell_centers, active_cells, locations).hexdigest()
+    assert key != hash_arrays(mesh.cell_centers, ~active_cells, locations).hexdigest()
+
+    path = str(tmp_path / "cache" / key)
+    assert load_tile_mapping(path, mesh, active_cells) is None
+
+    save_tile_mapping(path, nested_mesh, mapping)
+    cached_mesh, cached_map = load_tile_mapping(
+        path, mesh, active_cells, enforce_active=True
+    )
+
+    np.testing.assert_array_equal(cached_mesh.cell_centers, nested_mesh.cell_centers)
+    np.testing.assert_array_equal(cached_map.local_active, mapping.local_active)
+    assert isinstance(cached_map, StoredTileMap)
+    assert (cached_map.projection != mapping.projection).nnz == 0
+    assert cached_map.shape == mapping.shape
+
+    model = np.random.randn(int(active_cells.sum()))
+    np.testing.assert_allclose(cached_map * model, mapping * model)
+
+
+def test_balanced_tiles():
+    mesh = TreeMesh([[10] * 32, [10] * 32, [10] * 16], [0, 0, 0])
+    mesh.refine(mesh.max_level, finalize=True)
+    active_cells = mesh.cell_centers[:, 2] < 80
+    np.random.seed(0)
+    locations = np.r_[
+        np.random.randn(400, 2) * 10.0 + 60.0,
+        np.random.rand(40, 2) * 320.0,
+    ]
+    locations = np.c_[locations, np.ones(locations.shape[0]) * 85.0]
+
+    tiles, costs = balanced_tiles(locations, mesh, active_cells, 4)
+    assert len(tiles) == 4
+    np.testing.assert_array_equal(
+        np.sort(np.hstack(tiles)), np.arange(locations.shape[0])
+    )
+    assert np.all(costs <= len(locations) * active_cells.sum())
+
+    tiles, capped = balanced_tiles(
+        locations, mesh, active_cells, 4, max_cost=costs.max() / 2
+    )
+    assert len(tiles) > 4
+    assert np.all((capped <= costs.max() / 2) | [len(tile) == 1 for tile in tiles])
+
+
 def test_window_xy():
     x, y = np.meshgrid(np.arange(11), np.arange(11))
     x = x.ravel()
@@ -806,6 +1011,20 @@ def test_downsample_xy():
     assert np.all(x[::2] == x_down)
     assert np.all(y[::2] == y_down)
 
+    _, x_down, y_down = downsample_xy(x, y, 0, method="grid")
+    assert np.all(x == x_down)
+    assert np.all(y == y_down)
+
+    _, x_down, y_down = downsample_xy(x, y, 2, method="grid")
+    np.testing.assert_allclose(np.diff(x_down.reshape(6, 6), axis=1), 2)
+    np.testing.assert_allclose(np.diff(y_down.reshape(6, 6), axis=0), 2)
+
+    mask, _, _ = downsample_xy(x, y, 2, mask=x < 5, method="grid")
+    assert np.all(x[mask] < 5)
+
+    with pytest.raises(ValueError, match="Unrecognized downsampling method"):
+        downsample_xy(x, y, 2, method="abc")
+
 
 def test_downsample_grid():
 
@@ -892,6 +1111,33 @@ def test_filter_xy():
     assert np.all(combo_mask_test == combo_mask)
 
 
+def test_filter_cache(tmp_path):
+    x_grid, y_grid = np.meshgrid(np.arange(11.0), np.arange(11.0))
+    workspace = Workspace(os.path.join(tmp_path, "test.geoh5"))
+    points = geoh5py.objects.Points.create(
+        workspace, vertices=np.c_[x_grid.ravel(), y_grid.ravel(), np.zeros(121)]
+    )
+    x, y = points.vertices[:, 0], points.vertices[:, 1]
+    window = {"center": [5, 5], "size": [9, 5], "azimuth": 30}
+    cache = FilterCache()
+
+    for center in [[5, 5], [3, 6]]:
+        window["center"] = center
+        mask = cache.filter_xy(points, x, y, 2, window=window)
+        expected = filter_xy(x, y, 2, window=dict(window, center=list(center)))
+        assert np.all(mask == expected)
+        assert cache.filter_xy(points, x, y, 2, window=window) is mask
+
+    nbytes = cache.nbytes
+    assert nbytes > 0
+    cache.clear()
+    assert cache.nbytes == 0
+
+    small_cache = FilterCache(max_bytes=200)
+    small_cache.filter_xy(points, x, y, 2, window=window)
+    assert small_cache.nbytes <= 200
+
+
 def test_detrend_xy():
     x_grid, y_grid = np.meshgrid(np.arange(64), np.arange(64))
     xy = np.c_[x_grid.flatten(), y_grid.flatten()]